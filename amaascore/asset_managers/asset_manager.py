@@ -5,9 +5,11 @@ from dateutil.parser import parse
 
 from amaascore.asset_managers.enums import ACCOUNT_TYPES, ASSET_MANAGER_TYPES
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.registry import register
 from amaascore.error_messages import ERROR_LOOKUP
 
 
+@register('asset_manager')
 class AssetManager(AMaaSModel):
 
     def __init__(self, asset_manager_type, asset_manager_id=None, asset_manager_status='Active', party_id=None,
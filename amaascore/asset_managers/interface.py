@@ -13,10 +13,11 @@ class AssetManagersInterface(Interface):
     The interface to the Asset Managers service for reading Asset Manager information.
     """
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(AssetManagersInterface, self).__init__(endpoint=endpoint, endpoint_type='asset_managers',
-                                                     environment=environment, username=username, password=password)
+                                                     environment=environment,
+                                                     username=username, password=password, **kwargs)
 
     def new(self, asset_manager):
         self.logger.info('New Asset Manager: %s', asset_manager.asset_manager_id)
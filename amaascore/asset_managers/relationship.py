@@ -2,8 +2,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.asset_managers.enums import RELATIONSHIP_TYPES
+from amaascore.core.registry import register
 
 
+@register('asset_manager')
 class Relationship(AMaaSModel):
 
     def __init__(self, asset_manager_id, related_id, relationship_id,  relationship_type, client_id,
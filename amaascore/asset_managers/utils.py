@@ -3,16 +3,20 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from amaascore.asset_managers.asset_manager import AssetManager
 from amaascore.asset_managers.domain import Domain
 from amaascore.asset_managers.relationship import Relationship
+from amaascore.core.instrumentation import instrument_decoder
 
+@instrument_decoder
 def json_to_asset_manager(json_asset_manager):
     asset_manager = AssetManager(**json_asset_manager)
     return asset_manager
 
 
+@instrument_decoder
 def json_to_relationship(json_relationship):
     relationship = Relationship(**json_relationship)
     return relationship
 
+@instrument_decoder
 def json_to_domain(json_domain):
     domain = Domain(**json_domain)
     return domain
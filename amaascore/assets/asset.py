@@ -1,7 +1,6 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 import re
 import sys
 import uuid
@@ -10,7 +9,9 @@ import pickle
 from amaascore.assets.children import Link
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.core.comment import Comment
+from amaascore.core.dates import parse_date
 from amaascore.core.reference import Reference
+from amaascore.core.registry import register
 from amaasutils.hash import compute_hash
 
 
@@ -18,6 +19,7 @@ from amaasutils.hash import compute_hash
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('asset')
 class Asset(AMaaSModel):
 
     @staticmethod
@@ -77,7 +79,7 @@ class Asset(AMaaSModel):
         :param value:
         :return:
         """
-        self._issue_date = parse(value).date() if isinstance(value, type_check) else value
+        self._issue_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def maturity_date(self):
@@ -91,7 +93,7 @@ class Asset(AMaaSModel):
         :param value:
         :return:
         """
-        self._maturity_date = parse(value).date() if isinstance(value, type_check) else value
+        self._maturity_date = parse_date(value) if isinstance(value, type_check) else value
 
     def __str__(self):
         return "Asset object - ID: %s" % self.asset_id
@@ -3,8 +3,10 @@ from dateutil.parser import parse
 
 from amaascore.assets.real_asset import RealAsset
 from amaascore.assets.enums import *
+from amaascore.core.registry import register
 
 
+@register('asset')
 class Automobile(RealAsset):
 
     def __init__(self, asset_manager_id, asset_id, client_id, asset_issuer_id=None,
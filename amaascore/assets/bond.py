@@ -1,11 +1,12 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.assets.asset import Asset
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -67,10 +68,11 @@ class BondBase(Asset):
     @maturity_date.setter
     def maturity_date(self, maturity_date):
         if maturity_date:
-            self._maturity_date = parse(maturity_date).date() if isinstance(maturity_date, type_check) \
+            self._maturity_date = parse_date(maturity_date) if isinstance(maturity_date, type_check) \
                 else maturity_date
 
 
+@register('asset')
 class BondGovernment(BondBase):
 
     def __init__(self, asset_manager_id, asset_id, coupon, par, pay_frequency, defaulted=False, asset_issuer_id=None,
@@ -86,6 +88,7 @@ class BondGovernment(BondBase):
                                              defaulted=defaulted, *args, **kwargs)
 
 
+@register('asset')
 class BondCorporate(BondBase):
 
     def __init__(self, asset_manager_id, asset_id, coupon, par, pay_frequency, defaulted=False, asset_issuer_id=None,
@@ -101,6 +104,7 @@ class BondCorporate(BondBase):
                                             defaulted=defaulted, *args, **kwargs)
 
 
+@register('asset')
 class BondMortgage(BondBase):
 
     def __init__(self, asset_manager_id, asset_id, coupon, par, pay_frequency, defaulted=False, asset_issuer_id=None,
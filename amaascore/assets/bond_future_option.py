@@ -4,8 +4,10 @@ from datetime import date
 from decimal import Decimal
 
 from amaascore.assets.future_option import FutureOption
+from amaascore.core.registry import register
 
 
+@register('asset')
 class BondFutureOption(FutureOption):
 
     def __init__(self, asset_manager_id, asset_id, option_type, option_style, strike, underlying_asset_id,
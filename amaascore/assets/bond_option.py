@@ -1,16 +1,18 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date, datetime
-from dateutil.parser import parse
 import sys
 
 from amaascore.assets.derivative import Derivative
 from amaascore.assets.option_mixin import OptionMixin
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('asset')
 class BondOption(Derivative, OptionMixin):
 
     def __init__(self, asset_manager_id, option_type, strike, underlying_asset_id, option_style, asset_id=None,
@@ -42,4 +44,4 @@ class BondOption(Derivative, OptionMixin):
         :return:
         """
         if value:
-            self._expiry_date = parse(value).date() if isinstance(value, type_check) else value
+            self._expiry_date = parse_date(value) if isinstance(value, type_check) else value
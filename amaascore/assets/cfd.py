@@ -4,8 +4,10 @@ from datetime import datetime, date
 from dateutil import parser
 
 from amaascore.assets.derivative import Derivative
+from amaascore.core.registry import register
 
 
+@register('asset')
 class ContractForDifference(Derivative):
 
     def __init__(self, asset_manager_id, asset_id, asset_issuer_id=None, asset_status='Active', display_name='',
@@ -2,8 +2,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from amaascore.assets.currency import CurrencyBase
 from amaascore.assets.enums import CRYPTOCURRENCY_PROOF_TYPES
+from amaascore.core.registry import register
 
 
+@register('asset')
 class Cryptocurrency(CurrencyBase):
 
     def __init__(self, asset_id, asset_manager_id=0, asset_status='Active', proof_type='Proof of Work',
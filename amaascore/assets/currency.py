@@ -1,6 +1,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
 class CurrencyBase(Asset):
@@ -20,6 +21,7 @@ class CurrencyBase(Asset):
                                            *args, **kwargs)
 
 
+@register('asset')
 class Currency(CurrencyBase):
 
     def __init__(self, asset_id, asset_manager_id=0, deliverable=True, asset_status='Active', major=False,
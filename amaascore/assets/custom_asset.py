@@ -2,8 +2,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class CustomAsset(Asset):
 
     def __init__(self, asset_manager_id, asset_id, client_additional, maturity_date=None, asset_issuer_id=None,
@@ -4,8 +4,10 @@ from datetime import date
 from decimal import Decimal
 
 from amaascore.assets.future import Future
+from amaascore.core.registry import register
 
 
+@register('asset')
 class EnergyFuture(Future):
 
     def __init__(self, asset_manager_id, asset_id, settlement_type, contract_size, point_value, tick_size,
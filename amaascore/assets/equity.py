@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class Equity(Asset):
 
 
@@ -4,8 +4,10 @@ from datetime import datetime, date
 from dateutil import parser
 
 from amaascore.assets.fund import Fund
+from amaascore.core.registry import register
 
 
+@register('asset')
 class ExchangeTradedFund(Fund):
 
     @staticmethod
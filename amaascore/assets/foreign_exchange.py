@@ -1,9 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import sys
 
 from amaascore.assets.asset import Asset
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -46,6 +47,7 @@ class ForeignExchangeBase(Asset):
         """
         self._country_codes = country_codes
 
+@register('asset')
 class ForeignExchange(ForeignExchangeBase):
     """
     The underlying FX pair used in an FX spot/forward asset
@@ -75,6 +77,7 @@ class ForeignExchange(ForeignExchangeBase):
             self._major = False
 
 
+@register('asset')
 class ForeignExchangeSpot(ForeignExchangeBase):
     """
     Spot FX (Settles as soon as possible).
@@ -96,7 +99,7 @@ class ForeignExchangeSpot(ForeignExchangeBase):
 
     @settlement_date.setter
     def settlement_date(self, settlement_date):
-        self._settlement_date = parse(settlement_date).date() if isinstance(settlement_date, type_check) \
+        self._settlement_date = parse_date(settlement_date) if isinstance(settlement_date, type_check) \
             else settlement_date
 
     def base_currency(self):
@@ -106,6 +109,7 @@ class ForeignExchangeSpot(ForeignExchangeBase):
         return self.underlying[3:6] if self.underlying else None
 
 
+@register('asset')
 class ForeignExchangeForward(ForeignExchangeSpot):
     """
     A forward-dated FX.  If there is a fixing_date, it is an NDF.
@@ -128,6 +132,6 @@ class ForeignExchangeForward(ForeignExchangeSpot):
 
     @fixing_date.setter
     def fixing_date(self, fixing_date):
-        self._fixing_date = parse(fixing_date).date() if isinstance(fixing_date, type_check) \
+        self._fixing_date = parse_date(fixing_date) if isinstance(fixing_date, type_check) \
             else fixing_date
         
\ No newline at end of file
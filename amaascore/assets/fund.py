@@ -1,16 +1,18 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import datetime, date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
 from amaascore.assets.asset import Asset
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('asset')
 class Fund(Asset):
 
     def __init__(self, asset_manager_id, asset_id, fund_type, nav=None, expense_ratio=None, net_assets=None,
@@ -45,7 +47,7 @@ class Fund(Asset):
         :return:
         """
         if value:
-            self._creation_date = parse(value).date() if isinstance(value, type_check) else value
+            self._creation_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def nav(self):
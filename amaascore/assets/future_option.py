@@ -4,8 +4,10 @@ from decimal import Decimal
 
 from amaascore.assets.future import Future
 from amaascore.assets.option_mixin import OptionMixin
+from amaascore.core.registry import register
 
 
+@register('asset')
 class FutureOption(Future, OptionMixin):
 
     def __init__(self, asset_manager_id, asset_id, option_type, option_style, strike, underlying_asset_id,
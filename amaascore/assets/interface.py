@@ -5,16 +5,16 @@ import logging
 
 from amaascore.assets.utils import json_to_asset
 from amaascore.config import ENVIRONMENT
-from amaascore.core.interface import Interface
+from amaascore.core.interface import Interface, json_stream, retrieve_many
 from amaascore.core.amaas_model import json_handler
 
 
 class AssetsInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, endpoint=None, logger=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, endpoint=None, logger=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(AssetsInterface, self).__init__(endpoint=endpoint, endpoint_type='assets',
-                                              environment=environment, username=username, password=password)
+                                              environment=environment, username=username, password=password, **kwargs)
 
     def new(self, asset):
         self.logger.info('New Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id, asset.asset_id)
@@ -29,16 +29,32 @@ class AssetsInterface(Interface):
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def create_many(self, assets):
+    def create_many(self, assets, stream=False, upsert=False):
+        """
+
+        :param assets: A non-empty list of assets, all belonging to the same asset manager.
+        :param stream: If True, each asset is encoded as the request body is sent, rather than encoding the whole
+        list up front.
+        :param upsert: If True, assets which already exist are updated rather than rejected, so that resending the same
+        assets is safe.
+        :return:
+        """
         if not assets or not isinstance(assets, list):
             raise ValueError('Invalid argument. Argument must be a non-empty list.')
 
         self.logger.info('New Assets - Asset Manager: %s', assets[0].asset_manager_id)
         url = '%s/assets/%s' % (self.endpoint, assets[0].asset_manager_id)
-        json_body = [asset.to_interface() for asset in assets]
-        response = self.session.post(url, json=json_body)
+        params = {'upsert': True} if upsert else None
+        if stream:
+            response = self.session.post(url, data=json_stream(assets), headers=self.json_header, params=params)
+        else:
+            json_body = [asset.to_interface() for asset in assets]
+            response = self.session.post(url, json=json_body, params=params)
         if response.ok:
             self.logger.info('Successfully Created Assets - Asset Manager: %s', assets[0].asset_manager_id)
+            if upsert:
+                for asset in assets:
+                    self.cache_invalidate(asset.asset_manager_id, asset.asset_id)
             assets = [asset for asset in response.json()]
             return assets
         else:
@@ -50,6 +66,7 @@ class AssetsInterface(Interface):
         self.logger.info('Upsert Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id, asset.asset_id)
         url = '%s/assets/%s' % (self.endpoint, asset.asset_manager_id)
         response = self.session.post(url, json=asset.to_interface(), params={'upsert': True})
+        self.cache_invalidate(asset.asset_manager_id, asset.asset_id)
         if response.ok:
             self.logger.info('Successfully Upserted Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id,
                              asset.asset_id)
@@ -64,6 +81,7 @@ class AssetsInterface(Interface):
         self.logger.info('Amend Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id, asset.asset_id)
         url = '%s/assets/%s/%s' % (self.endpoint, asset.asset_manager_id, asset.asset_id)
         response = self.session.put(url, json=asset.to_interface())
+        self.cache_invalidate(asset.asset_manager_id, asset.asset_id)
         if response.ok:
             self.logger.info('Successfully Amended Asset - Asset Manager: %s - Asset ID: %s', asset.asset_manager_id,
                              asset.asset_id)
@@ -79,6 +97,7 @@ class AssetsInterface(Interface):
         url = '%s/assets/%s/%s' % (self.endpoint, asset_manager_id, asset_id)
         # Setting handler ourselves so we can be sure Decimals work
         response = self.session.patch(url, data=json.dumps(updates, default=json_handler), headers=self.json_header)
+        self.cache_invalidate(asset_manager_id, asset_id)
         if response.ok:
             asset = json_to_asset(response.json())
             return asset
@@ -88,6 +107,9 @@ class AssetsInterface(Interface):
 
     def retrieve(self, asset_manager_id, asset_id, version=None):
         self.logger.info('Retrieve Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id, asset_id)
+        cached = self.cache_get(asset_manager_id, asset_id, version)
+        if cached is not None:
+            return json_to_asset(cached)
         url = '%s/assets/%s/%s' % (self.endpoint, asset_manager_id, asset_id)
         if version:
             url += '?version=%d' % int(version)
@@ -95,16 +117,40 @@ class AssetsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Retrieved Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id,
                              asset_id)
-            return json_to_asset(response.json())
+            asset_json = response.json()
+            self.cache_set(asset_manager_id, asset_id, version, asset_json)
+            return json_to_asset(asset_json)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def retrieve_many(self, asset_manager_id, asset_ids, max_workers=4, chunk_size=100):
+        """
+        Retrieve many assets at once by batching the IDs into concurrent searches.
+
+        :param asset_manager_id: The asset_manager_id which owns the assets.
+        :param asset_ids: The IDs of the assets to retrieve.
+        :param max_workers: The maximum number of searches in flight at once - they run on the thread pool shared
+        by every interface (see AMaaSSession.executor).
+        :param chunk_size: The maximum number of IDs sent in a single search.
+        :return: A tuple of (assets keyed by asset_id, errors keyed by asset_id).
+        """
+        self.logger.info('Retrieve Many Assets - Asset Manager: %s - Count: %s', asset_manager_id, len(asset_ids))
+
+        def search(chunk):
+            return self.search(asset_manager_id=asset_manager_id, asset_ids=chunk)
+
+        assets, errors = retrieve_many(search=search, ids=asset_ids, id_attribute='asset_id', chunk_size=chunk_size,
+                                       max_workers=max_workers, executor=self.session.executor)
+        self.logger.info('Retrieved %s Assets - %s Errors.', len(assets), len(errors))
+        return assets, errors
+
     def deactivate(self, asset_manager_id, asset_id):
         self.logger.info('Deactivate Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id, asset_id)
         url = '%s/assets/%s/%s' % (self.endpoint, asset_manager_id, asset_id)
         json = {'asset_status': 'Inactive'}
         response = self.session.patch(url, json=json)
+        self.cache_invalidate(asset_manager_id, asset_id)
         if response.ok:
             self.logger.info('Successfully Deactivated Asset - Asset Manager: %s - Asset ID: %s', asset_manager_id,
                              asset_id)
@@ -114,7 +160,7 @@ class AssetsInterface(Interface):
             response.raise_for_status()
 
     def search(self, asset_manager_id, asset_ids=None, asset_classes=None, asset_types=None,
-               page_no=None, page_size=None):
+               page_no=None, page_size=None, updated_since=None):
         self.logger.info('Search for Assets - Asset Manager: %s', asset_manager_id)
         search_params = {}
         # Potentially roll this into a loop through args rather than explicitly named - depends on additional validation
@@ -128,6 +174,8 @@ class AssetsInterface(Interface):
             search_params['page_no'] = page_no
         if page_size:
             search_params['page_size'] = page_size
+        if updated_since:
+            search_params['updated_since'] = updated_since.isoformat()
         url = '%s/assets/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url, params=search_params)
         if response.ok:
@@ -171,9 +219,10 @@ class AssetsInterface(Interface):
     def assets_by_asset_manager(self, asset_manager_id):
         self.logger.info('Retrieve Assets By Asset Manager: %s', asset_manager_id)
         url = '%s/assets/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        response, assets = self.session.get_conditional(url, response_store=self.response_store,
+                                                         decode=lambda json_assets: [json_to_asset(json_asset)
+                                                                                     for json_asset in json_assets])
         if response.ok:
-            assets = [json_to_asset(json_asset) for json_asset in response.json()]
             self.logger.info('Returned %s Assets.', len(assets))
             return assets
         else:
@@ -187,6 +236,7 @@ class AssetsInterface(Interface):
         self.logger.info('Clear Assets - Asset Manager: %s', asset_manager_id)
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
+        self.cache_invalidate_asset_manager(asset_manager_id)
         if response.ok:
             count = response.json().get('count', 'Unknown')
             self.logger.info('Deleted %s Assets.', count)
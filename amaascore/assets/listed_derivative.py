@@ -5,8 +5,10 @@ from dateutil import parser
 from decimal import Decimal
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class ListedDerivative(Asset):
 
     def __init__(self, asset_manager_id, asset_id, asset_issuer_id=None, asset_status='Active', currency=None,
@@ -5,8 +5,10 @@ from dateutil import parser
 
 from amaascore.assets.asset import Asset
 from amaascore.assets.ownership_mixin import OwnershipMixin
+from amaascore.core.registry import register
 
 
+@register('asset')
 class RealAsset(Asset, OwnershipMixin):
 
     def __init__(self, asset_manager_id, asset_id, asset_issuer_id=None, asset_status='Active',
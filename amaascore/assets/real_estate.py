@@ -4,8 +4,10 @@ from datetime import datetime, date
 from dateutil import parser
 
 from amaascore.assets.real_asset import RealAsset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class RealEstate(RealAsset):
 
     def __init__(self, asset_manager_id, asset_id, asset_issuer_id=None, asset_status='Active',
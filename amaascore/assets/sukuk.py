@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class Sukuk(Asset):
 
     def __init__(self, asset_manager_id, asset_id, maturity_date, asset_issuer_id=None,
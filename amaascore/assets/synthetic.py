@@ -3,8 +3,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from datetime import date
 
 from amaascore.assets.asset import Asset
+from amaascore.core.registry import register
 
 
+@register('asset')
 class Synthetic(Asset):
 
     def __init__(self, asset_id, asset_manager_id, asset_issuer_id=None, asset_status='Active',
@@ -3,8 +3,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from datetime import date
 
 from amaascore.assets.synthetic import Synthetic
+from amaascore.core.registry import register
 
 
+@register('asset')
 class SyntheticFromBook(Synthetic):
     """ A synthetic asset whose value is based on the value of the assets in a referenced book """
 
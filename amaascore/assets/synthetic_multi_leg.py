@@ -3,8 +3,10 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from datetime import date
 
 from amaascore.assets.synthetic import Synthetic
+from amaascore.core.registry import register
 
 
+@register('asset')
 class SyntheticMultiLeg(Synthetic):
     """
     A synthetic asset which takes multiple assets as 'legs'.  The value of the entire structure is equal to the sum of
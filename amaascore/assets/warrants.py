@@ -4,7 +4,9 @@ from dateutil.parser import parse
 
 from amaascore.assets.asset import Asset
 from amaascore.assets.equity import Equity
+from amaascore.core.registry import register
 
+@register('asset')
 class Warrant(Equity):
 
     @staticmethod
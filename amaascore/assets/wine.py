@@ -1,15 +1,17 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 import sys
 
 from amaascore.assets.real_asset import RealAsset
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('asset')
 class Wine(RealAsset):
 
     def __init__(self, asset_manager_id, asset_id, year=None, producer=None,
@@ -61,7 +63,7 @@ class Wine(RealAsset):
     @to_drink_start.setter
     def to_drink_start(self, to_drink_start):
         if isinstance(to_drink_start, (type_check)):
-            to_drink_start = parse(to_drink_start).date()
+            to_drink_start = parse_date(to_drink_start)
         self._to_drink_start = to_drink_start
 
     @property
@@ -72,6 +74,6 @@ class Wine(RealAsset):
     @to_drink_end.setter
     def to_drink_end(self, to_drink_end):
         if isinstance(to_drink_end, (type_check)):
-            to_drink_end = parse(to_drink_end).date()
+            to_drink_end = parse_date(to_drink_end)
         self._to_drink_end = to_drink_end
 
@@ -4,11 +4,13 @@ import datetime
 import uuid
 import pytz
 
+from amaascore.core.registry import register
 from amaascore.error_messages import ERROR_LOOKUP
 from amaascore.books.enums import BOOK_TYPES
 from amaascore.core.amaas_model import AMaaSModel
 
 
+@register('book')
 class Book(AMaaSModel):
 
     @staticmethod
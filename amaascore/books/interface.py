@@ -4,15 +4,15 @@ import logging
 
 from amaascore.books.utils import json_to_book
 from amaascore.config import ENVIRONMENT
-from amaascore.core.interface import Interface
+from amaascore.core.interface import Interface, retrieve_many
 
 
 class BooksInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         logger = logger or logging.getLogger(__name__)
         super(BooksInterface, self).__init__(endpoint=endpoint, endpoint_type='books', environment=environment,
-                                             username=username, password=password, logger=logger)
+                                             username=username, password=password, logger=logger, **kwargs)
 
     def new(self, book):
         self.logger.info('New Book - Asset Manager: %s - Book ID: %s', book.asset_manager_id, book.book_id)
@@ -31,6 +31,7 @@ class BooksInterface(Interface):
         self.logger.info('Amend Book - Asset Manager: %s - Book ID: %s', book.asset_manager_id, book.book_id)
         url = '%s/books/%s/%s' % (self.endpoint, book.asset_manager_id, book.book_id)
         response = self.session.put(url, json=book.to_interface())
+        self.cache_invalidate(book.asset_manager_id, book.book_id)
         if response.ok:
             self.logger.info('Successfully Amended Book - Asset Manager: %s - Book ID: %s', book.asset_manager_id,
                              book.book_id)
@@ -42,6 +43,9 @@ class BooksInterface(Interface):
 
     def retrieve(self, asset_manager_id, book_id, version=None):
         self.logger.info('Retrieve Book - Asset Manager: %s - Book ID: %s', asset_manager_id, book_id)
+        cached = self.cache_get(asset_manager_id, book_id, version)
+        if cached is not None:
+            return json_to_book(cached)
         url = '%s/books/%s/%s' % (self.endpoint, asset_manager_id, book_id)
         if version:
             url += '?version=%d' % int(version)
@@ -49,16 +53,40 @@ class BooksInterface(Interface):
         if response.ok:
             self.logger.info('Successfully Retrieved Book - Asset Manager: %s - Book ID: %s', asset_manager_id,
                              book_id)
-            return json_to_book(response.json())
+            book_json = response.json()
+            self.cache_set(asset_manager_id, book_id, version, book_json)
+            return json_to_book(book_json)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def retrieve_many(self, asset_manager_id, book_ids, max_workers=4, chunk_size=100):
+        """
+        Retrieve many books at once by batching the IDs into concurrent searches.
+
+        :param asset_manager_id: The asset_manager_id which owns the books.
+        :param book_ids: The IDs of the books to retrieve.
+        :param max_workers: The maximum number of searches in flight at once - they run on the thread pool shared
+        by every interface (see AMaaSSession.executor).
+        :param chunk_size: The maximum number of IDs sent in a single search.
+        :return: A tuple of (books keyed by book_id, errors keyed by book_id).
+        """
+        self.logger.info('Retrieve Many Books - Asset Manager: %s - Count: %s', asset_manager_id, len(book_ids))
+
+        def search(chunk):
+            return self.search(asset_manager_id=asset_manager_id, book_ids=chunk)
+
+        books, errors = retrieve_many(search=search, ids=book_ids, id_attribute='book_id', chunk_size=chunk_size,
+                                      max_workers=max_workers, executor=self.session.executor)
+        self.logger.info('Retrieved %s Books - %s Errors.', len(books), len(errors))
+        return books, errors
+
     def retire(self, asset_manager_id, book_id):
         self.logger.info('Retire Book - Asset Manager: %s - Book ID: %s', asset_manager_id, book_id)
         url = '%s/books/%s/%s' % (self.endpoint, asset_manager_id, book_id)
         json = {'book_status': 'Retired'}
         response = self.session.patch(url, json=json)
+        self.cache_invalidate(asset_manager_id, book_id)
         if response.ok:
             self.logger.info('Successfully Retired Book - Asset Manager: %s - Book ID: %s', asset_manager_id, book_id)
             return json_to_book(response.json())
@@ -67,7 +95,7 @@ class BooksInterface(Interface):
             response.raise_for_status()
 
     def search(self, asset_manager_id, book_ids=None, business_units=None, 
-                     owner_ids=None, party_ids=None, book_statuses=None):
+                     owner_ids=None, party_ids=None, book_statuses=None, updated_since=None):
         self.logger.info('Search Books - Asset Manager: %s', asset_manager_id)
         search_params = {}
         # Potentially roll this into a loop through args rather than explicitly named - depends on additional validation
@@ -81,6 +109,8 @@ class BooksInterface(Interface):
             search_params['party_ids'] = ','.join(party_ids)
         if book_statuses:
             search_params['book_statuses'] = ','.join(book_statuses)
+        if updated_since:
+            search_params['updated_since'] = updated_since.isoformat()
         url = '%s/books/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url, params=search_params)
         if response.ok:
@@ -95,9 +125,10 @@ class BooksInterface(Interface):
     def books_by_asset_manager(self, asset_manager_id):
         self.logger.info('Retrieve Books by Asset Manager: %s', asset_manager_id)
         url = '%s/books/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        response, books = self.session.get_conditional(url, response_store=self.response_store,
+                                                        decode=lambda json_books: [json_to_book(json_book)
+                                                                                   for json_book in json_books])
         if response.ok:
-            books = [json_to_book(json_book) for json_book in response.json()]
             self.logger.info('Returned %s Books.', len(books))
             return books
         else:
@@ -123,6 +154,7 @@ class BooksInterface(Interface):
         self.logger.info('Clear Books - Asset Manager: %s', asset_manager_id)
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
+        self.cache_invalidate_asset_manager(asset_manager_id)
         if response.ok:
             count = response.json().get('count', 'Unknown')
             self.logger.info('Deleted %s Books.', count)
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaascore.books.book import Book
+from amaascore.core.instrumentation import instrument_decoder
 
 
+@instrument_decoder
 def json_to_book(json_book):
     book = Book(**json_book)
     return book
@@ -7,6 +7,8 @@ import sys
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+json_primitives = (str, int, float, bool, type(None)) if sys.version_info >= (3, 0, 0) else \
+    (str, unicode, int, long, float, bool, type(None))
 
 
 def json_handler(value):
@@ -18,20 +20,77 @@ def json_handler(value):
         return list(value)
     if isinstance(value, Decimal):
         return str(value)
-    if isinstance(value, AMaaSModel):
+    if isinstance(value, AMaaSModelBase):
         return value.to_json()
     raise TypeError("JSON Handler Failed on value '%s': Unknown type '%s'" % (value, type(value)))
 
 
+def json_key(key):
+    """ Convert a dict key in the same way that json.dumps would """
+    if isinstance(key, type_check):
+        return key
+    if isinstance(key, json_primitives):
+        return json.dumps(key)
+    raise TypeError("JSON Handler Failed on key '%s': Unknown type '%s'" % (key, type(key)))
+
+
+def to_json_value(value):
+    """
+    Convert value into JSON-ready primitives in a single recursive pass.  This is equivalent to (but much cheaper
+    than) json.loads(json.dumps(value, default=json_handler)).
+    """
+    value_type = type(value)
+    if value_type in json_primitives:
+        return value
+    if value_type is dict:
+        return {json_key(key): to_json_value(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [to_json_value(item) for item in value]
+    if isinstance(value, AMaaSModelBase):
+        return value.to_json()
+    if isinstance(value, json_primitives):
+        return value
+    if isinstance(value, dict):
+        return {json_key(key): to_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_json_value(item) for item in value]
+    return json_handler(value)
+
+
 def to_json(dict_to_convert):
-    return json.loads(to_json_string(dict_to_convert))
+    return to_json_value(dict_to_convert)
 
 
 def to_json_string(dict_to_convert):
     return json.dumps(dict_to_convert, ensure_ascii=False, default=json_handler, indent=4, separators=(',', ': '))
 
 
-class AMaaSModel(object):
+# The slots a compact (__slots__ based) model needs for the attributes set by AMaaSModel itself
+MODEL_SLOTS = ('_version', 'created_by', 'updated_by', 'created_time', 'updated_time')
+
+_slot_names = {}
+
+
+def slot_names(clazz):
+    """ All of the slots declared across the class hierarchy of clazz (cached per class). """
+    names = _slot_names.get(clazz)
+    if names is None:
+        names = []
+        for klass in reversed(clazz.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            slots = (slots,) if isinstance(slots, type_check) else slots
+            names.extend(slot for slot in slots if slot not in ('__dict__', '__weakref__') and slot not in names)
+        names = _slot_names[clazz] = tuple(names)
+    return names
+
+
+class AMaaSModelBase(object):
+    """
+    The behaviour shared by all AMaaS models.  It declares no slots itself so that the high volume models can offer a
+    compact __slots__ based representation (declaring their own slots plus MODEL_SLOTS) alongside the usual one.
+    """
+
+    __slots__ = ()
 
     @staticmethod
     def non_interface_attributes():
@@ -64,19 +123,36 @@ class AMaaSModel(object):
     def to_interface(self):
         """
         Returns only the JSON attributes required when interfacing with the AMaaS Core services.
-        Non-interface attributes are popped out.
+        Non-interface attributes are skipped - the object itself is left untouched.
         :return:
         """
-        dict_to_convert = self.__dict__
-        [dict_to_convert.pop(attr) for attr in self.non_interface_attributes()]
-        return self.to_json(dict_to_convert)
+        return to_json(self.to_dict(exclude=self.non_interface_attributes()))
 
-    def to_dict(self, dict_to_convert=None):
-        dict_to_convert = dict_to_convert or self.__dict__
+    def attribute_dict(self):
+        """
+        The attributes set on this object, keyed by their internal name - i.e. the __dict__ or, for compact models,
+        the equivalent built from the slots which have been set.
+        :return:
+        """
+        try:
+            return self.__dict__
+        except AttributeError:
+            attributes = {}
+            for name in slot_names(type(self)):
+                try:
+                    attributes[name] = getattr(self, name)
+                except AttributeError:
+                    continue
+            return attributes
+
+    def to_dict(self, dict_to_convert=None, exclude=()):
+        dict_to_convert = self.attribute_dict() if dict_to_convert is None else dict_to_convert
         # Convert internal property values (_XYZ) to the correctly named one (XYZ)
         # Is there a better way of doing this instead of relying on the first character?
         mapped_dict = {}
         for key, value in dict_to_convert.items():
+            if key in exclude:
+                continue
             key = key[1:] if key[0] == '_' else key
             mapped_dict[key] = value
         return mapped_dict
@@ -97,12 +173,21 @@ class AMaaSModel(object):
     def __eq__(self, other):
         """Override the default Equals behavior"""
         if isinstance(other, self.__class__):
-            my_dict = self.__dict__
-            other_dict = other.__dict__
-            # Strip out the database generated fields:
-            [my_dict.pop(attr, None) for attr in self.amaas_model_attributes()]
-            [other_dict.pop(attr, None) for attr in self.amaas_model_attributes()]
-            return my_dict == other_dict
+            # Skip the database generated fields during the comparison, rather than stripping them out of either object
+            excluded = self.amaas_model_attributes()
+            my_dict = self.attribute_dict()
+            other_dict = other.attribute_dict()
+            compared = 0
+            for key, value in my_dict.items():
+                if key in excluded:
+                    continue
+                if key not in other_dict:
+                    return False
+                other_value = other_dict[key]
+                if other_value is not value and not other_value == value:
+                    return False
+                compared += 1
+            return compared == sum(1 for key in other_dict if key not in excluded)
         return NotImplemented
 
     def __ne__(self, other):
@@ -113,10 +198,15 @@ class AMaaSModel(object):
     def __hash__(self):
         """Override the default hash behavior (that returns the id or the object)"""
         output = []
-        for (key, value) in self.__dict__.items():
+        excluded = self.amaas_model_attributes()
+        for (key, value) in self.attribute_dict().items():
             # Remove the internal attributes since they shouldn't be used for ordering etc
-            if key not in self.amaas_model_attributes():
+            if key not in excluded:
                 output_value = hash(tuple(sorted(value))) if isinstance(value, dict) else value
                 output.append((key, output_value))
         return hash(tuple(sorted(output)))
 
+
+class AMaaSModel(AMaaSModelBase):
+    """ The base class for AMaaS models, which hold their attributes in a per-instance __dict__. """
+    pass
@@ -0,0 +1,111 @@
+"""
+asyncio counterparts of the AMaaS interfaces (Python 3.5+ only).
+
+The underlying HTTP calls are still made through the pooled requests.Session held by AMaaSSession, but they are
+dispatched onto a bounded thread pool so that a single event loop can drive thousands of concurrent calls.  Responses
+are decoded by the same json_to_* converters used by the synchronous interfaces.
+
+    transactions = AsyncInterface(TransactionsInterface(), max_concurrency=50)
+    results = loop.run_until_complete(transactions.map('retrieve', [{'asset_manager_id': 1, 'transaction_id': t_id}
+                                                                    for t_id in transaction_ids]))
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+
+class AsyncAMaaSSession(object):
+    """
+    Awaitable wrapper around an AMaaSSession.  At most max_concurrency calls are in flight at any one time.
+    """
+
+    def __init__(self, session, max_concurrency=10, executor=None):
+        self.session = session
+        self.max_concurrency = max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        return self._executor
+
+    @property
+    def semaphore(self):
+        # Created lazily so that it is bound to the loop which is actually running the calls
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func, *args, **kwargs):
+        """ Run a blocking callable on the executor, respecting the concurrency limit. """
+        async with self.semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def put(self, url, data=None, **kwargs):
+        return await self.run(self.session.put, url, data=data, **kwargs)
+
+    async def post(self, url, data=None, **kwargs):
+        return await self.run(self.session.post, url, data=data, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.run(self.session.delete, url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        return await self.run(self.session.get, url, **kwargs)
+
+    async def patch(self, url, data=None, **kwargs):
+        return await self.run(self.session.patch, url, data=data, **kwargs)
+
+    def close(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class AsyncInterface(object):
+    """
+    Exposes every public method of the wrapped Interface (e.g. AssetsInterface, TransactionsInterface) as a
+    coroutine function with the same signature and return value.
+    """
+
+    def __init__(self, interface, max_concurrency=10, executor=None):
+        self.interface = interface
+        self.session = AsyncAMaaSSession(session=interface.session, max_concurrency=max_concurrency,
+                                         executor=executor)
+
+    def __getattr__(self, name):
+        attr = getattr(self.interface, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self.session.run(attr, *args, **kwargs)
+        return method
+
+    async def map(self, method_name, calls, return_exceptions=False):
+        """
+        Concurrently invoke the same method once per entry in calls.
+
+        :param method_name: The name of the interface method to call - e.g. 'retrieve'.
+        :param calls: An iterable of keyword argument dicts, one per call.
+        :param return_exceptions: If True, exceptions are returned in place of results rather than raised.
+        :return: A list of results in the same order as calls.
+        """
+        method = getattr(self, method_name)
+        return await asyncio.gather(*[method(**kwargs) for kwargs in calls], return_exceptions=return_exceptions)
+
+    def close(self):
+        self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
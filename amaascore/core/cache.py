@@ -0,0 +1,281 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+import copy
+import json
+import os
+from os.path import expanduser, join
+import sqlite3
+import threading
+import time
+
+# The version under which the current version of an object is cached, when it is retrieved without a version
+LATEST = 'latest'
+
+
+class CacheStats(object):
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'invalidations': self.invalidations, 'hit_ratio': self.hit_ratio()}
+
+
+class Cache(object):
+    """
+    A cache of the JSON of reference data objects - keyed by (namespace, asset_manager_id, object ID, version) - for
+    the interfaces to read through.  The JSON rather than the object is cached, so that callers modifying an object
+    they retrieved cannot change what later callers see.
+
+    Entries expire ttl seconds after they are set.  An explicit version of an object never changes, but the current
+    version does - so only entries cached under LATEST are removed when an object is invalidated.
+    """
+
+    def __init__(self, ttl=300):
+        """
+        :param ttl: The number of seconds an entry is kept for.
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def generate_key(namespace, asset_manager_id, object_id, version=None):
+        return namespace, int(asset_manager_id), object_id, LATEST if version is None else int(version)
+
+    def get(self, key):
+        """
+        :return: The cached JSON for key - or None if it is not cached or has expired.
+        """
+        value = self.lookup(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(value)
+
+    def set(self, key, json_object):
+        self.store(key, json.dumps(json_object, ensure_ascii=False), time.time() + self.ttl)
+
+    def invalidate(self, namespace, asset_manager_id, object_id):
+        self.stats.invalidations += 1
+        self.remove(self.generate_key(namespace, asset_manager_id, object_id))
+
+    def invalidate_asset_manager(self, namespace, asset_manager_id):
+        """ Remove every entry of namespace for the asset manager - leaving other namespaces and asset managers """
+        self.stats.invalidations += 1
+        self.remove_asset_manager(namespace, int(asset_manager_id))
+
+    def lookup(self, key):
+        raise NotImplementedError
+
+    def store(self, key, value, expires):
+        raise NotImplementedError
+
+    def remove(self, key):
+        raise NotImplementedError
+
+    def remove_asset_manager(self, namespace, asset_manager_id):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class LRUCache(Cache):
+    """ An in-process cache, evicting the least recently used entries beyond max_size """
+
+    def __init__(self, max_size=10000, ttl=300):
+        super(LRUCache, self).__init__(ttl=ttl)
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.time():
+                return None
+            self.entries[key] = entry  # Move to the most recently used end
+            return value
+
+    def store(self, key, value, expires):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (value, expires)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def remove(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def remove_asset_manager(self, namespace, asset_manager_id):
+        with self.lock:
+            for key in [key for key in self.entries if key[:2] == (namespace, asset_manager_id)]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class SqliteCache(Cache):
+    """
+    A cache in a sqlite file, which can be shared between processes (and survives them) - by default in ~/.amaas.
+    Expired entries are deleted when they are next looked up, and on every prune_interval stores.
+    """
+
+    def __init__(self, filename=None, ttl=300, prune_interval=1000):
+        super(SqliteCache, self).__init__(ttl=ttl)
+        self.filename = filename or self.generate_filename()
+        self.prune_interval = prune_interval
+        self.stores = 0
+        self.lock = threading.Lock()
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        if not os.path.exists(self.filename):
+            os.close(os.open(self.filename, os.O_WRONLY | os.O_CREAT, 0o600))
+        # The connection is shared between threads, with access serialised by the lock
+        self.connection = sqlite3.connect(self.filename, timeout=30, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS cache (namespace TEXT, asset_manager_id INTEGER, '
+                                    'object_id TEXT, version TEXT, value TEXT, expires REAL, '
+                                    'PRIMARY KEY (namespace, asset_manager_id, object_id, version))')
+
+    @staticmethod
+    def generate_filename():
+        return join(expanduser("~"), '.amaas', 'cache.sqlite')
+
+    @staticmethod
+    def key_parameters(key):
+        namespace, asset_manager_id, object_id, version = key
+        return namespace, asset_manager_id, object_id, str(version)
+
+    def lookup(self, key):
+        with self.lock:
+            row = self.connection.execute('SELECT value, expires FROM cache WHERE namespace=? AND '
+                                          'asset_manager_id=? AND object_id=? AND version=?',
+                                          self.key_parameters(key)).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires <= time.time():
+                with self.connection:
+                    self.connection.execute('DELETE FROM cache WHERE namespace=? AND asset_manager_id=? AND '
+                                            'object_id=? AND version=?', self.key_parameters(key))
+                return None
+            return value
+
+    def store(self, key, value, expires):
+        with self.lock, self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)',
+                                    self.key_parameters(key) + (value, expires))
+            self.stores += 1
+            if self.stores % self.prune_interval == 0:
+                cursor = self.connection.execute('DELETE FROM cache WHERE expires <= ?', (time.time(),))
+                self.stats.evictions += cursor.rowcount
+
+    def remove(self, key):
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM cache WHERE namespace=? AND asset_manager_id=? AND object_id=? AND '
+                                    'version=?', self.key_parameters(key))
+
+    def remove_asset_manager(self, namespace, asset_manager_id):
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM cache WHERE namespace=? AND asset_manager_id=?',
+                                    (namespace, asset_manager_id))
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM cache')
+
+    def close(self):
+        self.connection.close()
+
+
+class ResponseStore(object):
+    """
+    An in-process store of the decoded results of GET requests, along with the validators (ETag and Last-Modified)
+    the service returned for them - so that a request can be made conditional, and a 304 Not Modified answered from
+    the store without downloading or decoding the payload again.
+
+    The decoded objects are shared between every caller which receives them from the store - copy them before
+    modifying them.
+    """
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def generate_key(url, params=None):
+        return url, tuple(sorted((params or {}).items()))
+
+    def validators(self, key):
+        """ The conditional request headers for key - empty if nothing is stored for it """
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, key):
+        """ The stored result for key - the service has confirmed it is not modified """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return None
+            self.entries[key] = entry
+            self.stats.hits += 1
+        result = entry[2]
+        # A shallow copy, so callers can add to or remove from the result without changing the stored one
+        return copy.copy(result)
+
+    def set(self, key, etag, last_modified, result):
+        """ Store the result of a full download - counted as a miss """
+        with self.lock:
+            self.stats.misses += 1
+            self.entries.pop(key, None)
+            if not (etag or last_modified):
+                return  # Without a validator the request can't be made conditional
+            self.entries[key] = (etag, last_modified, result)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key):
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,67 @@
+"""
+Parsing of the date and datetime strings the models are set from.  ISO 8601 strings - which is what the services
+send - are parsed with date/datetime.fromisoformat, and anything else falls back to dateutil, so the result is the
+same as dateutil.parser.parse gives, only quicker.  Dates are memoized, as a page of transactions or prices tends to
+repeat the same few business dates.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import date, datetime
+from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
+
+try:
+    date_fromisoformat = date.fromisoformat
+    datetime_fromisoformat = datetime.fromisoformat
+except AttributeError:  # Python < 3.7 - everything goes through dateutil
+    date_fromisoformat = datetime_fromisoformat = None
+
+MAX_CACHED_DATES = 10000
+
+_dates = {}
+
+
+def is_iso(value):
+    """ Whether value starts with a YYYY-MM-DD date, followed by nothing or a time """
+    return len(value) >= 10 and value[4] == '-' and value[7] == '-' and (len(value) == 10 or value[10] in 'T ')
+
+
+def parse_datetime(value):
+    """
+    :param value: A date or datetime string.
+    :return: The datetime which dateutil.parser.parse gives for value - timezones are dateutil's tzutc or tzoffset.
+    """
+    if datetime_fromisoformat is not None and is_iso(value):
+        try:
+            result = datetime_fromisoformat(value)
+        except ValueError:  # e.g. a trailing Z before Python 3.11 - leave it to dateutil
+            return parse(value)
+        offset = result.utcoffset()
+        if offset is not None:
+            result = result.replace(tzinfo=tzoffset(None, int(offset.total_seconds())) if offset else tzutc())
+        return result
+    return parse(value)
+
+
+def parse_date(value):
+    """
+    :param value: A date or datetime string.
+    :return: The date of value.
+    """
+    result = _dates.get(value)
+    if result is None:
+        if date_fromisoformat is not None and len(value) == 10 and is_iso(value):
+            try:
+                result = date_fromisoformat(value)
+            except ValueError:
+                result = parse(value).date()
+        else:
+            result = parse_datetime(value).date()
+        if len(_dates) >= MAX_CACHED_DATES:
+            _dates.clear()
+        _dates[value] = result
+    return result
+
+
+def clear_cache():
+    _dates.clear()
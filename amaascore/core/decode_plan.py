@@ -0,0 +1,73 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:  # Python 2
+    from inspect import getargspec
+
+
+class DecodePlan(object):
+    """
+    Everything needed to turn a JSON dict into an instance of a model class, worked out once per class rather than
+    once per object decoded.
+    """
+
+    def __init__(self, clazz):
+        self.clazz = clazz
+        spec = getargspec(clazz.__init__)
+        args = [arg for arg in spec.args if arg != 'self']
+        defaults = spec.defaults or ()
+        self.mandatory = frozenset(args[:len(args) - len(defaults)])
+        # Some fields are always added in, even though they're not explicitly part of the constructor
+        self.arguments = tuple(args + [attr for attr in clazz.amaas_model_attributes() if attr not in args])
+        self.children = clazz.children() if hasattr(clazz, 'children') else {}
+
+    def decode_children(self, json_object, children=None):
+        """
+        Convert the child collections of json_object (in place) into the relevant child classes.
+
+        :param json_object: The JSON dict being decoded.
+        :param children: Overrides the class's own children mapping - e.g. to decode into compact child classes.
+        :return:
+        """
+        children = self.children if children is None else children
+        for (collection_name, clazz) in children.items():
+            collection_json = json_object.pop(collection_name, None) or {}
+            collection = {}
+            for (child_type, child_json) in collection_json.items():
+                # Handle the case where there are multiple children for a given type - e.g. links
+                if isinstance(child_json, list):
+                    child = set()
+                    for child_json_in_list in child_json:
+                        child.add(clazz(**child_json_in_list))
+                else:
+                    child = clazz(**child_json)
+                collection[child_type] = child
+            json_object[collection_name] = collection
+        return json_object
+
+    def constructor_arguments(self, json_object):
+        """ The subset of json_object accepted by the constructor. """
+        # is not None is important so it includes zeros and False
+        return {arg: json_object[arg] for arg in self.arguments if json_object.get(arg) is not None}
+
+    def check_mandatory(self, json_object):
+        missing = [attr for attr in self.mandatory if json_object.get(attr) is None]
+        if missing:
+            raise ValueError("Missing Fields: %s in class: %s" % (",".join(missing), self.clazz.__name__))
+
+    def decode(self, json_object, children=None):
+        """ Decode the children and then construct the object from the constructor arguments only. """
+        self.decode_children(json_object, children=children)
+        return self.clazz(**self.constructor_arguments(json_object))
+
+
+_decode_plans = {}
+
+
+def decode_plan(clazz):
+    """ Return the (cached) DecodePlan for clazz. """
+    plan = _decode_plans.get(clazz)
+    if plan is None:
+        plan = _decode_plans[clazz] = DecodePlan(clazz)
+    return plan
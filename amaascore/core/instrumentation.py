@@ -0,0 +1,344 @@
+"""
+Instrumentation of the requests the interfaces make and the parsing and decoding of their responses.  Nothing is
+recorded until a hook is added - a hook is any callable taking a RequestEvent, ParseEvent or DecodeEvent, e.g. a
+HistogramCollector or StatsdHook.
+
+    collector = HistogramCollector()
+    add_hook(collector)
+    ...
+    print(collector.to_prometheus())
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from bisect import bisect_left
+import functools
+import json
+import logging
+import socket
+import threading
+from timeit import default_timer as timer
+from types import GeneratorType
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+logger = logging.getLogger(__name__)
+
+# Prometheus style histogram bucket upper bounds
+SECONDS_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+_hooks = []
+
+
+def add_hook(hook):
+    if hook not in _hooks:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def enabled():
+    return bool(_hooks)
+
+
+def traced_memory():
+    """ The bytes currently allocated, if tracemalloc is tracing - so that events can record what they allocated """
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
+
+def allocated_since(memory):
+    return traced_memory() - memory if memory is not None else None
+
+
+def emit(event):
+    for hook in list(_hooks):
+        try:
+            hook(event)
+        except Exception:
+            # Instrumentation must never break the call being instrumented
+            logger.exception('Instrumentation hook failed: %s', hook)
+
+
+class RequestEvent(object):
+    """ A single HTTP request - times are in seconds, sizes in bytes (None where unknown) """
+
+    kind = 'request'
+
+    def __init__(self, endpoint_type, method, url, status, bytes_sent, bytes_received, server_time, total_time,
+                 encode_time, allocated=None):
+        self.endpoint_type = endpoint_type
+        self.method = method
+        self.url = url
+        self.status = status
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.server_time = server_time  # Until the response headers arrived - i.e. the round trip and server time
+        self.total_time = total_time  # Including sending the request and downloading the response
+        self.encode_time = encode_time  # Encoding the JSON body, where one was passed as json=
+        self.allocated = allocated  # The net bytes allocated - only known whilst tracemalloc is tracing
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+class ParseEvent(object):
+    """ The parsing of a response body by response.json() """
+
+    kind = 'parse'
+
+    def __init__(self, endpoint_type, seconds, size, allocated=None):
+        self.endpoint_type = endpoint_type
+        self.seconds = seconds
+        self.size = size
+        self.allocated = allocated
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+class DecodeEvent(object):
+    """ The decoding of a single JSON object into a model by one of the json_to_* functions """
+
+    kind = 'decode'
+
+    def __init__(self, decoder, seconds, allocated=None):
+        self.decoder = decoder
+        self.seconds = seconds
+        self.allocated = allocated
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+def instrument_decoder(func):
+    """ Decorator emitting a DecodeEvent for each call of a json_to_* function - a single check when disabled """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+        memory = traced_memory()
+        start = timer()
+        result = func(*args, **kwargs)
+        emit(DecodeEvent(func.__name__, timer() - start, allocated=allocated_since(memory)))
+        return result
+    return wrapper
+
+
+def instrument_response(response, endpoint_type):
+    """ Replace the json method of a response with one emitting a ParseEvent each time it is called """
+    parse = response.json
+
+    def json(**kwargs):
+        memory = traced_memory()
+        start = timer()
+        result = parse(**kwargs)
+        emit(ParseEvent(endpoint_type, timer() - start, len(response.content or b''),
+                        allocated=allocated_since(memory)))
+        return result
+    response.json = json
+    return response
+
+
+def counted(chunks, counter):
+    """ Generator passing a streamed request body through, adding up its size in counter[0] """
+    for chunk in chunks:
+        counter[0] += len(chunk)
+        yield chunk
+
+
+def prepare_request(kwargs):
+    """
+    Encode any json= body up front, so its encoding can be timed separately from the request, and count the size
+    of any streamed body as it is sent.
+    :return: A tuple of (the updated request keyword arguments, encode time, streamed bytes counter).
+    """
+    encode_time, counter = None, None
+    if kwargs.get('json') is not None:
+        kwargs = dict(kwargs)
+        start = timer()
+        kwargs['data'] = json.dumps(kwargs.pop('json'), allow_nan=False).encode('utf-8')
+        encode_time = timer() - start
+        headers = dict(kwargs.get('headers') or {})
+        headers.setdefault('Content-Type', 'application/json')
+        kwargs['headers'] = headers
+    elif isinstance(kwargs.get('data'), GeneratorType):
+        kwargs = dict(kwargs)
+        counter = [0]
+        kwargs['data'] = counted(kwargs['data'], counter)
+    return kwargs, encode_time, counter
+
+
+def body_size(body):
+    return len(body) if isinstance(body, (bytes, type(''))) else None
+
+
+def request_event(endpoint_type, method, url, response, total_time, encode_time=None, counter=None, stream=False,
+                  allocated=None):
+    bytes_sent = counter[0] if counter is not None else body_size(getattr(response.request, 'body', None))
+    # A streamed response hasn't been downloaded yet - reading its content here would consume it
+    bytes_received = None if stream else len(response.content or b'')
+    server_time = response.elapsed.total_seconds() if response.elapsed is not None else None
+    return RequestEvent(endpoint_type=endpoint_type, method=method, url=url, status=response.status_code,
+                        bytes_sent=bytes_sent, bytes_received=bytes_received, server_time=server_time,
+                        total_time=total_time, encode_time=encode_time, allocated=allocated)
+
+
+class Histogram(object):
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last count is the +Inf bucket
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """ An estimate of the q quantile - the upper bound of the bucket it falls in """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float('inf')
+
+
+def format_labels(labels, **extra):
+    pairs = list(labels) + sorted(extra.items())
+    return '{%s}' % ','.join('%s="%s"' % (name, value) for name, value in pairs) if pairs else ''
+
+
+def format_value(value):
+    return '+Inf' if value == float('inf') else repr(value) if isinstance(value, float) else str(value)
+
+
+class HistogramCollector(object):
+    """
+    A hook keeping in-memory histograms of request times and sizes (by endpoint type, method and status) and of
+    decode times (by decoder).  Export them in the Prometheus text format with to_prometheus, or see the biggest
+    costs with summary.
+    """
+
+    def __init__(self, seconds_buckets=SECONDS_BUCKETS, bytes_buckets=BYTES_BUCKETS):
+        self.seconds_buckets = seconds_buckets
+        self.bytes_buckets = bytes_buckets
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, event):
+        with self.lock:
+            if event.kind == 'request':
+                labels = (('endpoint_type', event.endpoint_type or 'unknown'), ('method', event.method),
+                          ('status', event.status))
+                self.observe('amaas_request_seconds', labels, event.total_time)
+                self.observe('amaas_request_server_seconds', labels, event.server_time)
+                self.observe('amaas_request_encode_seconds', labels, event.encode_time)
+                self.observe('amaas_request_sent_bytes', labels, event.bytes_sent, self.bytes_buckets)
+                self.observe('amaas_request_received_bytes', labels, event.bytes_received, self.bytes_buckets)
+            elif event.kind == 'parse':
+                self.observe('amaas_parse_seconds', (('endpoint_type', event.endpoint_type or 'unknown'),),
+                             event.seconds)
+            elif event.kind == 'decode':
+                self.observe('amaas_decode_seconds', (('decoder', event.decoder),), event.seconds)
+
+    def observe(self, name, labels, value, buckets=None):
+        if value is None:
+            return
+        histogram = self.histograms.get((name, labels))
+        if histogram is None:
+            histogram = self.histograms[(name, labels)] = Histogram(buckets or self.seconds_buckets)
+        histogram.observe(value)
+
+    def histogram(self, name, **labels):
+        """ The histogram of name with exactly the given labels - or None """
+        for (histogram_name, histogram_labels), histogram in self.histograms.items():
+            if histogram_name == name and dict(histogram_labels) == labels:
+                return histogram
+        return None
+
+    def summary(self, name='amaas_request_seconds'):
+        """
+        :return: A list of dicts (labels, count, sum, mean, p50, p99) for each histogram of name - largest total first.
+        """
+        with self.lock:
+            rows = [{'labels': dict(labels), 'count': histogram.count, 'sum': histogram.sum,
+                     'mean': histogram.sum / histogram.count, 'p50': histogram.quantile(0.5),
+                     'p99': histogram.quantile(0.99)}
+                    for (histogram_name, labels), histogram in self.histograms.items() if histogram_name == name]
+        return sorted(rows, key=lambda row: row['sum'], reverse=True)
+
+    def to_prometheus(self):
+        """ The histograms in the Prometheus text exposition format """
+        lines = []
+        with self.lock:
+            names = sorted(set(name for name, _ in self.histograms))
+            for name in names:
+                lines.append('# TYPE %s histogram' % name)
+                for (histogram_name, labels), histogram in sorted(self.histograms.items()):
+                    if histogram_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        lines.append('%s_bucket%s %s' % (name, format_labels(labels, le=format_value(float(bound))),
+                                                         cumulative))
+                    lines.append('%s_sum%s %s' % (name, format_labels(labels), format_value(histogram.sum)))
+                    lines.append('%s_count%s %s' % (name, format_labels(labels), histogram.count))
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+
+
+class StatsdHook(object):
+    """ A hook sending each event to a StatsD server over UDP - timings in milliseconds, sizes as histograms """
+
+    def __init__(self, host='localhost', port=8125, prefix='amaas'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def metrics(self, event):
+        if event.kind == 'request':
+            name = '%s.request.%s.%s' % (self.prefix, event.endpoint_type or 'unknown', event.method.lower())
+            metrics = ['%s.status.%s:1|c' % (name, event.status), '%s.time:%.3f|ms' % (name, event.total_time * 1000)]
+            if event.server_time is not None:
+                metrics.append('%s.server_time:%.3f|ms' % (name, event.server_time * 1000))
+            if event.encode_time is not None:
+                metrics.append('%s.encode_time:%.3f|ms' % (name, event.encode_time * 1000))
+            if event.bytes_sent is not None:
+                metrics.append('%s.bytes_sent:%s|h' % (name, event.bytes_sent))
+            if event.bytes_received is not None:
+                metrics.append('%s.bytes_received:%s|h' % (name, event.bytes_received))
+            return metrics
+        if event.kind == 'parse':
+            return ['%s.parse.%s:%.3f|ms' % (self.prefix, event.endpoint_type or 'unknown', event.seconds * 1000)]
+        if event.kind == 'decode':
+            return ['%s.decode.%s:%.3f|ms' % (self.prefix, event.decoder, event.seconds * 1000)]
+        return []
+
+    def __call__(self, event):
+        metrics = self.metrics(event)
+        if metrics:
+            try:
+                self.socket.sendto('\n'.join(metrics).encode('utf-8'), self.address)
+            except socket.error as e:
+                logger.debug('Cannot send metrics to StatsD: %s', e)
+
+    def close(self):
+        self.socket.close()
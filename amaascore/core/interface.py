@@ -1,93 +1,516 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import boto3
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from configparser import ConfigParser, NoSectionError
+import copy
 from datetime import datetime
+import json
 import logging
 from os.path import expanduser, join
 from os import environ
 import requests
-from warrant.aws_srp import AWSSRP
+import threading
+from timeit import default_timer as timer
+from types import GeneratorType
 
 from amaascore.config import ENVIRONMENT, ENDPOINTS, CONFIGURATIONS
+from amaascore.core import instrumentation
+from amaascore.core.cache import Cache, LRUCache, ResponseStore
+from amaascore.core.token_cache import TokenCache
 from amaascore.exceptions import AMaaSException
 
 
+def replayable(data):
+    """ Whether a request body can be sent a second time - generators and files are consumed by the first attempt """
+    return not (isinstance(data, GeneratorType) or hasattr(data, 'read'))
+
+
 class AMaaSSession(object):
 
     __shared_state = {}
 
-    def __init__(self, username, password, environment_config, logger):
+    def __init__(self, username, password, environment_config, logger, token_cache=None):
         if not AMaaSSession.__shared_state:
             AMaaSSession.__shared_state = self.__dict__
             self.refresh_period = 45 * 60  # minutes * seconds
+            self.token_lifetime = 60 * 60  # Overwritten by the ExpiresIn returned by Cognito
             self.username = username
             self.password = password
             self.tokens = None
             self.last_authenticated = None
+            self.lock = threading.RLock()
+            self.refresher = None
+            self.token_cache = token_cache
+            self.cache_key = TokenCache.generate_key(environment_config.cognito_pool, username)
             self.session = requests.Session()
-            self.client = boto3.client('cognito-idp', environment_config.cognito_region)
-            self.aws = AWSSRP(username=self.username, password=self.password, pool_id=environment_config.cognito_pool,
-                              client_id=environment_config.cognito_client_id, client=self.client)
+            self.transport_sessions = {}  # The requests Session of each TransportConfig in use - see http_session
+            self.endpoint_types = {}  # The endpoint_type of each endpoint URL in use - see throttle
+            self.throttles = {}  # The Throttle of each endpoint_type, keyed by the names in ENDPOINTS
+            self.max_workers = 16  # The size of the thread pool shared by concurrent searches - see executor
+            self.thread_pool = None
+            self.environment_config = environment_config
+            self.client_id = environment_config.cognito_client_id
+            self.client = None  # The Cognito client is only created when it is first needed - see connect
+            self.aws = None
             self.logger = logger
         else:
             self.__dict__ = AMaaSSession.__shared_state
+            self.token_cache = self.token_cache or token_cache
         if self.needs_refresh():
-            self.login()
+            self.refresh()
+
+    def token_age(self):
+        """ The number of seconds since the tokens were last issued """
+        return (datetime.utcnow() - self.last_authenticated).total_seconds()
 
     def needs_refresh(self):
-        if not (self.last_authenticated and
-                (datetime.utcnow() - self.last_authenticated).seconds < self.refresh_period):
+        if not (self.last_authenticated and self.token_age() < self.refresh_period):
             return True
         else:
             return False
 
+    def tokens_expired(self):
+        # Leave a minute's grace so that tokens don't expire whilst a request is on the wire
+        return not (self.last_authenticated and self.token_age() < self.token_lifetime - 60)
+
+    def update_tokens(self, tokens, issued=None):
+        refresh_token = (self.tokens or {}).get('RefreshToken')
+        self.tokens = dict(tokens)
+        # A refresh doesn't return a new refresh token, so hold on to the one from the original login
+        self.tokens.setdefault('RefreshToken', refresh_token)
+        self.token_lifetime = tokens.get('ExpiresIn') or self.token_lifetime
+        self.last_authenticated = issued or datetime.utcnow()
+        for session in [self.session] + list(self.transport_sessions.values()):
+            session.headers.update({'Authorization': self.tokens.get('IdToken')})
+
+    def connect(self):
+        """
+        Create the Cognito client.  boto3 and warrant are slow to import, so they are only imported here rather than
+        when this module is loaded - sessions which pick up their tokens from a token cache never need them.
+        """
+        if self.client is None:
+            import boto3
+            from warrant.aws_srp import AWSSRP
+            self.client = boto3.client('cognito-idp', self.environment_config.cognito_region)
+            self.aws = AWSSRP(username=self.username, password=self.password,
+                              pool_id=self.environment_config.cognito_pool, client_id=self.client_id,
+                              client=self.client)
+
     def login(self):
+        self.connect()
         self.logger.info("Attempting login for: %s", self.username)
         try:
-            self.tokens = self.aws.authenticate_user().get('AuthenticationResult')
+            self.update_tokens(self.aws.authenticate_user().get('AuthenticationResult'))
             self.logger.info("Login successful")
-            self.last_authenticated = datetime.utcnow()
-            self.session.headers.update({'Authorization': self.tokens.get('IdToken')})
         except self.client.exceptions.NotAuthorizedException as e:
             self.logger.info("Login failed")
             self.logger.error(e.response.get('Error'))
             self.last_authenticated = None
 
-    def put(self, url, data=None, **kwargs):
-        # Add a refresh
-        if self.last_authenticated and not self.needs_refresh():
-            return self.session.put(url=url, data=data, **kwargs)
-        else:
+    def refresh_tokens(self):
+        """
+        Exchange the refresh token for a new set of tokens - this is much cheaper than a full SRP login.
+        :return: True if the tokens were refreshed.
+        """
+        refresh_token = (self.tokens or {}).get('RefreshToken')
+        if not refresh_token:
+            return False
+        self.logger.info("Attempting token refresh for: %s", self.username)
+        try:
+            self.connect()
+            response = self.client.initiate_auth(ClientId=self.client_id, AuthFlow='REFRESH_TOKEN_AUTH',
+                                                 AuthParameters={'REFRESH_TOKEN': refresh_token})
+        except Exception as e:
+            self.logger.warning("Token refresh failed: %s", e)
+            return False
+        self.update_tokens(response.get('AuthenticationResult'))
+        self.logger.info("Token refresh successful")
+        return True
+
+    def load_cached_tokens(self):
+        """
+        Use the tokens in the token cache if they are newer than the current ones - e.g. if they were obtained by
+        another process.
+        :return: True if the cached tokens were used.
+        """
+        if not self.token_cache:
+            return False
+        try:
+            tokens, issued = self.token_cache.load(self.cache_key, max_age=self.refresh_period)
+        except (IOError, OSError) as e:
+            self.logger.warning("Cannot read token cache: %s", e)
+            return False
+        if not tokens or (self.last_authenticated and issued <= self.last_authenticated):
+            return False
+        self.logger.info("Using cached tokens for: %s", self.username)
+        self.update_tokens(tokens, issued=issued)
+        return True
+
+    def cache_tokens(self):
+        if not (self.token_cache and self.last_authenticated):
+            return
+        try:
+            self.token_cache.store(self.cache_key, self.tokens, self.last_authenticated)
+        except (IOError, OSError) as e:
+            self.logger.warning("Cannot write token cache: %s", e)
+
+    def refresh(self, force=False):
+        """
+        Refresh the tokens, falling back to a full login if they can't be refreshed.  Only one caller refreshes at a
+        time - any others wait for it and then use the new tokens.
+
+        :param force: Refresh even if the current tokens are not yet due to be refreshed - e.g. after a 401.
+        :return:
+        """
+        last_authenticated = self.last_authenticated
+        with self.lock:
+            if self.last_authenticated != last_authenticated or not (force or self.needs_refresh()):
+                return  # Another thread has already refreshed the tokens
+            if self.load_cached_tokens():
+                return
+            if not self.refresh_tokens():
+                self.login()
+            self.cache_tokens()
+
+    def refresh_in_background(self):
+        with self.lock:
+            if self.refresher and self.refresher.is_alive():
+                return
+            self.refresher = threading.Thread(target=self.refresh)
+            self.refresher.daemon = True
+            self.refresher.start()
+
+    def ensure_authenticated(self):
+        """
+        Once the tokens are due a refresh they are refreshed on a background thread, whilst requests carry on using
+        the current tokens.  Callers only wait if the tokens have actually expired.
+        """
+        if self.tokens_expired():
+            self.refresh()
+        elif self.needs_refresh():
+            self.refresh_in_background()
+        if not self.last_authenticated:
             raise AMaaSException('Not Authenticated')
 
-    def post(self, url, data=None, **kwargs):
-        # Add a refresh
-        if self.last_authenticated and not self.needs_refresh():
-            return self.session.post(url=url, data=data, **kwargs)
+    def http_session(self, transport=None):
+        """ The requests Session to send requests through - each TransportConfig has its own connection pool """
+        if transport is None:
+            return self.session
+        session = self.transport_sessions.get(transport)
+        if session is None:
+            with self.lock:
+                session = self.transport_sessions.get(transport)
+                if session is None:
+                    session = transport.mount(requests.Session())
+                    session.headers.update({'Authorization': self.session.headers.get('Authorization')})
+                    self.transport_sessions[transport] = session
+        return session
+
+    @property
+    def executor(self):
+        """
+        The thread pool which the concurrent searches of every interface (e.g. retrieve_many) run on, so that the
+        number of threads is bounded however many callers there are.  It is created when first needed, with
+        max_workers threads - set max_workers before then to change its size.
+        """
+        if self.thread_pool is None:
+            with self.lock:
+                if self.thread_pool is None:
+                    self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self.thread_pool
+
+    def register_endpoint(self, endpoint, endpoint_type, throttle=None):
+        """
+        Record the endpoint_type of the URLs under endpoint, so that the throttle of that endpoint_type is applied to
+        them - setting it to throttle if given.
+        """
+        self.endpoint_types[endpoint.rstrip('/') + '/'] = endpoint_type
+        if throttle is not None:
+            self.throttles[endpoint_type] = throttle
+
+    def endpoint_type(self, url):
+        """ The endpoint_type url belongs to - or None if no interface has registered its endpoint """
+        # The most specific endpoint wins - e.g. for a local environment, where every service shares the base URL
+        matches = [endpoint for endpoint in self.endpoint_types if url.startswith(endpoint)]
+        return self.endpoint_types[max(matches, key=len)] if matches else None
+
+    def throttle(self, url):
+        """ The Throttle of the endpoint_type url belongs to - or None """
+        if not self.throttles:
+            return None
+        return self.throttles.get(self.endpoint_type(url))
+
+    def send(self, session, method, url, **kwargs):
+        throttle = self.throttle(url)
+        instrumented = instrumentation.enabled()
+        if instrumented:
+            kwargs, encode_time, counter = instrumentation.prepare_request(kwargs)
+            memory = instrumentation.traced_memory()
+            start = timer()
+        if throttle is None:
+            response = session.request(method=method, url=url, **kwargs)
         else:
-            raise AMaaSException('Not Authenticated')
+            response = throttle.send(lambda: session.request(method=method, url=url, **kwargs))
+        if instrumented:
+            endpoint_type = self.endpoint_type(url)
+            instrumentation.emit(instrumentation.request_event(endpoint_type, method, url, response, timer() - start,
+                                                               encode_time=encode_time, counter=counter,
+                                                               stream=kwargs.get('stream'),
+                                                               allocated=instrumentation.allocated_since(memory)))
+            instrumentation.instrument_response(response, endpoint_type)
+        return response
+
+    def request(self, method, url, transport=None, **kwargs):
+        self.ensure_authenticated()
+        last_authenticated = self.last_authenticated
+        if transport is not None:
+            kwargs = transport.prepare(kwargs)
+        session = self.http_session(transport)
+        response = self.send(session, method, url, **kwargs)
+        if response.status_code == 401 and replayable(kwargs.get('data')):
+            # The tokens have been rejected (e.g. revoked) - refresh them and retry once
+            self.logger.info("Request was not authorised - refreshing tokens and retrying")
+            if self.last_authenticated == last_authenticated:
+                self.refresh(force=True)
+            self.ensure_authenticated()
+            response = self.send(session, method, url, **kwargs)
+        return response
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url=url, data=data, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request('POST', url=url, data=data, **kwargs)
 
     def delete(self, url, **kwargs):
-        # Add a refresh
-        if self.last_authenticated and not self.needs_refresh():
-            return self.session.delete(url=url, **kwargs)
-        else:
-            raise AMaaSException('Not Authenticated')
+        return self.request('DELETE', url=url, **kwargs)
 
     def get(self, url, **kwargs):
-        # Add a refresh
-        if self.last_authenticated and not self.needs_refresh():
-            return self.session.get(url=url, **kwargs)
-        else:
-            raise AMaaSException('Not Authenticated')
+        return self.request('GET', url=url, **kwargs)
 
     def patch(self, url, data=None, **kwargs):
-        # Add a refresh
-        if self.last_authenticated and not self.needs_refresh():
-            return self.session.patch(url=url, data=data, **kwargs)
-        else:
-            raise AMaaSException('Not Authenticated')
+        return self.request('PATCH', url=url, data=data, **kwargs)
+
+    def get_conditional(self, url, decode, response_store=None, params=None, **kwargs):
+        """
+        GET url, sending the validators of the stored response (If-None-Match and If-Modified-Since) so that the
+        service can answer 304 Not Modified rather than sending the same payload again.
+
+        :param url:
+        :param decode: A callable converting the response JSON to the result - only called on a full download.
+        :param response_store: A ResponseStore - if None, this is a plain GET.
+        :param params: The query string parameters.
+        :return: A tuple of (response, result) - the result is None if the response is an error.
+        """
+        key = response_store.generate_key(url, params) if response_store is not None else None
+        headers = dict(kwargs.pop('headers', None) or {})
+        if response_store is not None:
+            headers.update(response_store.validators(key))
+        response = self.get(url, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and response_store is not None:
+            result = response_store.get(key)
+            if result is not None:
+                self.logger.debug("Not modified: %s", url)
+                return response, result
+            # The stored response was evicted whilst the request was in flight - download it in full
+            headers.pop('If-None-Match', None)
+            headers.pop('If-Modified-Since', None)
+            response = self.get(url, params=params, headers=headers, **kwargs)
+        if not response.ok:
+            return response, None
+        result = decode(response.json())
+        if response_store is not None:
+            response_store.set(key, response.headers.get('ETag'), response.headers.get('Last-Modified'), result)
+            result = copy.copy(result)
+        return response, result
+
+
+class TransportSession(object):
+    """
+    An AMaaSSession which sends its requests through a particular TransportConfig.  The AMaaSSession itself is shared
+    by every Interface, so the transport is applied by this wrapper rather than set on the session.
+    """
+
+    def __init__(self, session, transport):
+        self.amaas_session = session
+        self.transport = transport
+
+    def __getattr__(self, name):
+        return getattr(self.amaas_session, name)
+
+    def request(self, method, url, **kwargs):
+        return self.amaas_session.request(method, url=url, transport=self.transport, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url=url, data=data, **kwargs)
+
+    def post(self, url, data=None, **kwargs):
+        return self.request('POST', url=url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url=url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url=url, **kwargs)
+
+    def patch(self, url, data=None, **kwargs):
+        return self.request('PATCH', url=url, data=data, **kwargs)
+
+    def get_conditional(self, url, decode, response_store=None, params=None, **kwargs):
+        return self.amaas_session.get_conditional(url, decode, response_store=response_store, params=params,
+                                                  transport=self.transport, **kwargs)
+
+
+class PageFetcher(threading.Thread):
+    """
+    Fetches a single page of results on a background thread so that it can overlap with consuming the previous page.
+    """
+
+    def __init__(self, fetch_page, page_no):
+        super(PageFetcher, self).__init__()
+        self.daemon = True
+        self.fetch_page = fetch_page
+        self.page_no = page_no
+        self.page = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.page = self.fetch_page(self.page_no)
+        except Exception as e:
+            self.error = e
+
+    def result(self):
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.page
+
+
+def iterate_pages(fetch_page, page_size, page_no=1, prefetch=False):
+    """
+    Generator which walks a paged endpoint, yielding the items from each page in turn.  Iteration stops once a page
+    comes back with fewer than page_size items.
+
+    :param fetch_page: A callable taking a page number and returning the list of items on that page.
+    :param page_size: The number of items requested per page.
+    :param page_no: The first page to request.
+    :param prefetch: If True, the next page is requested on a background thread whilst the current one is consumed.
+    :return:
+    """
+    page = fetch_page(page_no)
+    while True:
+        last_page = len(page) < page_size
+        fetcher = None
+        if prefetch and not last_page:
+            fetcher = PageFetcher(fetch_page=fetch_page, page_no=page_no + 1)
+            fetcher.start()
+        # Release each item as soon as it has been handed out so that only the current page is held in memory
+        items = deque(page)
+        del page
+        while items:
+            yield items.popleft()
+        if last_page:
+            return
+        page_no += 1
+        page = fetcher.result() if fetcher else fetch_page(page_no)
+
+
+def json_stream(objects):
+    """
+    Generator encoding objects as a single JSON array, one object at a time.  Passing this as the data of a request
+    streams the body to the socket using chunked transfer encoding, rather than building it up in memory first.
+
+    :param objects: An iterable of AMaaSModel objects.
+    :return:
+    """
+    separator = b'['
+    for obj in objects:
+        yield separator + json.dumps(obj.to_interface(), ensure_ascii=False).encode('utf-8')
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
+
+
+def iter_retrieve_many(search, ids, chunk_size=100, max_workers=4, executor=None):
+    """
+    Generator version of retrieve_many, yielding the results of each search as it completes rather than collecting
+    them all.  IDs are consumed lazily and at most twice max_workers searches are queued at once, so an export of any
+    size is held in memory only a few chunks at a time.
+
+    :param search: A callable taking a list of IDs and returning the matching objects.
+    :param ids: An iterable of the IDs to retrieve.
+    :param chunk_size: The maximum number of IDs to send in a single search.
+    :param max_workers: The maximum number of searches in flight at once.
+    :param executor: The executor to run the searches on - e.g. AMaaSSession.executor, which is shared by every
+    caller.  If not given, a thread pool of max_workers threads is created for the call.
+    :return: A generator of (chunk of IDs, objects found, exception or None) - in completion order.
+    """
+    seen = set()
+
+    def chunks():
+        chunk = []
+        for object_id in ids:
+            if object_id in seen:
+                continue
+            seen.add(object_id)
+            chunk.append(object_id)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def result(future, chunk):
+        try:
+            return chunk, future.result() or [], None
+        except Exception as e:
+            return chunk, [], e
+
+    owned = executor is None
+    if owned:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    # A pool of our own only ever runs max_workers searches, so a second round can wait in its queue - whereas every
+    # search submitted to a shared pool may be running
+    limit = max_workers * 2 if owned else max_workers
+    try:
+        pending = OrderedDict()
+        for chunk in chunks():
+            if len(pending) >= limit:
+                done = next(as_completed(pending))
+                yield result(done, pending.pop(done))
+            pending[executor.submit(search, chunk)] = chunk
+        for future in as_completed(list(pending)):
+            yield result(future, pending.pop(future))
+    finally:
+        if owned:
+            executor.shutdown(wait=True)
+
+
+def retrieve_many(search, ids, id_attribute, chunk_size=100, max_workers=4, executor=None):
+    """
+    Retrieve a large number of objects by splitting their IDs into chunks, running one search per chunk concurrently
+    on a thread pool.  A failure in one chunk does not abort the others.
+
+    :param search: A callable taking a list of IDs and returning the matching objects.
+    :param ids: The IDs to retrieve.
+    :param id_attribute: The attribute on the returned objects holding their ID - e.g. 'asset_id'.
+    :param chunk_size: The maximum number of IDs to send in a single search.
+    :param max_workers: The maximum number of searches in flight at once.
+    :param executor: The executor to run the searches on - see iter_retrieve_many.
+    :return: A tuple of (objects keyed by ID, exceptions keyed by ID).
+    """
+    results, errors = {}, {}
+    for chunk, objects, error in iter_retrieve_many(search=search, ids=ids, chunk_size=chunk_size,
+                                                    max_workers=max_workers, executor=executor):
+        if error is not None:
+            errors.update({object_id: error for object_id in chunk})
+            continue
+        for obj in objects:
+            results[getattr(obj, id_attribute)] = obj
+        errors.update({object_id: AMaaSException('Not found: %s' % object_id)
+                       for object_id in chunk if object_id not in results})
+    return results, errors
 
 
 class Interface(object):
@@ -96,7 +519,27 @@ class Interface(object):
     """
 
     def __init__(self, endpoint_type, endpoint=None, environment=ENVIRONMENT, username=None, password=None,
-                 config_filename=None, logger=None):
+                 config_filename=None, logger=None, token_cache=None, cache=None, response_store=None,
+                 transport=None, throttle=None):
+        """
+
+        :param endpoint_type: The key of the service in ENDPOINTS - e.g. 'assets'.
+        :param endpoint: Overrides the URL of the service.
+        :param environment: The key of the environment in CONFIGURATIONS.
+        :param username:
+        :param password:
+        :param config_filename: The config file holding the credentials - defaults to ~/.amaas.cfg.
+        :param logger:
+        :param token_cache: True (or a TokenCache) to share login tokens with other processes via ~/.amaas.
+        :param cache: True (or a Cache - e.g. a SqliteCache to share it between processes) to cache retrieved
+        reference data.  Only supported by the assets, books and parties interfaces.
+        :param response_store: True (or a ResponseStore) to make the GETs of whole collections of reference data
+        conditional - unchanged collections are then returned from the store rather than downloaded again.
+        :param transport: A TransportConfig setting the connection pool size, retries and compression of this
+        interface's requests - by default requests' own defaults are used, with no retries.
+        :param throttle: A Throttle limiting the rate and concurrency of requests to this interface's service.  It
+        is shared by every interface for the same endpoint_type.
+        """
         self.logger = logger or logging.getLogger(__name__)
         self.config_filename = config_filename
         self.endpoint_type = endpoint_type
@@ -106,9 +549,39 @@ class Interface(object):
         self.json_header = {'Content-Type': 'application/json'}
         username = username or environ.get('AMAAS_USERNAME') or self.read_config('username')
         password = password or environ.get('AMAAS_PASSWORD') or self.read_config('password')
-        self.session = AMaaSSession(username, password, self.environment_config, self.logger)
+        token_cache = TokenCache() if token_cache is True else token_cache
+        self.session = AMaaSSession(username, password, self.environment_config, self.logger, token_cache=token_cache)
+        self.session.register_endpoint(self.endpoint, endpoint_type, throttle=throttle)
+        if transport is not None:
+            self.session = TransportSession(self.session, transport)
+        self.cache = LRUCache() if cache is True else cache
+        self.response_store = ResponseStore() if response_store is True else response_store
         self.logger.info('Interface Created')
 
+    def cache_get(self, asset_manager_id, object_id, version=None):
+        """ The cached JSON of the object - or None if it is not cached (or there is no cache) """
+        if self.cache is None:
+            return None
+        return self.cache.get(Cache.generate_key(self.endpoint_type, asset_manager_id, object_id, version))
+
+    def cache_set(self, asset_manager_id, object_id, version, json_object):
+        """ Cache the JSON of a retrieved object, under its own version as well as the version requested """
+        if self.cache is None:
+            return
+        self.cache.set(Cache.generate_key(self.endpoint_type, asset_manager_id, object_id, version), json_object)
+        if version is None and json_object.get('version') is not None:
+            self.cache.set(Cache.generate_key(self.endpoint_type, asset_manager_id, object_id,
+                                              json_object['version']), json_object)
+
+    def cache_invalidate(self, asset_manager_id, object_id):
+        if self.cache is not None:
+            self.cache.invalidate(self.endpoint_type, asset_manager_id, object_id)
+
+    def cache_invalidate_asset_manager(self, asset_manager_id):
+        """ Invalidate every cached object of the asset manager from this interface's service """
+        if self.cache is not None:
+            self.cache.invalidate_asset_manager(self.endpoint_type, asset_manager_id)
+
     def get_endpoint(self):
         if self.environment == 'local':
             return self.environment_config.base_url
@@ -0,0 +1,233 @@
+"""
+An opt-in profiling mode, attributing the time (and, with tracemalloc, the memory) of each call to the network, to
+parsing the JSON response and to decoding it into models - and breaking the decoding down by class and function.
+
+    with profile() as profiler:
+        transactions_interface.search(asset_manager_id)
+    print(profiler.report())
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import cProfile
+import inspect
+import os
+import pstats
+import sys
+import threading
+from timeit import default_timer as timer
+
+from amaascore.core import instrumentation
+
+PHASES = ('network', 'parse', 'decode')
+
+
+class CallProfile(object):
+    """ The time spent in each phase of a single request - the parse and decode phases follow it on the same thread """
+
+    def __init__(self, endpoint_type=None, method=None, url=None, status=None):
+        self.endpoint_type = endpoint_type
+        self.method = method
+        self.url = url
+        self.status = status
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.allocated = dict.fromkeys(PHASES)
+        self.decoded = 0
+
+    def add(self, phase, seconds, allocated):
+        self.seconds[phase] += seconds
+        if allocated is not None:
+            self.allocated[phase] = (self.allocated[phase] or 0) + allocated
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+def functions_of(attribute):
+    """ The plain functions behind a class attribute, with a suffix naming their role - e.g. a property's setter """
+    if isinstance(attribute, property):
+        return [(attribute.fget, ''), (attribute.fset, '.setter'), (attribute.fdel, '.deleter')]
+    if isinstance(attribute, (staticmethod, classmethod)):
+        return [(attribute.__func__, '')]
+    return [(attribute, '')]
+
+
+def code_key(func):
+    func = getattr(func, '__wrapped__', func)
+    code = getattr(func, '__code__', None)
+    return (code.co_filename, code.co_firstlineno, code.co_name) if code is not None else None
+
+
+def function_owners():
+    """
+    The (owner, qualified name) of every function defined by the SDK, keyed as cProfile keys them - the owner being
+    the class defining the function, or the module for a plain function.
+    """
+    owners = {}
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith('amaascore'):
+            continue
+        for name, value in list(vars(module).items()):
+            if getattr(value, '__module__', None) != module_name:
+                continue
+            if inspect.isclass(value):
+                for attribute_name, attribute in vars(value).items():
+                    for func, suffix in functions_of(attribute):
+                        key = code_key(func)
+                        if key is not None:
+                            owners[key] = (value.__name__, '%s.%s%s' % (value.__name__, attribute_name, suffix))
+            elif inspect.isfunction(value):
+                key = code_key(value)
+                if key is not None:
+                    owners[key] = (module_name, '%s.%s' % (module_name, name))
+    return owners
+
+
+def external_owner(filename, function_name):
+    """
+    The (owner, name) of a function cProfile saw which isn't a function or method of the SDK - e.g. a comprehension,
+    or a function of dateutil, decimal or json.  Functions outside the SDK are grouped by their top level package.
+    """
+    if filename == '~':
+        return 'builtins', function_name
+    filename = os.path.abspath(filename)
+    roots = [os.path.abspath(path) + os.sep for path in sys.path if path and filename.startswith(os.path.abspath(path))]
+    relative = filename[len(max(roots, key=len)):] if roots else os.path.basename(filename)
+    module = os.path.splitext(relative)[0].replace(os.sep, '.')
+    owner = module if module.startswith('amaascore') else module.split('.')[0]
+    return owner, '%s:%s' % (module, function_name)
+
+
+class Profiler(object):
+    """
+    Records the calls made whilst it is active.  The phases are recorded for calls made on any thread; the cProfile
+    breakdown only covers the thread which entered the profiler.
+    """
+
+    def __init__(self, cprofile=True, trace_memory=False):
+        """
+        :param cprofile: Profile each function called - this slows down everything being profiled.
+        :param trace_memory: Trace the memory allocated in each phase with tracemalloc (Python 3 only) - this is slow
+        too.
+        """
+        self.cprofile = cprofile
+        self.trace_memory = trace_memory and instrumentation.tracemalloc is not None
+        self.calls = []
+        self.unattributed = CallProfile()  # Parsing and decoding which didn't follow a request - e.g. of a file
+        self.wall_time = None
+        self.profile = None
+        self.started_tracing = False
+        self.lock = threading.Lock()
+        self.current = threading.local()
+        self.start = None
+
+    def __enter__(self):
+        if self.trace_memory and not instrumentation.tracemalloc.is_tracing():
+            instrumentation.tracemalloc.start()
+            self.started_tracing = True
+        instrumentation.add_hook(self)
+        if self.cprofile:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self.start = timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wall_time = timer() - self.start
+        if self.profile is not None:
+            self.profile.disable()
+        instrumentation.remove_hook(self)
+        if self.started_tracing:
+            instrumentation.tracemalloc.stop()
+            self.started_tracing = False
+
+    def __call__(self, event):
+        if event.kind == 'request':
+            call = CallProfile(event.endpoint_type, event.method, event.url, event.status)
+            call.add('network', event.total_time, event.allocated)
+            with self.lock:
+                self.calls.append(call)
+            self.current.call = call
+            return
+        call = getattr(self.current, 'call', None) or self.unattributed
+        if event.kind == 'parse':
+            call.add('parse', event.seconds, event.allocated)
+        elif event.kind == 'decode':
+            call.add('decode', event.seconds, event.allocated)
+            call.decoded += 1
+
+    def phases(self):
+        """
+        :return: A dict of phase to (seconds, net bytes allocated) across every call - the allocations are None unless
+        trace_memory was set.  The 'other' phase is the rest of the wall time.
+        """
+        totals = {}
+        for phase in PHASES:
+            allocations = [call.allocated[phase] for call in self.calls + [self.unattributed]
+                           if call.allocated[phase] is not None]
+            totals[phase] = (sum(call.seconds[phase] for call in self.calls + [self.unattributed]),
+                             sum(allocations) if allocations else None)
+        if self.wall_time is not None:
+            totals['other'] = (max(0.0, self.wall_time - sum(seconds for seconds, _ in totals.values())), None)
+        return totals
+
+    def functions(self):
+        """
+        :return: A list of dicts (owner, function, calls, own_seconds, cumulative_seconds) for every function cProfile
+        saw - most own time first.
+        """
+        if self.profile is None:
+            return []
+        owners = function_owners()
+        rows = []
+        for (filename, line, function_name), (_, calls, own, cumulative, _) in pstats.Stats(self.profile).stats.items():
+            owner, name = owners.get((filename, line, function_name)) or external_owner(filename, function_name)
+            rows.append({'owner': owner, 'function': name, 'calls': calls, 'own_seconds': own,
+                         'cumulative_seconds': cumulative})
+        return sorted(rows, key=lambda row: row['own_seconds'], reverse=True)
+
+    def classes(self):
+        """
+        :return: A list of dicts (owner, calls, own_seconds) - the functions grouped by the class (or module)
+        defining them, most own time first.
+        """
+        totals = {}
+        for row in self.functions():
+            total = totals.setdefault(row['owner'], {'owner': row['owner'], 'calls': 0, 'own_seconds': 0.0})
+            total['calls'] += row['calls']
+            total['own_seconds'] += row['own_seconds']
+        return sorted(totals.values(), key=lambda total: total['own_seconds'], reverse=True)
+
+    def dump_stats(self, filename):
+        """ Write the raw cProfile statistics - e.g. for snakeviz or pstats """
+        if self.profile is not None:
+            self.profile.dump_stats(filename)
+
+    def report(self, limit=15):
+        lines = ['Wall time %.3f s - %s requests, %s objects decoded' %
+                 (self.wall_time or 0.0, len(self.calls),
+                  sum(call.decoded for call in self.calls + [self.unattributed])),
+                 '%-10s %10s %8s %14s' % ('Phase', 'Seconds', 'Share', 'Allocated')]
+        phases = self.phases()
+        for phase in PHASES + ('other',):
+            if phase not in phases:
+                continue
+            seconds, allocated = phases[phase]
+            share = seconds / self.wall_time * 100 if self.wall_time else 0.0
+            lines.append('%-10s %10.3f %7.1f%% %14s' % (phase, seconds, share,
+                                                        '' if allocated is None else allocated))
+        if self.profile is not None:
+            lines.append('')
+            lines.append('%-50s %10s %10s' % ('Class', 'Calls', 'Seconds'))
+            for total in self.classes()[:limit]:
+                lines.append('%-50s %10s %10.3f' % (total['owner'], total['calls'], total['own_seconds']))
+            lines.append('')
+            lines.append('%-60s %10s %10s %10s' % ('Function', 'Calls', 'Own', 'Cumulative'))
+            for row in self.functions()[:limit]:
+                lines.append('%-60s %10s %10.3f %10.3f' % (row['function'][-60:], row['calls'], row['own_seconds'],
+                                                           row['cumulative_seconds']))
+        return '\n'.join(lines)
+
+
+def profile(cprofile=True, trace_memory=False):
+    """ Context manager profiling the SDK calls made within it - see Profiler """
+    return Profiler(cprofile=cprofile, trace_memory=trace_memory)
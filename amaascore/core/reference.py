@@ -1,11 +1,23 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
 
 
-class Reference(AMaaSModel):
+class ReferenceBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, reference_value, reference_primary=False, *args, **kwargs):
         self.reference_value = reference_value
         self.reference_primary = reference_primary
-        super(Reference, self).__init__(*args, **kwargs)
+        super(ReferenceBase, self).__init__(*args, **kwargs)
+
+
+class Reference(ReferenceBase, AMaaSModel):
+    pass
+
+
+class CompactReference(ReferenceBase):
+    """ A Reference without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('reference_value', 'reference_primary') + MODEL_SLOTS
@@ -0,0 +1,238 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from importlib import import_module
+
+from amaascore.core.decode_plan import decode_plan
+
+
+def import_path(path):
+    """ Import a class from its full dotted path - e.g. 'amaascore.assets.interface.AssetsInterface' """
+    module, name = path.rsplit('.', 1)
+    return getattr(import_module(module), name)
+
+
+class Registration(object):
+    """ Everything needed to handle one model type - its class, decode plan, children and interface. """
+
+    def __init__(self, registry, family, name, clazz):
+        self.registry = registry
+        self.family = family
+        self.name = name
+        self.clazz = clazz
+
+    @property
+    def plan(self):
+        return decode_plan(self.clazz)
+
+    @property
+    def id_attribute(self):
+        if (self.family, self.name) in self.registry.type_id_attributes:
+            return self.registry.type_id_attributes[(self.family, self.name)]
+        return self.registry.id_attributes.get(self.family)
+
+    @property
+    def client_ids(self):
+        """ Whether the client assigns the ID of a new object - rather than the service """
+        return self.family in self.registry.client_ids and self.id_attribute is not None
+
+    @property
+    def children(self):
+        return self.clazz.children() if hasattr(self.clazz, 'children') else {}
+
+    def interface(self):
+        """ The Interface class for this type's service - e.g. AssetsInterface """
+        return self.registry.interface(self.family)
+
+    def decode(self, json_object):
+        return self.plan.decode(json_object)
+
+
+class Registry(object):
+    """
+    Maps the type names used by the AMaaS services (e.g. an asset_type of 'Equity') to the classes which represent
+    them.  Types are grouped into families (e.g. 'asset'), each of which is handled by a single Interface.
+
+    Classes add themselves with the register decorator when their module is imported.  Each family also declares the
+    module defining each of its types, so that a module is only imported the first time one of its types is looked
+    up, rather than every model being imported up front.
+    """
+
+    def __init__(self):
+        self.registrations = {}
+        self.modules = {}
+        self.interfaces = {}
+        self.id_attributes = {}
+        self.type_id_attributes = {}
+        self.client_ids = set()
+        self.families = []
+
+    def declare(self, family, interface, modules, id_attribute=None, id_attributes=None, client_ids=False):
+        """
+        :param family: The name of the family - e.g. 'asset'.
+        :param interface: The full path of the Interface class which handles the family.
+        :param modules: A dict of type name to the module defining that type.
+        :param id_attribute: The attribute holding the ID of the family's objects - e.g. 'asset_id'.
+        :param id_attributes: A dict of type name to the attribute holding its ID (or None if it has none), for the
+        types whose ID is not id_attribute.
+        :param client_ids: Whether the client assigns the IDs of new objects - e.g. transaction_id, but not
+        asset_manager_id, which the service assigns.
+        """
+        if family not in self.families:
+            self.families.append(family)
+        self.interfaces[family] = interface
+        self.id_attributes[family] = id_attribute
+        self.type_id_attributes.update({(family, name): attribute for name, attribute in (id_attributes or {}).items()})
+        if client_ids:
+            self.client_ids.add(family)
+        self.modules.update({(family, name): module for name, module in modules.items()})
+
+    def register(self, family, name=None):
+        """ Class decorator registering the class as the type name (defaulting to the class name) in family. """
+        def decorator(clazz):
+            type_name = name or clazz.__name__
+            self.registrations[(family, type_name)] = Registration(self, family, type_name, clazz)
+            return clazz
+        return decorator
+
+    def lookup(self, family, name):
+        """
+        :return: The Registration for name within family - or None if it is not a known type.
+        """
+        registration = self.registrations.get((family, name))
+        if registration is None:
+            module = self.modules.get((family, name))
+            if module is None:
+                return None
+            clazz = getattr(import_module(module), name)
+            # Importing the module will normally have registered the class - but not if it is undecorated
+            if (family, name) not in self.registrations:
+                self.register(family, name)(clazz)
+            registration = self.registrations[(family, name)]
+        return registration
+
+    def lookup_name(self, name):
+        """
+        Look up a type name without knowing its family - e.g. for the csv uploader.  Where the same name is used in
+        more than one family, the family declared first wins.
+        """
+        for family in self.families:
+            registration = self.lookup(family, name)
+            if registration is not None:
+                return registration
+        return None
+
+    def subclasses(self, clazz):
+        """
+        The registered classes which are clazz or a subclass of it - e.g. every asset type for Asset.  This imports
+        every module of the families clazz is registered in.
+        """
+        families = [family for (family, _), registration in self.registrations.items() if registration.clazz is clazz]
+        classes = [clazz]
+        for family in families:
+            for name in self.names(family):
+                registration = self.lookup(family, name)
+                if issubclass(registration.clazz, clazz) and registration.clazz not in classes:
+                    classes.append(registration.clazz)
+        return classes
+
+    def base_class(self, clazz):
+        """
+        The most general registered class which clazz is, or derives from, in the same family - e.g. Asset for Fund,
+        or Transaction for CashTransaction.  Classes which are not registered are their own base class.
+        """
+        registrations = list(self.registrations.items())
+        families = set(family for (family, _), registration in registrations if registration.clazz is clazz)
+        for base in reversed(clazz.__mro__):
+            if any(registration.clazz is base and family in families for (family, _), registration in registrations):
+                return base
+        return clazz
+
+    def names(self, family):
+        return sorted(set(name for (type_family, name) in list(self.modules) + list(self.registrations)
+                          if type_family == family))
+
+    def interface(self, family):
+        return import_path(self.interfaces[family])
+
+
+registry = Registry()
+register = registry.register
+
+# Where a name is shared between families (e.g. Fund, AssetManager) lookup_name prefers the earlier family
+registry.declare('asset_manager', 'amaascore.asset_managers.interface.AssetManagersInterface', {
+    'AssetManager': 'amaascore.asset_managers.asset_manager',
+    'Relationship': 'amaascore.asset_managers.relationship',
+}, id_attribute='asset_manager_id', id_attributes={'Relationship': 'relationship_id'})
+registry.declare('party', 'amaascore.parties.interface.PartiesInterface', {
+    'AssetManager': 'amaascore.parties.asset_manager',
+    'Broker': 'amaascore.parties.broker',
+    'Company': 'amaascore.parties.company',
+    'Exchange': 'amaascore.parties.exchange',
+    'Fund': 'amaascore.parties.fund',
+    'GovernmentAgency': 'amaascore.parties.government_agency',
+    'Individual': 'amaascore.parties.individual',
+    'Organisation': 'amaascore.parties.organisation',
+    'Party': 'amaascore.parties.party',
+    'SubFund': 'amaascore.parties.sub_fund',
+}, id_attribute='party_id')
+registry.declare('asset', 'amaascore.assets.interface.AssetsInterface', {
+    'Asset': 'amaascore.assets.asset',
+    'Automobile': 'amaascore.assets.automobile',
+    'BondCorporate': 'amaascore.assets.bond',
+    'BondGovernment': 'amaascore.assets.bond',
+    'BondMortgage': 'amaascore.assets.bond',
+    'BondFuture': 'amaascore.assets.bond_future',
+    'BondFutureOption': 'amaascore.assets.bond_future_option',
+    'BondOption': 'amaascore.assets.bond_option',
+    'CommodityFuture': 'amaascore.assets.commodity_future',
+    'ContractForDifference': 'amaascore.assets.cfd',
+    'Cryptocurrency': 'amaascore.assets.cryptocurrency',
+    'Currency': 'amaascore.assets.currency',
+    'CustomAsset': 'amaascore.assets.custom_asset',
+    'Derivative': 'amaascore.assets.derivative',
+    'EnergyFuture': 'amaascore.assets.energy_future',
+    'Equity': 'amaascore.assets.equity',
+    'EquityFuture': 'amaascore.assets.equity_future',
+    'ExchangeTradedFund': 'amaascore.assets.etf',
+    'ForeignExchange': 'amaascore.assets.foreign_exchange',
+    'ForeignExchangeForward': 'amaascore.assets.foreign_exchange',
+    'ForeignExchangeSpot': 'amaascore.assets.foreign_exchange',
+    'ForeignExchangeFuture': 'amaascore.assets.fx_future',
+    'ForeignExchangeOption': 'amaascore.assets.fx_option',
+    'Fund': 'amaascore.assets.fund',
+    'Future': 'amaascore.assets.future',
+    'FutureOption': 'amaascore.assets.future_option',
+    'Index': 'amaascore.assets.index',
+    'IndexFuture': 'amaascore.assets.index_future',
+    'InterestRateFuture': 'amaascore.assets.interest_rate_future',
+    'ListedContractForDifference': 'amaascore.assets.listed_cfd',
+    'ListedDerivative': 'amaascore.assets.listed_derivative',
+    'PrivateInvestment': 'amaascore.assets.private_investment',
+    'RealAsset': 'amaascore.assets.real_asset',
+    'RealEstate': 'amaascore.assets.real_estate',
+    'Sukuk': 'amaascore.assets.sukuk',
+    'Synthetic': 'amaascore.assets.synthetic',
+    'SyntheticFromBook': 'amaascore.assets.synthetic_from_book',
+    'SyntheticMultiLeg': 'amaascore.assets.synthetic_multi_leg',
+    'Warrant': 'amaascore.assets.warrants',
+    'Wine': 'amaascore.assets.wine',
+}, id_attribute='asset_id', client_ids=True)
+registry.declare('book', 'amaascore.books.interface.BooksInterface', {
+    'Book': 'amaascore.books.book',
+}, id_attribute='book_id', client_ids=True)
+registry.declare('corporate_action', 'amaascore.corporate_actions.interface.CorporateActionsInterface', {
+    'CorporateAction': 'amaascore.corporate_actions.corporate_action',
+    'Dividend': 'amaascore.corporate_actions.dividend',
+    'Notification': 'amaascore.corporate_actions.notification',
+    'Split': 'amaascore.corporate_actions.split',
+}, id_attribute='corporate_action_id')
+registry.declare('market_data', 'amaascore.market_data.interface.MarketDataInterface', {
+    'EODPrice': 'amaascore.market_data.eod_price',
+    'FXRate': 'amaascore.market_data.fx_rate',
+    'Quote': 'amaascore.market_data.quote',
+})
+registry.declare('transaction', 'amaascore.transactions.interface.TransactionsInterface', {
+    'CashTransaction': 'amaascore.transactions.cash_transaction',
+    'Position': 'amaascore.transactions.position',
+    'Transaction': 'amaascore.transactions.transaction',
+}, id_attribute='transaction_id', id_attributes={'Position': None}, client_ids=True)
@@ -0,0 +1,212 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import timedelta
+import json
+import logging
+import os
+from os.path import expanduser, join
+import pytz
+from requests import HTTPError
+import sqlite3
+import sys
+import threading
+
+from amaascore.core.dates import parse_datetime
+from amaascore.core.registry import import_path, registry
+
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+# The reference data which can be synced, by the endpoint_type of its interface: (registry family, JSON decoder)
+SYNCABLE = {
+    'assets': ('asset', 'amaascore.assets.utils.json_to_asset'),
+    'books': ('book', 'amaascore.books.utils.json_to_book'),
+    'parties': ('party', 'amaascore.parties.utils.json_to_party'),
+}
+
+# Status codes with which a service rejects a filter it does not support
+UNSUPPORTED_FILTER_CODES = {400, 404, 422, 501}
+
+
+def to_utc(timestamp):
+    """ A naive UTC datetime for an updated_time - naive timestamps are assumed to already be in UTC """
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, type_check):
+        timestamp = parse_datetime(timestamp)
+    return timestamp.astimezone(pytz.utc).replace(tzinfo=None) if timestamp.tzinfo else timestamp
+
+
+class Replica(object):
+    """
+    A local copy of the reference data of one or more asset managers, held as JSON in a sqlite file along with the
+    watermark (the latest updated_time seen) of each.  Objects are merged by ID and version, so an older version never
+    overwrites a newer one - whichever order they arrive in.
+    """
+
+    def __init__(self, filename=None):
+        self.filename = filename or self.generate_filename()
+        self.lock = threading.Lock()
+        directory = os.path.dirname(self.filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        self.connection = sqlite3.connect(self.filename, timeout=30, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS objects (namespace TEXT, asset_manager_id INTEGER, '
+                                    'object_id TEXT, version INTEGER, value TEXT, '
+                                    'PRIMARY KEY (namespace, asset_manager_id, object_id))')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS watermarks (namespace TEXT, asset_manager_id INTEGER, '
+                                    'watermark TEXT, PRIMARY KEY (namespace, asset_manager_id))')
+
+    @staticmethod
+    def generate_filename():
+        return join(expanduser("~"), '.amaas', 'replica.sqlite')
+
+    def merge(self, namespace, asset_manager_id, records):
+        """
+        :param records: An iterable of (object ID, version, JSON).
+        :return: The number of objects added or updated.
+        """
+        merged = 0
+        with self.lock, self.connection:
+            for object_id, version, json_object in records:
+                value = json.dumps(json_object, ensure_ascii=False)
+                cursor = self.connection.execute('UPDATE objects SET version=?, value=? WHERE namespace=? AND '
+                                                 'asset_manager_id=? AND object_id=? AND version<?',
+                                                 (version, value, namespace, asset_manager_id, object_id, version))
+                if not cursor.rowcount:
+                    cursor = self.connection.execute('INSERT OR IGNORE INTO objects VALUES (?, ?, ?, ?, ?)',
+                                                     (namespace, asset_manager_id, object_id, version, value))
+                merged += cursor.rowcount
+        return merged
+
+    def replace(self, namespace, asset_manager_id, records):
+        """ Replace all of the asset manager's objects - e.g. after a full reload """
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM objects WHERE namespace=? AND asset_manager_id=?',
+                                    (namespace, asset_manager_id))
+        return self.merge(namespace, asset_manager_id, records)
+
+    def get(self, namespace, asset_manager_id, object_id):
+        with self.lock:
+            row = self.connection.execute('SELECT value FROM objects WHERE namespace=? AND asset_manager_id=? AND '
+                                          'object_id=?', (namespace, asset_manager_id, object_id)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def values(self, namespace, asset_manager_id):
+        with self.lock:
+            rows = self.connection.execute('SELECT value FROM objects WHERE namespace=? AND asset_manager_id=? '
+                                           'ORDER BY object_id', (namespace, asset_manager_id)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, namespace, asset_manager_id):
+        with self.lock:
+            return self.connection.execute('SELECT COUNT(*) FROM objects WHERE namespace=? AND asset_manager_id=?',
+                                           (namespace, asset_manager_id)).fetchone()[0]
+
+    def watermark(self, namespace, asset_manager_id):
+        with self.lock:
+            row = self.connection.execute('SELECT watermark FROM watermarks WHERE namespace=? AND asset_manager_id=?',
+                                          (namespace, asset_manager_id)).fetchone()
+        return to_utc(row[0]) if row and row[0] else None
+
+    def set_watermark(self, namespace, asset_manager_id, watermark):
+        with self.lock, self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)',
+                                    (namespace, asset_manager_id, watermark.isoformat() if watermark else None))
+
+    def close(self):
+        self.connection.close()
+
+
+class SyncResult(object):
+
+    def __init__(self, full, received, merged, watermark):
+        self.full = full
+        self.received = received
+        self.merged = merged
+        self.watermark = watermark
+
+    def __repr__(self):
+        return str(self.__dict__)
+
+
+class DeltaSync(object):
+    """
+    Keeps a Replica of an asset manager's assets, books or parties up to date.  Each sync searches only for the
+    objects updated since the watermark of the previous sync, and merges them into the replica.  The first sync - and
+    any sync against a service which cannot filter by updated_time - is a full reload via *_by_asset_manager.
+    """
+
+    def __init__(self, interface, replica, overlap=60, logger=None):
+        """
+        :param interface: An AssetsInterface, BooksInterface or PartiesInterface.
+        :param replica: The Replica to keep up to date.
+        :param overlap: The number of seconds before the watermark to search from, so that objects updated in the
+        same instant as the watermark (or written out of order by the service) are not missed.  Objects already in
+        the replica are merged by version, so fetching them again is harmless.
+        """
+        if interface.endpoint_type not in SYNCABLE:
+            raise ValueError('Cannot sync %s - only %s' % (interface.endpoint_type, ', '.join(sorted(SYNCABLE))))
+        self.interface = interface
+        self.replica = replica
+        self.overlap = timedelta(seconds=overlap)
+        self.logger = logger or logging.getLogger(__name__)
+        self.namespace = interface.endpoint_type
+        family, decoder = SYNCABLE[self.namespace]
+        self.id_attribute = registry.id_attributes[family]
+        self.decode = import_path(decoder)
+
+    def records(self, objects):
+        return [(getattr(obj, self.id_attribute), obj.version, obj.to_json()) for obj in objects]
+
+    def fetch_updated(self, asset_manager_id, since):
+        """
+        :return: The objects updated since the given time - or None if the service cannot filter by updated_time.
+        """
+        try:
+            objects = self.interface.search(asset_manager_id=asset_manager_id, updated_since=since) or []
+        except HTTPError as e:
+            if e.response is not None and e.response.status_code in UNSUPPORTED_FILTER_CODES:
+                return None
+            raise
+        # A service which ignores the filter returns everything - including objects not updated since
+        for obj in objects:
+            updated_time = to_utc(obj.updated_time)
+            if updated_time is None or updated_time < since:
+                return None
+        return objects
+
+    def sync(self, asset_manager_id, full=False):
+        """
+        :param asset_manager_id:
+        :param full: Reload everything, even if there is a watermark to sync from.
+        :return: A SyncResult.
+        """
+        watermark = None if full else self.replica.watermark(self.namespace, asset_manager_id)
+        objects = None
+        if watermark is not None:
+            objects = self.fetch_updated(asset_manager_id, since=watermark - self.overlap)
+            if objects is None:
+                self.logger.warning('Cannot filter %s by updated_time - falling back to a full reload', self.namespace)
+        full = objects is None
+        if full:
+            objects = getattr(self.interface, '%s_by_asset_manager' % self.namespace)(asset_manager_id) or []
+            merged = self.replica.replace(self.namespace, asset_manager_id, self.records(objects))
+        else:
+            merged = self.replica.merge(self.namespace, asset_manager_id, self.records(objects))
+        updated_times = [to_utc(obj.updated_time) for obj in objects if obj.updated_time is not None]
+        if watermark is not None:
+            updated_times.append(watermark)
+        new_watermark = max(updated_times) if updated_times else None
+        self.replica.set_watermark(self.namespace, asset_manager_id, new_watermark)
+        result = SyncResult(full=full, received=len(objects), merged=merged, watermark=new_watermark)
+        self.logger.info('Synced %s - Asset Manager: %s - %s', self.namespace, asset_manager_id, result)
+        return result
+
+    def objects(self, asset_manager_id):
+        """ All of the asset manager's objects in the replica """
+        return [self.decode(json_object) for json_object in self.replica.values(self.namespace, asset_manager_id)]
+
+    def get(self, asset_manager_id, object_id):
+        json_object = self.replica.get(self.namespace, asset_manager_id, object_id)
+        return self.decode(json_object) if json_object is not None else None
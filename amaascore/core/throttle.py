@@ -0,0 +1,127 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+import time
+
+try:
+    clock = time.monotonic
+except AttributeError:  # Python 2
+    clock = time.time
+
+# Responses meaning the service is shedding load
+THROTTLED_STATUSES = frozenset([429, 503])
+
+
+class TokenBucket(object):
+    """
+    Limits the rate of requests to rate per second, allowing bursts of up to capacity.  Each caller reserves a token
+    and then sleeps until it is due, so callers are served in the order they arrive.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        :param rate: The number of requests per second.
+        :param capacity: The largest burst - defaults to one second's worth of requests.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self.tokens = self.capacity
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """ Take tokens from the bucket, returning the number of seconds to wait until they are available """
+        with self.lock:
+            now = clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimit(object):
+    """
+    Limits the number of requests in flight, adjusting the limit AIMD style (as TCP does its congestion window): the
+    limit grows by one for every limit requests which complete promptly, and is cut by backoff_ratio when a request is
+    throttled (429/503) or its latency exceeds latency_tolerance times the fastest latency seen.  Bulk jobs therefore
+    settle at the highest concurrency the service sustains.
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=64, backoff_ratio=0.5, latency_tolerance=2.0):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.min_latency = None
+        self.last_decrease = None
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency, throttled=False):
+        """
+        :param latency: The number of seconds the request took.
+        :param throttled: Whether the service throttled the request.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if not throttled:
+                self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+            congested = throttled or latency > self.min_latency * self.latency_tolerance
+            if congested:
+                # Requests in flight together tend to be throttled together - only back off once per round trip
+                now = clock()
+                if self.last_decrease is None or now - self.last_decrease >= latency:
+                    self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                    self.last_decrease = now
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.condition.notify_all()
+
+
+class Throttle(object):
+    """
+    The client-side limits for requests to one service - a rate limit, an adaptive concurrency limit, or both.  Set one
+    on an interface with its throttle argument; every interface for the same service then shares it.
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None):
+        """
+        :param rate: The maximum number of requests per second.
+        :param burst: The largest burst of requests above rate.
+        :param concurrency: An AdaptiveConcurrencyLimit - or True for one with the default settings.
+        """
+        self.bucket = TokenBucket(rate, capacity=burst) if rate else None
+        self.concurrency = AdaptiveConcurrencyLimit() if concurrency is True else concurrency
+
+    def send(self, request):
+        """
+        :param request: A callable sending the request and returning the response.
+        :return: The response.
+        """
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        started = clock()
+        throttled = True  # A request which fails outright (e.g. a timeout) is treated as throttled
+        try:
+            if self.bucket is not None:
+                self.bucket.acquire()
+                started = clock()
+            response = request()
+            throttled = response.status_code in THROTTLED_STATUSES
+            return response
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release(clock() - started, throttled=throttled)
@@ -0,0 +1,114 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+from os.path import expanduser, join
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+@contextmanager
+def locked(lock_filename):
+    """ Hold an exclusive lock on lock_filename - this serialises access across processes as well as threads """
+    fd = os.open(lock_filename, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif msvcrt:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+class TokenCache(object):
+    """
+    A file backed cache of Cognito tokens, so that separate processes (and repeated runs of short scripts) logging in
+    as the same user can share tokens rather than each performing a full login.  The tokens are stored, readable only
+    by the current user, in ~/.amaas alongside the ~/.amaas.cfg config file.
+    """
+
+    def __init__(self, directory=None, filename='tokens.json'):
+        self.directory = directory or self.generate_directory()
+        self.filename = join(self.directory, filename)
+        self.lock_filename = self.filename + '.lock'
+
+    @staticmethod
+    def generate_directory():
+        home = expanduser("~")
+        return join(home, '.amaas')
+
+    @staticmethod
+    def generate_key(pool_id, username):
+        return '%s:%s' % (pool_id, username)
+
+    def ensure_directory(self):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+
+    def read(self):
+        try:
+            with open(self.filename) as token_file:
+                return json.load(token_file)
+        except (IOError, OSError, ValueError):
+            # A missing or corrupt cache is treated as empty
+            return {}
+
+    def write(self, entries):
+        # Write to a temporary file and then move it into place, so that readers never see a partial file
+        temp_filename = '%s.%s.tmp' % (self.filename, os.getpid())
+        fd = os.open(temp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token_file:
+            json.dump(entries, token_file)
+        if hasattr(os, 'replace'):
+            os.replace(temp_filename, self.filename)
+        else:  # Python 2
+            if os.name == 'nt' and os.path.exists(self.filename):
+                os.remove(self.filename)
+            os.rename(temp_filename, self.filename)
+
+    def load(self, key, max_age):
+        """
+        :param key: The key the tokens were stored under - see generate_key.
+        :param max_age: The age in seconds beyond which the tokens should no longer be used.
+        :return: A tuple of (tokens, the time they were issued), or (None, None) if there are no valid tokens.
+        """
+        self.ensure_directory()
+        with locked(self.lock_filename):
+            entry = self.read().get(key)
+        if not entry:
+            return None, None
+        issued = datetime.strptime(entry.get('issued'), DATETIME_FORMAT)
+        if (datetime.utcnow() - issued).total_seconds() >= max_age:
+            return None, None
+        return entry.get('tokens'), issued
+
+    def store(self, key, tokens, issued):
+        self.ensure_directory()
+        with locked(self.lock_filename):
+            entries = self.read()
+            entries[key] = {'tokens': tokens, 'issued': issued.strftime(DATETIME_FORMAT)}
+            self.write(entries)
+
+    def clear(self, key):
+        self.ensure_directory()
+        with locked(self.lock_filename):
+            entries = self.read()
+            if entries.pop(key, None) is not None:
+                self.write(entries)
@@ -0,0 +1,120 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import random
+from requests.adapters import HTTPAdapter
+from types import GeneratorType
+from urllib3.util.retry import Retry
+import zlib
+
+# Methods which can safely be sent again - a retried POST or PATCH could apply the same change twice
+IDEMPOTENT_METHODS = frozenset(['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'])
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class JitteredRetry(Retry):
+    """
+    A Retry which spreads its backoff uniformly between zero and the exponential backoff ("full jitter"), so that
+    many clients rejected at the same moment don't all retry at the same moment.  A Retry-After header sent with a
+    429 or 503 takes precedence over the backoff.
+    """
+
+    def get_backoff_time(self):
+        backoff = super(JitteredRetry, self).get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+def gzip_compressor():
+    return zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)  # 16 - write a gzip header and trailer
+
+
+def gzip_stream(chunks):
+    """ Generator gzipping a streamed request body chunk by chunk """
+    compressor = gzip_compressor()
+    for chunk in chunks:
+        compressed = compressor.compress(chunk.encode('utf-8') if not isinstance(chunk, bytes) else chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class TransportConfig(object):
+    """
+    The settings of the HTTP connections an Interface makes.  Interfaces created with the same TransportConfig share a
+    connection pool; the login tokens are shared by every Interface regardless.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, max_retries=3, backoff_factor=0.5,
+                 retry_statuses=RETRY_STATUSES, compress_requests=False, compress_threshold=1024, timeout=None):
+        """
+        :param pool_connections: The number of hosts to keep a connection pool for.
+        :param pool_maxsize: The maximum number of connections kept alive to each host - size this to the number of
+        threads making requests, or connections will be discarded and opened again.
+        :param pool_block: If True, a thread waits for a free connection rather than opening one beyond pool_maxsize.
+        :param max_retries: The number of times an idempotent request is retried after a connection error or one of the
+        retry_statuses.  0 disables retries.
+        :param backoff_factor: Retries wait (with jitter) up to backoff_factor * 2 ** (retry number - 1) seconds.
+        :param retry_statuses: The response statuses which are retried.
+        :param compress_requests: If True, gzip request bodies of at least compress_threshold bytes (and all streamed
+        bodies).  Responses are always decompressed.
+        :param compress_threshold: The size, in bytes, below which bodies are sent uncompressed.
+        :param timeout: The default (connect, read) timeout in seconds for each request - None waits forever.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = frozenset(retry_statuses)
+        self.compress_requests = compress_requests
+        self.compress_threshold = compress_threshold
+        self.timeout = timeout
+
+    def retry(self):
+        kwargs = {'total': self.max_retries, 'connect': self.max_retries, 'read': self.max_retries,
+                  'status': self.max_retries, 'backoff_factor': self.backoff_factor,
+                  'status_forcelist': self.retry_statuses, 'raise_on_status': False}
+        try:
+            return JitteredRetry(allowed_methods=IDEMPOTENT_METHODS, **kwargs)
+        except TypeError:  # urllib3 < 1.26
+            return JitteredRetry(method_whitelist=IDEMPOTENT_METHODS, **kwargs)
+
+    def adapter(self):
+        return HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                           pool_block=self.pool_block, max_retries=self.retry())
+
+    def mount(self, session):
+        """ Configure a requests Session to use this transport """
+        adapter = self.adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        return session
+
+    def prepare(self, kwargs):
+        """
+        Apply this transport to the keyword arguments of a request - its default timeout and, if compress_requests is
+        set, gzipping the body.
+        :return: The updated keyword arguments.
+        """
+        kwargs = dict(kwargs)
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        if not self.compress_requests:
+            return kwargs
+        headers = dict(kwargs.get('headers') or {})
+        if kwargs.get('json') is not None:
+            kwargs['data'] = json.dumps(kwargs.pop('json'), ensure_ascii=False).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        data = kwargs.get('data')
+        if isinstance(data, GeneratorType):
+            kwargs['data'] = gzip_stream(data)
+            headers['Content-Encoding'] = 'gzip'
+        elif isinstance(data, (bytes, type(''))) and len(data) >= self.compress_threshold:
+            compressor = gzip_compressor()
+            data = data.encode('utf-8') if not isinstance(data, bytes) else data
+            kwargs['data'] = compressor.compress(data) + compressor.flush()
+            headers['Content-Encoding'] = 'gzip'
+        if headers:
+            kwargs['headers'] = headers
+        return kwargs
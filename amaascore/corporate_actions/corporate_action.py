@@ -1,17 +1,19 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import datetime
-from dateutil.parser import parse
 import sys
 import uuid
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.dates import parse_date
 from amaascore.core.reference import Reference
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('corporate_action')
 class CorporateAction(AMaaSModel):
 
     @staticmethod
@@ -52,7 +54,7 @@ class CorporateAction(AMaaSModel):
         :return:
         """
         if value:
-            self._record_date = parse(value).date() if isinstance(value, type_check) else value
+            self._record_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def declared_date(self):
@@ -67,7 +69,7 @@ class CorporateAction(AMaaSModel):
         :return:
         """
         if value:
-            self._declared_date = parse(value).date() if isinstance(value, type_check) else value
+            self._declared_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def settlement_date(self):
@@ -82,4 +84,4 @@ class CorporateAction(AMaaSModel):
         :return:
         """
         if value:
-            self._settlement_date = parse(value).date() if isinstance(value, type_check) else value
+            self._settlement_date = parse_date(value) if isinstance(value, type_check) else value
@@ -2,9 +2,11 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from decimal import Decimal
 
+from amaascore.core.registry import register
 from amaascore.corporate_actions.corporate_action import CorporateAction
 
 
+@register('corporate_action')
 class Dividend(CorporateAction):
 
     def __init__(self, asset_manager_id, corporate_action_id, record_date, dividend_rate, dividend_asset_id,
@@ -9,10 +9,11 @@ from amaascore.corporate_actions.utils import json_to_corporate_action
 
 class CorporateActionsInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(CorporateActionsInterface, self).__init__(endpoint=endpoint, endpoint_type='corporate_actions',
-                                                        environment=environment, username=username, password=password)
+                                                        environment=environment,
+                                                        username=username, password=password, **kwargs)
 
     def new(self, corporate_action):
         self.logger.info('New Corporate Action - Asset Manager: %s - Corporate Action ID: %s',
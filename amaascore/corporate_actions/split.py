@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.corporate_actions.corporate_action import CorporateAction
 
 
+@register('corporate_action')
 class Split(CorporateAction):
 
     def __init__(self, asset_manager_id, corporate_action_id, record_date, ratio, corporate_action_status='Open',
@@ -1,73 +1,23 @@
 import logging.config
 import csv
 import json
+import os
 
-from amaascore.tools.csv_tools import csv_stream_to_objects
 from amaasutils.logging_utils import DEFAULT_LOGGING
-from amaascore.csv_upload.utils import process_normal, interface_direct_class, interface_direct_csvpath
+from amaascore.core.interface import iter_retrieve_many
+from amaascore.tools.csv_tools import objects_to_csv_stream
+from amaascore.csv_upload.pipeline import UploadPipeline
+from amaascore.csv_upload.utils import process_normal, interface_direct_class, interface_direct_csvpath, \
+    registration_direct_csvpath
 
-from amaascore.assets.asset import Asset
-from amaascore.assets.automobile import Automobile
-from amaascore.assets.bond import BondCorporate, BondGovernment, BondMortgage
-from amaascore.assets.bond_future import BondFuture
-from amaascore.assets.bond_future_option import BondFutureOption
-from amaascore.assets.bond_option import BondOption
-from amaascore.assets.commodity_future import CommodityFuture
-from amaascore.assets.cfd import ContractForDifference
-from amaascore.assets.currency import Currency
-from amaascore.assets.custom_asset import CustomAsset
-from amaascore.assets.derivative import Derivative
-from amaascore.assets.energy_future import EnergyFuture
-from amaascore.assets.equity import Equity
-from amaascore.assets.equity_future import EquityFuture
-from amaascore.assets.etf import ExchangeTradedFund
-from amaascore.assets.foreign_exchange import ForeignExchange, NonDeliverableForward
-from amaascore.assets.fund import Fund
-from amaascore.assets.future import Future
-from amaascore.assets.future_option import FutureOption
-from amaascore.assets.fx_future import ForeignExchangeFuture
-from amaascore.assets.fx_option import ForeignExchangeOption
-from amaascore.assets.index import Index
-from amaascore.assets.index_future import IndexFuture
-from amaascore.assets.interest_rate_future import InterestRateFuture
-from amaascore.assets.listed_cfd import ListedContractForDifference
-from amaascore.assets.listed_derivative import ListedDerivative
-from amaascore.assets.option_mixin import OptionMixin
-from amaascore.assets.real_asset import RealAsset
-from amaascore.assets.real_estate import RealEstate
-from amaascore.assets.sukuk import Sukuk
-from amaascore.assets.synthetic import Synthetic
-from amaascore.assets.synthetic_from_book import SyntheticFromBook
-from amaascore.assets.synthetic_multi_leg import SyntheticMultiLeg
-from amaascore.assets.wine import Wine
-from amaascore.assets.warrants import Warrant
+from amaascore.core.registry import registry
 
-from amaascore.parties.broker import Broker
-from amaascore.parties.company import Company
-from amaascore.parties.exchange import Exchange
-from amaascore.parties.fund import Fund
-from amaascore.parties.government_agency import GovernmentAgency
-from amaascore.parties.individual import Individual
-from amaascore.parties.organisation import Organisation
-from amaascore.parties.party import Party
-from amaascore.parties.sub_fund import SubFund
 
-from amaascore.books.book import Book
+def file_fingerprint(path):
+    """ The size and modification time of a file - which change whenever the file is edited """
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime]
 
-from amaascore.corporate_actions.corporate_action import CorporateAction
-from amaascore.corporate_actions.dividend import Dividend
-from amaascore.corporate_actions.notification import Notification
-from amaascore.corporate_actions.split import Split
-
-from amaascore.market_data.eod_price import EODPrice
-from amaascore.market_data.fx_rate import FXRate
-from amaascore.market_data.quote import Quote
-
-from amaascore.transactions.position import Position
-from amaascore.transactions.transaction import Transaction
-
-from amaascore.asset_managers.asset_manager import AssetManager
-from amaascore.asset_managers.relationship import Relationship
 
 class Uploader(object):
 
@@ -81,14 +31,21 @@ class Uploader(object):
             Dict[key]=var
         data_class = Dict.get('amaasclass', None)
         Dict = process_normal(Dict)
-        obj = globals()[data_class](**dict(Dict))
+        obj = registry.lookup_name(data_class).clazz(**dict(Dict))
         return obj
 
     @staticmethod
-    def upload(csvpath, asset_manager_id=None, client_id=None):
-        """convert csv file rows to objects and insert;
-           asset_manager_id and possibly client_id from the UI (login)"""
+    def upload(csvpath, asset_manager_id=None, client_id=None, batch_size=500, max_in_flight=4, parse_workers=0,
+               reject_path=None, journal_path=None):
+        """convert csv file rows to objects and insert in batches;
+           asset_manager_id and possibly client_id from the UI (login).
+           Rows which fail are written to reject_path, if given, and otherwise logged.  If journal_path is given,
+           completed batches are recorded in it - re-running an interrupted upload of the same, unchanged file skips
+           them, and any rows without client-assigned IDs are given the same IDs as in the first run, so nothing is
+           created twice.  If the file has changed (e.g. its rejected rows have been fixed) it is uploaded in full.
+           See UploadPipeline for the remaining parameters."""
         interface = interface_direct_csvpath(csvpath)
+        registration = registration_direct_csvpath(csvpath)
         logging.config.dictConfig(DEFAULT_LOGGING)
         logger = logging.getLogger(__name__)
         if asset_manager_id is None:
@@ -97,21 +54,52 @@ class Uploader(object):
             params = {'asset_manager_id': asset_manager_id}
         else:
             params = {'asset_manager_id': asset_manager_id, 'client_id': client_id}
+        pipeline = UploadPipeline(interface=interface, json_handler=Uploader.json_handler, params=params,
+                                  batch_size=batch_size, max_in_flight=max_in_flight, parse_workers=parse_workers,
+                                  reject_path=reject_path, journal_path=journal_path,
+                                  id_attribute=registration.id_attribute if registration else None,
+                                  generate_ids=registration.client_ids if registration else False,
+                                  source=os.path.abspath(csvpath), fingerprint=file_fingerprint(csvpath),
+                                  logger=logger)
         with open(csvpath) as csvfile:
-            objs = csv_stream_to_objects(stream=csvfile, json_handler=Uploader.json_handler, params=params)
-        for obj in objs:
-            interface.new(obj)
-            logger.info('Creating this object and upload to database successfully')
+            progress = pipeline.run(csvfile)
+        logger.info('Uploaded %s objects from %s - %s rows rejected, %s rows already uploaded', progress.created,
+                    csvpath, progress.rejected, progress.skipped)
+        return progress
 
     @staticmethod
-    def download(csvpath, asset_manager_id, data_id_type, data_id_list):
-        """retrieve the objs mainly for test purposes"""
+    def download(csvpath, asset_manager_id, data_id_type, data_id_list, export_path=None, chunk_size=100,
+                 max_workers=4):
+        """retrieve the objs by batching the IDs into searches (e.g. search(asset_ids=...) for an asset_id),
+           with max_workers searches running concurrently.
+           If export_path is given, the objs are written to that csv file as each search completes, and the number
+           written is returned - otherwise the list of objs is returned."""
         interface = interface_direct_csvpath(csvpath)
+        registration = registration_direct_csvpath(csvpath)
         logging.config.dictConfig(DEFAULT_LOGGING)
         logger = logging.getLogger(__name__)
-        objs = []
-        for data_id in data_id_list:
-            Dict = dict()
-            Dict[data_id_type] = data_id
-            objs.append(interface.retrieve(asset_manager_id=asset_manager_id, **Dict))
-        return objs
\ No newline at end of file
+        search_argument = data_id_type + 's'
+
+        def search(chunk):
+            return interface.search(asset_manager_id=asset_manager_id, **{search_argument: chunk})
+
+        def objs():
+            for chunk, found, error in iter_retrieve_many(search=search, ids=data_id_list, chunk_size=chunk_size,
+                                                          max_workers=max_workers,
+                                                          executor=interface.session.executor):
+                if error is not None:
+                    logger.error('Failed to retrieve %s: %s', ', '.join(chunk), error)
+                    continue
+                missing = set(chunk) - set(getattr(obj, data_id_type) for obj in found)
+                if missing:
+                    logger.warning('Not found: %s', ', '.join(sorted(missing)))
+                for obj in found:
+                    yield obj
+
+        if export_path is None:
+            return list(objs())
+        with open(export_path, 'w') as csvfile:
+            count = objects_to_csv_stream(objects=objs(), stream=csvfile,
+                                          clazz=registration.clazz if registration else None)
+        logger.info('Exported %s objects to %s', count, export_path)
+        return count
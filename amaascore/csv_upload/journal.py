@@ -0,0 +1,86 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import os
+
+
+class UploadJournal(object):
+    """
+    An append-only record of the batches an upload has completed, written as one line of JSON per batch:
+
+        {"batch_size": 500, "source": "/path/to/transactions.csv", "fingerprint": [1048576, 1508112000.0]}
+        {"first_row": 1, "last_row": 500, "ids": ["...", ...], "rejected": [17]}
+
+    The first line records how the csv was split into batches, so that a restarted upload splits it identically and
+    can skip the batches already completed.  The fingerprint (e.g. the size and modification time of the csv) detects
+    a csv which has changed since the journal was started - e.g. to fix the rejected rows - so that it is uploaded
+    again in full rather than its batches being skipped.  Each line is flushed and synced as its batch completes - a line torn by a
+    crash is ignored, and its batch simply runs again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.batch_size = None
+        self.source = None
+        self.fingerprint = None
+        self.completed = {}
+
+    def load(self):
+        """ Read the existing journal, if any - returning the completed batches keyed by first row """
+        self.completed = {}
+        if not os.path.exists(self.path):
+            return self.completed
+        with open(self.path) as journal_file:
+            for line in journal_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if 'batch_size' in entry:
+                    self.batch_size = entry['batch_size']
+                    self.source = entry.get('source')
+                    self.fingerprint = entry.get('fingerprint')
+                else:
+                    self.completed[entry['first_row']] = entry
+        return self.completed
+
+    def open(self, batch_size, source=None, fingerprint=None):
+        """
+        Start (or continue) journalling.  If the journal was already started for the same source and fingerprint, its
+        batch size takes precedence - a journal for a different (or changed) source is discarded.
+
+        :return: The batch size to use.
+        """
+        self.load()
+        if self.batch_size is not None and (self.source != source or self.fingerprint != fingerprint):
+            self.batch_size = None
+            self.completed = {}
+        if self.batch_size is None:
+            self.batch_size = batch_size
+            self.source = source
+            self.fingerprint = fingerprint
+            self.file = open(self.path, 'w')
+            self.write({'batch_size': batch_size, 'source': source, 'fingerprint': fingerprint})
+        else:
+            self.file = open(self.path, 'a')
+        return self.batch_size
+
+    def write(self, entry):
+        self.file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def record(self, first_row, last_row, ids, rejected):
+        """
+        :param ids: The IDs of the objects created from the batch.
+        :param rejected: The row numbers of the rows rejected from the batch.
+        """
+        entry = {'first_row': first_row, 'last_row': last_row, 'ids': ids, 'rejected': rejected}
+        self.completed[first_row] = entry
+        self.write(entry)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
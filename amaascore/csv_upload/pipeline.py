@@ -0,0 +1,254 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import csv
+from itertools import islice
+import logging
+import uuid
+
+from amaascore.csv_upload.journal import UploadJournal
+
+REJECT_FIELDS = ['row', 'error']
+
+
+def deterministic_id(source, row_number, row):
+    """ An ID derived from the row's content and position, so that it is the same every time the row is uploaded """
+    content = '%s:%s:%s' % (source, row_number, sorted(row.items()))
+    return uuid.uuid5(uuid.NAMESPACE_URL, content).hex
+
+
+def object_id(obj, id_attribute):
+    """ create_many returns objects from some services, and raw JSON from others """
+    return obj.get(id_attribute) if isinstance(obj, dict) else getattr(obj, id_attribute, None)
+
+
+def parse_rows(json_handler, params, rows, id_attribute=None, source=None):
+    """
+    Convert a chunk of csv rows to objects.  This runs in the parse pool, so must be a module level function.
+
+    :param id_attribute: If given, rows without an ID are given a deterministic one, so that creating the same row
+    twice does not result in two objects.
+    :return: A tuple of (a list of (row number, object), a list of (row number, row, error)).
+    """
+    parsed, rejects = [], []
+    for row_number, row in rows:
+        try:
+            if id_attribute and not row.get(id_attribute) and not params.get(id_attribute):
+                row = dict(row)
+                row[id_attribute] = deterministic_id(source, row_number, row)
+            parsed.append((row_number, json_handler(row, params)))
+        except Exception as e:
+            rejects.append((row_number, row, 'Invalid row: %s' % e))
+    return parsed, rejects
+
+
+class Batch(object):
+
+    def __init__(self, first_row, last_row, rows):
+        self.first_row = first_row
+        self.last_row = last_row
+        self.rows = rows
+        self.created = 0
+        self.ids = []
+        self.rejects = []
+
+
+class UploadProgress(object):
+    """ The running totals of an upload.  Skipped counts the rows in batches completed by an earlier run. """
+
+    def __init__(self):
+        self.created = 0
+        self.rejected = 0
+        self.skipped = 0
+
+
+class RejectFile(object):
+    """ A csv file of the rejected rows, with the row number and error preceding the original columns """
+
+    def __init__(self, path, append=False):
+        self.file = open(path, 'a' if append else 'w')
+        self.writer = None
+
+    def write(self, rejects):
+        for row_number, row, error in rejects:
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.file, fieldnames=REJECT_FIELDS + list(row), extrasaction='ignore')
+                if self.file.tell() == 0:
+                    self.writer.writeheader()
+            self.writer.writerow(dict(row, row=row_number, error=error))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class UploadPipeline(object):
+    """
+    Uploads a csv stream of any size in bounded memory.  Rows are read lazily, parsed into objects (optionally on a
+    pool of processes) and sent to the interface's create_many in batches, with several batches in flight at once.
+    At most max_in_flight batches of rows are held in memory at any time.
+
+    A row which cannot be parsed, or which the service rejects, is written to the reject file along with the error
+    rather than failing the upload.  Where a whole batch is rejected its objects are retried one by one, so that only
+    the failing rows are rejected.  Rejects are written in row order, whichever order the batches finish in.
+
+    Given a journal, each completed batch is recorded as it finishes, and re-running the same upload with the same
+    journal skips the batches already completed.  Batches which were in flight when the upload stopped are sent again,
+    so the objects are created idempotently: with generate_ids, rows without an ID are given a deterministic one, and
+    interfaces which support upserts are called with upsert=True.
+    """
+
+    def __init__(self, interface, json_handler, params=None, batch_size=500, max_in_flight=4, parse_workers=0,
+                 reject_path=None, journal_path=None, id_attribute=None, generate_ids=False, source=None, fingerprint=None,
+                 upsert=None, logger=None):
+        """
+        :param interface: The Interface to create the objects with.  If it has no create_many, objects are created
+        one at a time.
+        :param json_handler: A function converting a csv row (and params) to an object.
+        :param params: A dict of extra values added to every row - e.g. asset_manager_id.
+        :param batch_size: The maximum number of objects sent in a single create_many request.
+        :param max_in_flight: The maximum number of batches being parsed or sent at once.
+        :param parse_workers: The number of processes to parse rows with.  If 0, rows are parsed on the sending
+        threads, which is sufficient unless parsing rather than the network is the bottleneck.
+        :param reject_path: The csv file to write rejected rows to - if not given, they are logged.
+        :param journal_path: The file recording the completed batches - see UploadJournal.
+        :param id_attribute: The attribute holding the objects' IDs - e.g. 'transaction_id'.
+        :param generate_ids: Give rows without an ID a deterministic one.  Only set this where the client assigns the
+        IDs of new objects (see Registration.client_ids) - never for an ID the service assigns, such as
+        asset_manager_id.
+        :param source: A name for the csv (e.g. its path), from which deterministic IDs are derived.
+        :param fingerprint: A JSON serializable value which changes when the csv does (e.g. its size and modification
+        time) - a journal started with a different fingerprint is discarded.
+        :param upsert: Whether to upsert rather than create the objects.  Defaults to whether the interface has an
+        upsert method.
+        """
+        self.interface = interface
+        self.json_handler = json_handler
+        self.params = params or {}
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.parse_workers = parse_workers
+        self.reject_path = reject_path
+        self.journal = UploadJournal(journal_path) if journal_path else None
+        self.id_attribute = id_attribute
+        self.generate_ids = generate_ids
+        self.source = source
+        self.fingerprint = fingerprint
+        self.upsert = hasattr(interface, 'upsert') if upsert is None else upsert
+        self.logger = logger or logging.getLogger(__name__)
+
+    def batches(self, stream, batch_size):
+        """ Generator of Batches of (row number, row) """
+        rows = ((row_number, dict(row)) for row_number, row in enumerate(csv.DictReader(stream), 1))
+        while True:
+            chunk = list(islice(rows, batch_size))
+            if not chunk:
+                return
+            yield Batch(first_row=chunk[0][0], last_row=chunk[-1][0], rows=chunk)
+
+    def create(self, objects):
+        if hasattr(self.interface, 'create_many'):
+            if self.upsert:
+                return self.interface.create_many(objects, upsert=True)
+            return self.interface.create_many(objects)
+        create = self.interface.upsert if self.upsert else self.interface.new
+        return [create(obj) for obj in objects]
+
+    def created(self, batch, objects, results):
+        batch.created += len(objects)
+        if self.id_attribute:
+            # Prefer the IDs the service returned, but not every create_many returns the created objects
+            returned = results if isinstance(results, list) and len(results) == len(objects) else objects
+            batch.ids.extend(object_id(obj, self.id_attribute) for obj in returned)
+
+    def parse(self, rows):
+        return parse_rows(self.json_handler, self.params, rows, id_attribute=self.generated_id_attribute,
+                          source=self.source)
+
+    @property
+    def generated_id_attribute(self):
+        return self.id_attribute if self.generate_ids else None
+
+    def send(self, batch, parsed):
+        """ Create the parsed objects of the batch - runs on the sending threads """
+        parsed, rejects = self.parse(batch.rows) if parsed is None else parsed.result()
+        batch.rejects.extend(rejects)
+        rows = dict(batch.rows)
+        # create_many requires every object in a request to belong to the same asset manager
+        groups = OrderedDict()
+        for row_number, obj in parsed:
+            groups.setdefault(getattr(obj, 'asset_manager_id', None), []).append((row_number, obj))
+        for group in groups.values():
+            objects = [obj for _, obj in group]
+            try:
+                self.created(batch, objects, self.create(objects))
+                continue
+            except Exception as e:
+                self.logger.warning('Batch starting at row %s failed, retrying individually: %s', batch.first_row, e)
+            for row_number, obj in group:
+                try:
+                    self.created(batch, [obj], self.create([obj]))
+                except Exception as e:
+                    batch.rejects.append((row_number, rows[row_number], str(e)))
+        batch.rows = None  # Release the rows as soon as possible
+        return batch
+
+    def run(self, stream):
+        """
+        :param stream: A stream of csv text, with a header row.
+        :return: An UploadProgress.
+        """
+        progress = UploadProgress()
+        batch_size = self.batch_size
+        completed = {}
+        if self.journal:
+            batch_size = self.journal.open(batch_size=self.batch_size, source=self.source,
+                                           fingerprint=self.fingerprint)
+            completed = self.journal.completed
+            if completed:
+                self.logger.info('Resuming upload - %s batches already completed', len(completed))
+        parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers else None
+        send_pool = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        reject_file = RejectFile(self.reject_path, append=bool(completed)) if self.reject_path else None
+        in_flight = deque()  # Collected oldest first, so that rejects and the journal are written in row order
+
+        def collect(future):
+            batch = future.result()
+            batch.rejects.sort(key=lambda reject: reject[0])
+            progress.created += batch.created
+            progress.rejected += len(batch.rejects)
+            if reject_file:
+                reject_file.write(batch.rejects)
+            else:
+                for row_number, _, error in batch.rejects:
+                    self.logger.warning('Row %s rejected: %s', row_number, error)
+            if self.journal:
+                self.journal.record(batch.first_row, batch.last_row, batch.ids,
+                                    sorted(row_number for row_number, _, _ in batch.rejects))
+
+        try:
+            for batch in self.batches(stream, batch_size):
+                if batch.first_row in completed:
+                    progress.skipped += len(batch.rows)
+                    continue
+                if len(in_flight) >= self.max_in_flight:
+                    collect(in_flight.popleft())
+                parsed = None
+                if parse_pool:
+                    parsed = parse_pool.submit(parse_rows, self.json_handler, self.params, batch.rows,
+                                               self.generated_id_attribute, self.source)
+                in_flight.append(send_pool.submit(self.send, batch, parsed))
+            while in_flight:
+                collect(in_flight.popleft())
+        finally:
+            send_pool.shutdown(wait=True)
+            if parse_pool:
+                parse_pool.shutdown(wait=True)
+            if reject_file:
+                reject_file.close()
+            if self.journal:
+                self.journal.close()
+        self.logger.info('Upload complete - %s created, %s rejected, %s skipped', progress.created, progress.rejected,
+                         progress.skipped)
+        return progress
@@ -1,32 +1,34 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import logging
 
 from amaascore.config import ENVIRONMENT
+from amaascore.core.dates import parse_date
 from amaascore.core.interface import Interface
 
 
 class FundamentalsInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         logger = logger or logging.getLogger(__name__)
         super(FundamentalsInterface, self).__init__(endpoint=endpoint,
                                                     endpoint_type='fundamentals',
                                                     environment=environment,
                                                     username=None, 
                                                     password=None,
-                                                    logger=logger)
+                                                    logger=logger, **kwargs)
 
     def countries(self, country_code=None):
         log_msg = 'Get Country: %s' % country_code if country_code else 'Get All Countries'
         self.logger.info(log_msg)
         url = '%s/countries' % self.endpoint
         params = {'country_code': country_code} if country_code else {}
-        response = self.session.get(url, params=params)
+        response, countries = self.session.get_conditional(url, response_store=self.response_store,
+                                                            decode=lambda json_countries: json_countries,
+                                                            params=params)
         if response.ok:
             self.logger.info('Successfully retrieved country(s)')
-            return response.json()
+            return countries
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -38,11 +40,11 @@ class FundamentalsInterface(Interface):
         url = '%s/holidays' % self.endpoint
         params = {'country_codes': country_codes,
                   'years': years}
-
-        response = self.session.get(url, params=params)
+        response, holidays = self.session.get_conditional(url, response_store=self.response_store,
+                                                           decode=lambda json_holidays: json_holidays, params=params)
         if response.ok:
             self.logger.info('Successfully retrieved holidays')
-            return response.json()
+            return holidays
         else:
             self.logger.error(response.text)
             response.raise_for_status()
@@ -59,7 +61,7 @@ class FundamentalsInterface(Interface):
         if response.ok:
             self.logger.info('Successfully calculated business date')
             business_date = response.json().get('business_date')
-            business_date = parse(business_date).date()
+            business_date = parse_date(business_date)
             return business_date
         else:
             self.logger.error(response.text)
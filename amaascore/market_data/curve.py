@@ -1,13 +1,13 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date, datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 import pytz
 import json
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.dates import parse_date, parse_datetime
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -98,7 +98,7 @@ class Curve(AMaaSModel):
         if curve_timestamp is not None:
             curve_timestamp = str(curve_timestamp)
             if isinstance(curve_timestamp, str):
-                curve_timestamp = parse(curve_timestamp).replace(tzinfo=pytz.utc)
+                curve_timestamp = parse_datetime(curve_timestamp).replace(tzinfo=pytz.utc)
             if type(curve_timestamp) == date:
                 curve_timestamp = datetime.combine(curve_timestamp, datetime.min.time()).replace(tzinfo=pytz.utc)
             if not curve_timestamp.tzinfo:
@@ -120,6 +120,6 @@ class Curve(AMaaSModel):
         """
         if business_date is not None:
             if isinstance(business_date, str):
-                self._business_date = parse(business_date).date()
+                self._business_date = parse_date(business_date)
             else:
                 self._business_date= business_date   
\ No newline at end of file
@@ -1,17 +1,20 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
-class EODPrice(AMaaSModel):
+class EODPriceBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, asset_manager_id, asset_id, business_date, price, active=True, *args, **kwargs):
         """
@@ -27,7 +30,7 @@ class EODPrice(AMaaSModel):
         self.price = price
         self.business_date = business_date
         self.active = active
-        super(EODPrice, self).__init__(*args, **kwargs)
+        super(EODPriceBase, self).__init__(*args, **kwargs)
 
     @property
     def price(self):
@@ -56,6 +59,17 @@ class EODPrice(AMaaSModel):
         """
         if business_date is not None:
             if isinstance(business_date, type_check):
-                self._business_date = parse(business_date).date()
+                self._business_date = parse_date(business_date)
             else:
                 self._business_date = business_date
+
+
+@register('market_data')
+class EODPrice(EODPriceBase, AMaaSModel):
+    pass
+
+
+class CompactEODPrice(EODPriceBase):
+    """ A EODPrice without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'asset_id', '_price', '_business_date', 'active') + MODEL_SLOTS
@@ -1,18 +1,21 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from datetime import date, datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import pytz
 import sys
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
+from amaascore.core.dates import parse_date, parse_datetime
+from amaascore.core.registry import register
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
-class FXRate(AMaaSModel):
+class FXRateBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, asset_manager_id, asset_id, business_date, rate_timestamp, rate, rate_type, active=True,
                  *args, **kwargs):
@@ -33,7 +36,7 @@ class FXRate(AMaaSModel):
         self.rate_type = rate_type
         self.rate = rate
         self.active = active
-        super(FXRate, self).__init__(*args, **kwargs)
+        super(FXRateBase, self).__init__(*args, **kwargs)
 
     @property
     def rate(self):
@@ -62,7 +65,7 @@ class FXRate(AMaaSModel):
         """
         if business_date is not None:
             if isinstance(business_date, type_check):
-                self._business_date = parse(business_date).date()
+                self._business_date = parse_date(business_date)
             else:
                 self._business_date= business_date
 
@@ -79,9 +82,21 @@ class FXRate(AMaaSModel):
         """
         if rate_timestamp is not None:
             if isinstance(rate_timestamp, (str, type_check)):
-                rate_timestamp = parse(rate_timestamp).replace(tzinfo=pytz.utc)
+                rate_timestamp = parse_datetime(rate_timestamp).replace(tzinfo=pytz.utc)
             if type(rate_timestamp) == date:
                 rate_timestamp = datetime.combine(rate_timestamp, datetime.min.time()).replace(tzinfo=pytz.utc)
             if not rate_timestamp.tzinfo:
                 raise ValueError('Cannot set an FX rate timestamp without a timezone')
             self._rate_timestamp = rate_timestamp
+
+
+@register('market_data')
+class FXRate(FXRateBase, AMaaSModel):
+    pass
+
+
+class CompactFXRate(FXRateBase):
+    """ A FXRate without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'asset_id', '_business_date', '_rate_timestamp', 'rate_type',
+                 '_rate', 'active') + MODEL_SLOTS
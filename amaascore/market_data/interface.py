@@ -5,31 +5,38 @@ import logging
 
 from amaascore.config import ENVIRONMENT
 from amaascore.core.amaas_model import json_handler
-from amaascore.core.interface import Interface
+from amaascore.core.interface import Interface, json_stream
 from amaascore.market_data.utils import json_to_eod_price, json_to_fx_rate, json_to_curve
 
 
 class MarketDataInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(MarketDataInterface, self).__init__(endpoint=endpoint, endpoint_type='market_data',
-                                                  environment=environment, username=username, password=password)
+                                                  environment=environment,
+                                                  username=username, password=password, **kwargs)
 
-    def persist_eod_prices(self, asset_manager_id, business_date, eod_prices, update_existing_prices=True):
+    def persist_eod_prices(self, asset_manager_id, business_date, eod_prices, update_existing_prices=True,
+                           stream=False):
         """
 
         :param asset_manager_id:
         :param business_date: The business date for which these are rates.  Not really needed, could be derived...
         :param eod_prices:
         :param update_existing_prices:
+        :param stream: If True, each price is encoded as the request body is sent, rather than encoding the whole
+        list up front.
         :return:
         """
         self.logger.info('Persist EOD Prices - Asset Manager: %s - Business Date: %s', asset_manager_id, business_date)
         url = '%s/eod-prices/%s/%s' % (self.endpoint, asset_manager_id, business_date.isoformat())
         params = {'update_existing_prices': update_existing_prices}
-        eod_prices_json = [eod_price.to_interface() for eod_price in eod_prices]
-        response = self.session.post(url, params=params, json=eod_prices_json)
+        if stream:
+            response = self.session.post(url, params=params, data=json_stream(eod_prices), headers=self.json_header)
+        else:
+            eod_prices_json = [eod_price.to_interface() for eod_price in eod_prices]
+            response = self.session.post(url, params=params, json=eod_prices_json)
         if response.ok:
             eod_prices = [json_to_eod_price(eod_price) for eod_price in response.json()]
             return eod_prices
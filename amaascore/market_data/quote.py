@@ -1,14 +1,17 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 
+from amaascore.core.dates import parse_datetime
+from amaascore.core.registry import register
+
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('market_data')
 class Quote(object):
 
     def __init__(self, asset_manager_id, asset_id, quote_datetime, bid=None, ask=None):
@@ -31,7 +34,7 @@ class Quote(object):
         """
         if value:
             if isinstance(value, type_check):
-                self._quote_datetime = parse(value)
+                self._quote_datetime = parse_datetime(value)
             elif isinstance(value, datetime.datetime):
                 self._quote_datetime = value
 
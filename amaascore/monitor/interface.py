@@ -9,10 +9,10 @@ from amaascore.monitor.utils import json_to_item
 
 class MonitorInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(MonitorInterface, self).__init__(endpoint=endpoint, endpoint_type='monitor', 
-                                               environment=environment, username=None, password=None)
+                                               environment=environment, username=None, password=None, **kwargs)
 
     def new_item(self, item):
         url = '%s/items/%s' % (self.endpoint, item.asset_manager_id)
@@ -1,10 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import sys
 import uuid
 
 from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.dates import parse_date
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
@@ -43,4 +43,4 @@ class Item(AMaaSModel):
         :return:
         """
         if item_date:
-            self._item_date = parse(item_date).date() if isinstance(item_date, type_check) else item_date
+            self._item_date = parse_date(item_date) if isinstance(item_date, type_check) else item_date
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.instrumentation import instrument_decoder
 from amaascore.monitor.item import Item
 
 
+@instrument_decoder
 def json_to_item(json_item):
     item = Item(**json_item)
     return item
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.parties.company import Company
 
 
+@register('party')
 class AssetManager(Company):
     """
     This represents a Company engaged in Asset Management activity.
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.parties.company import Company
 
 
+@register('party')
 class Broker(Company):
 
     def __init__(self, asset_manager_id, party_id, base_currency=None, display_name='', legal_name='', url='',  description='', party_status='Active',
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.parties.organisation import Organisation
 
 
+@register('party')
 class Company(Organisation):
     """
     Represents a legal entity that has incorporated in a jurisdiction.  Does not specifiy
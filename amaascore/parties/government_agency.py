@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.parties.organisation import Organisation
 
 
+@register('party')
 class GovernmentAgency(Organisation):
 
     def __init__(self, asset_manager_id, party_id, description='', party_status='Active', 
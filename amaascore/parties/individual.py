@@ -1,14 +1,16 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from dateutil.parser import parse
 import sys
 
+from amaascore.core.dates import parse_date
+from amaascore.core.registry import register
 from amaascore.parties.party import Party
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('party')
 class Individual(Party):
 
     def __init__(self, asset_manager_id, party_id, given_names='', surname='', date_of_birth=None, base_currency=None,
@@ -40,4 +42,4 @@ class Individual(Party):
         :return:
         """
         if value:
-            self._date_of_birth = parse(value).date() if isinstance(value, type_check) else value
+            self._date_of_birth = parse_date(value) if isinstance(value, type_check) else value
@@ -5,19 +5,19 @@ import logging
 
 from amaascore.config import ENVIRONMENT
 from amaascore.core.amaas_model import json_handler
-from amaascore.core.interface import Interface
+from amaascore.core.interface import Interface, retrieve_many
 from amaascore.parties.utils import json_to_party
 
 
 class PartiesInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(PartiesInterface, self).__init__(endpoint=endpoint, 
                                                endpoint_type='parties', 
                                                environment=environment, 
                                                username=None, 
-                                               password=None)
+                                               password=None, **kwargs)
 
     def new(self, party):
         self.logger.info('New Party - Asset Manager: %s - Party ID: %s', party.asset_manager_id, party.party_id)
@@ -34,6 +34,7 @@ class PartiesInterface(Interface):
         self.logger.info('Amend Party - Asset Manager: %s - Party ID: %s', party.asset_manager_id, party.party_id)
         url = '%s/parties/%s/%s' % (self.endpoint, party.asset_manager_id, party.party_id)
         response = self.session.put(url, json=party.to_interface())
+        self.cache_invalidate(party.asset_manager_id, party.party_id)
         if response.ok:
             party = json_to_party(response.json())
             return party
@@ -47,6 +48,7 @@ class PartiesInterface(Interface):
         url = '%s/parties/%s/%s' % (self.endpoint, asset_manager_id, party_id)
         # Setting handler ourselves so we can be sure Decimals work
         response = self.session.patch(url, data=json.dumps(updates, default=json_handler), headers=self.json_header)
+        self.cache_invalidate(asset_manager_id, party_id)
         if response.ok:
             party = json_to_party(response.json())
             return party
@@ -56,28 +58,56 @@ class PartiesInterface(Interface):
 
     def retrieve(self, asset_manager_id, party_id, version=None):
         self.logger.info('Retrieve Party - Asset Manager: %s - Party ID: %s', asset_manager_id, party_id)
+        cached = self.cache_get(asset_manager_id, party_id, version)
+        if cached is not None:
+            return json_to_party(cached)
         url = '%s/parties/%s/%s' % (self.endpoint, asset_manager_id, party_id)
         if version:
             url += '?version=%d' % int(version)
         response = self.session.get(url)
         if response.ok:
-            return json_to_party(response.json())
+            party_json = response.json()
+            self.cache_set(asset_manager_id, party_id, version, party_json)
+            return json_to_party(party_json)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def retrieve_many(self, asset_manager_id, party_ids, max_workers=4, chunk_size=100):
+        """
+        Retrieve many parties at once by batching the IDs into concurrent searches.
+
+        :param asset_manager_id: The asset_manager_id which owns the parties.
+        :param party_ids: The IDs of the parties to retrieve.
+        :param max_workers: The maximum number of searches in flight at once - they run on the thread pool shared
+        by every interface (see AMaaSSession.executor).
+        :param chunk_size: The maximum number of IDs sent in a single search.
+        :return: A tuple of (parties keyed by party_id, errors keyed by party_id).
+        """
+        self.logger.info('Retrieve Many Parties - Asset Manager: %s - Count: %s', asset_manager_id, len(party_ids))
+
+        def search(chunk):
+            return self.search(asset_manager_id=asset_manager_id, party_ids=chunk)
+
+        parties, errors = retrieve_many(search=search, ids=party_ids, id_attribute='party_id', chunk_size=chunk_size,
+                                        max_workers=max_workers, executor=self.session.executor)
+        self.logger.info('Retrieved %s Parties - %s Errors.', len(parties), len(errors))
+        return parties, errors
+
     def deactivate(self, asset_manager_id, party_id):
         self.logger.info('Deactivate Party - Asset Manager: %s - Party ID: %s', asset_manager_id, party_id)
         url = '%s/parties/%s/%s' % (self.endpoint, asset_manager_id, party_id)
         json = {'party_status': 'Inactive'}
         response = self.session.patch(url, json=json)
+        self.cache_invalidate(asset_manager_id, party_id)
         if response.ok:
             self.logger.info(response.text)
         else:
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def search(self, asset_manager_id, party_ids=None, party_classes=None, party_types=None, country_ids=None):
+    def search(self, asset_manager_id, party_ids=None, party_classes=None, party_types=None, country_ids=None,
+               updated_since=None):
         self.logger.info('Search Parties - Asset Manager: %s', asset_manager_id)
         search_params = {}
         # Potentially roll this into a loop through args rather than explicitly named - depends on additional validation
@@ -89,6 +119,8 @@ class PartiesInterface(Interface):
             search_params['party_types'] = ','.join(party_types)
         if country_ids:
             search_params['country_ids'] = ','.join(country_ids)
+        if updated_since:
+            search_params['updated_since'] = updated_since.isoformat()
         url = '%s/parties/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url, params=search_params)
         if response.ok:
@@ -102,9 +134,10 @@ class PartiesInterface(Interface):
     def parties_by_asset_manager(self, asset_manager_id):
         self.logger.info('Retrieve Parties by Asset Manager: %s', asset_manager_id)
         url = '%s/parties/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.get(url)
+        response, parties = self.session.get_conditional(url, response_store=self.response_store,
+                                                          decode=lambda json_parties: [json_to_party(json_party)
+                                                                                       for json_party in json_parties])
         if response.ok:
-            parties = [json_to_party(json_party) for json_party in response.json()]
             self.logger.info('Returned %s Parties.', len(parties))
             return parties
         else:
@@ -118,6 +151,7 @@ class PartiesInterface(Interface):
         self.logger.info('Clear Parties - Asset Manager: %s', asset_manager_id)
         url = '%s/clear/%s' % (self.endpoint, asset_manager_id)
         response = self.session.delete(url)
+        self.cache_invalidate_asset_manager(asset_manager_id)
         if response.ok:
             count = response.json().get('count', 'Unknown')
             self.logger.info('Deleted %s Parties.', count)
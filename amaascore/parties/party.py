@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import copy
 
+from amaascore.core.registry import register
 from amaascore.error_messages import ERROR_LOOKUP
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.core.comment import Comment
@@ -10,6 +11,7 @@ from amaascore.parties.children import Address, Email, Link
 from amaascore.parties.enums import PARTY_STATUSES
 
 
+@register('party')
 class Party(AMaaSModel):
 
     @staticmethod
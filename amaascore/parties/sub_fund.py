@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.parties.party import Party
 
 
+@register('party')
 class SubFund(Party):
 
     def __init__(self, asset_manager_id, party_id, display_name='', legal_name='', url='', description='', base_currency=None, party_status='Active',
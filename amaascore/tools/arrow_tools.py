@@ -0,0 +1,254 @@
+"""
+Columnar export and import of the high-volume models via Apache Arrow and Parquet.  Unlike csv, the columns are typed
+(decimals, dates and timestamps survive the round trip) and children are kept as nested map columns.
+
+pyarrow is an optional dependency - install it with: pip install amaascore[arrow]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+import pytz
+import sys
+
+from amaascore.core.dates import parse_date, parse_datetime
+from amaascore.core.decode_plan import decode_plan
+from amaascore.market_data.eod_price import EODPrice
+from amaascore.market_data.fx_rate import FXRate
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_pnl import PositionPNL
+from amaascore.transactions.transaction import Transaction
+from amaascore.transactions.transaction_pnl import TransactionPNL
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
+
+# Wide enough for any quantity or price the services return - values with more decimal places raise rather than
+# silently losing precision
+DECIMAL_PRECISION = 38
+DECIMAL_SCALE = 12
+
+ROW_GROUP_SIZE = 65536
+
+MODEL_FIELDS = [('version', 'int'), ('created_by', 'string'), ('updated_by', 'string'),
+                ('created_time', 'timestamp'), ('updated_time', 'timestamp')]
+
+# Fields of the child classes.  Their model fields (version etc) are not kept.
+CHILD_FIELDS = {
+    'charges': [('charge_value', 'decimal'), ('currency', 'string'), ('net_affecting', 'bool')],
+    'codes': [('code_value', 'string')],
+    'comments': [('comment_value', 'string')],
+    'links': [('linked_transaction_id', 'string')],
+    'parties': [('party_id', 'string')],
+    'rates': [('rate_value', 'decimal')],
+    'references': [('reference_value', 'string'), ('reference_primary', 'bool')],
+}
+
+# Children where each type can hold a set of children rather than just one
+MULTIPLE_CHILDREN = {'links'}
+
+PNL_FIELDS = [('asset_manager_id', 'int'), ('book_id', 'string'), ('asset_id', 'string'), ('period', 'string'),
+              ('business_date', 'date'), ('pnl_timestamp', 'timestamp'), ('pnl_status', 'string'),
+              ('quantity', 'decimal'), ('total_pnl', 'decimal'), ('asset_pnl', 'decimal'), ('fx_pnl', 'decimal'),
+              ('unrealised_pnl', 'decimal'), ('realised_pnl', 'decimal'), ('message', 'string')]
+
+# The columns of each supported class, as (attribute, kind) - a kind of 'children' is a nested map column
+FIELDS = {
+    Transaction: [('transaction_id', 'string'), ('asset_manager_id', 'int'), ('asset_book_id', 'string'),
+                  ('counterparty_book_id', 'string'), ('transaction_action', 'string'), ('asset_id', 'string'),
+                  ('quantity', 'decimal'), ('transaction_date', 'date'), ('settlement_date', 'date'),
+                  ('price', 'decimal'), ('transaction_currency', 'string'), ('settlement_currency', 'string'),
+                  ('transaction_type', 'string'), ('transaction_status', 'string'), ('execution_time', 'timestamp')] +
+                 [(child, 'children') for child in sorted(CHILD_FIELDS)] + MODEL_FIELDS,
+    Position: [('asset_manager_id', 'int'), ('book_id', 'string'), ('account_id', 'string'),
+               ('accounting_type', 'string'), ('asset_id', 'string'), ('quantity', 'decimal'),
+               ('client_id', 'int')] + MODEL_FIELDS,
+    EODPrice: [('asset_manager_id', 'int'), ('asset_id', 'string'), ('business_date', 'date'), ('price', 'decimal'),
+               ('active', 'bool')] + MODEL_FIELDS,
+    FXRate: [('asset_manager_id', 'int'), ('asset_id', 'string'), ('business_date', 'date'),
+             ('rate_timestamp', 'timestamp_utc'), ('rate', 'decimal'), ('rate_type', 'string'),
+             ('active', 'bool')] + MODEL_FIELDS,
+    TransactionPNL: PNL_FIELDS + [('transaction_id', 'string')] + MODEL_FIELDS,
+    PositionPNL: PNL_FIELDS + MODEL_FIELDS,
+}
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError('pyarrow is required for Arrow and Parquet support - pip install amaascore[arrow]')
+
+
+def to_decimal(value):
+    return value if value is None or isinstance(value, Decimal) else Decimal(str(value))
+
+
+def to_date(value):
+    if value is None or type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return parse_date(value)
+
+
+def to_timestamp(value, utc=False):
+    """ Timestamps are stored in UTC - naive timestamps are assumed to already be in UTC """
+    if value is None:
+        return value
+    if isinstance(value, type_check):
+        value = parse_datetime(value)
+    if utc:
+        return value.astimezone(pytz.utc) if value.tzinfo else value.replace(tzinfo=pytz.utc)
+    return value.astimezone(pytz.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+CONVERTERS = {
+    'string': lambda value: value,
+    'int': lambda value: value if value is None else int(value),
+    'bool': lambda value: value,
+    'decimal': to_decimal,
+    'date': to_date,
+    'timestamp': to_timestamp,
+    'timestamp_utc': lambda value: to_timestamp(value, utc=True),
+}
+
+
+def arrow_type(kind):
+    return {
+        'string': pa.string(),
+        'int': pa.int64(),
+        'bool': pa.bool_(),
+        'decimal': pa.decimal128(DECIMAL_PRECISION, DECIMAL_SCALE),
+        'date': pa.date32(),
+        'timestamp': pa.timestamp('us'),
+        'timestamp_utc': pa.timestamp('us', tz='UTC'),
+    }[kind]
+
+
+def child_type(collection_name):
+    child_struct = pa.struct([(name, arrow_type(kind)) for name, kind in CHILD_FIELDS[collection_name]])
+    if collection_name in MULTIPLE_CHILDREN:
+        return pa.map_(pa.string(), pa.list_(child_struct))
+    return pa.map_(pa.string(), child_struct)
+
+
+def fields(clazz):
+    for supported_class, class_fields in FIELDS.items():
+        if issubclass(clazz, supported_class):
+            return class_fields
+    raise ValueError('Arrow export is not supported for class: %s' % clazz.__name__)
+
+
+def arrow_schema(clazz):
+    """ The Arrow schema for clazz - one of the classes in FIELDS, or a subclass of one """
+    require_pyarrow()
+    return pa.schema([(name, child_type(name) if kind == 'children' else arrow_type(kind))
+                      for name, kind in fields(clazz)])
+
+
+def child_to_row(collection_name, child):
+    return {name: CONVERTERS[kind](getattr(child, name, None)) for name, kind in CHILD_FIELDS[collection_name]}
+
+
+def children_to_column_value(collection_name, collection):
+    """ A children dict as the list of (key, value) pairs Arrow expects for a map column """
+    pairs = []
+    for child_type_name, child in (collection or {}).items():
+        if collection_name in MULTIPLE_CHILDREN:
+            children = child if isinstance(child, (set, list, tuple)) else [child]
+            pairs.append((child_type_name, [child_to_row(collection_name, item) for item in children]))
+        else:
+            pairs.append((child_type_name, child_to_row(collection_name, child)))
+    return pairs
+
+
+def to_record_batch(objects, clazz):
+    """
+    :param objects: A list of objects of class clazz.
+    :param clazz: The class of the objects - which determines the schema.
+    :return: A pyarrow RecordBatch.
+    """
+    schema = arrow_schema(clazz)
+    columns = []
+    for name, kind in fields(clazz):
+        if kind == 'children':
+            values = [children_to_column_value(name, getattr(obj, name, None)) for obj in objects]
+        else:
+            convert = CONVERTERS[kind]
+            values = [convert(getattr(obj, name, None)) for obj in objects]
+        columns.append(pa.array(values, type=schema.field(name).type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def to_table(objects, clazz):
+    return pa.Table.from_batches([to_record_batch(list(objects), clazz)], schema=arrow_schema(clazz))
+
+
+def row_to_json(row, clazz):
+    """ Convert a row read back from Arrow into the JSON dict the class's decoder expects """
+    for name, kind in fields(clazz):
+        if kind != 'children':
+            continue
+        collection = {}
+        for child_type_name, child in row.get(name) or []:
+            if name in MULTIPLE_CHILDREN and len(child) == 1:
+                child = child[0]  # A single child is held on its own, rather than in a set of one
+            collection[child_type_name] = child
+        row[name] = collection
+    return row
+
+
+def from_record_batch(batch, clazz):
+    """ Generator of objects of class clazz from a RecordBatch or Table """
+    plan = decode_plan(clazz)
+    for row in batch.to_pylist():
+        yield plan.decode(row_to_json(row, clazz))
+
+
+def from_table(table, clazz):
+    return list(from_record_batch(table, clazz))
+
+
+def write_parquet(objects, path, clazz, row_group_size=ROW_GROUP_SIZE, compression='snappy'):
+    """
+    Write objects to a Parquet file one row group at a time, so objects can be a generator of any length.
+
+    :param objects: An iterable of objects of class clazz.
+    :param path: The file to write.
+    :param clazz: The class of the objects - see FIELDS for those supported.
+    :param row_group_size: The number of objects in each row group.
+    :param compression: The Parquet compression codec.
+    :return: The number of objects written.
+    """
+    require_pyarrow()
+    objects = iter(objects)
+    count = 0
+    with pq.ParquetWriter(path, arrow_schema(clazz), compression=compression) as writer:
+        while True:
+            chunk = list(islice(objects, row_group_size))
+            if not chunk:
+                break
+            writer.write_batch(to_record_batch(chunk, clazz), row_group_size=row_group_size)
+            count += len(chunk)
+    return count
+
+
+def iter_parquet(path, clazz):
+    """
+    Lazily read objects of class clazz back from a Parquet file, decoding one row group at a time so that only a
+    single row group is held in memory.
+    """
+    require_pyarrow()
+    parquet_file = pq.ParquetFile(path)
+    for row_group in range(parquet_file.num_row_groups):
+        for obj in from_record_batch(parquet_file.read_row_group(row_group), clazz):
+            yield obj
+
+
+def read_parquet(path, clazz):
+    return list(iter_parquet(path, clazz))
@@ -1,6 +1,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import csv
+from itertools import chain
+
+from amaascore.core.amaas_model import to_json
+from amaascore.core.decode_plan import decode_plan
+from amaascore.core.registry import registry
 
 
 def csv_filename_to_objects(filename, json_handler):
@@ -19,20 +24,66 @@ def csv_stream_to_objects(stream, json_handler, params=dict()):
 
 def objects_to_csv(objects, filename, clazz=None):
     with open(filename, 'w') as csvfile:
-        objects_to_csv_stream(objects=objects, stream=csvfile, clazz=clazz)
-
-
-def objects_to_csv_stream(objects, stream, clazz=None):
-    if not objects:
-        return
-    object_dicts = []
-    for obj in objects:
-        obj_dict = obj.to_json()
-        if clazz and hasattr(clazz, 'children'):
-            # FOR NOW - remove all children
-            [obj_dict.pop(child, None) for child in clazz.children().keys()]
-        object_dicts.append(obj_dict)
-    fieldnames = object_dicts[0].keys()
-    writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        return objects_to_csv_stream(objects=objects, stream=csvfile, clazz=clazz)
+
+
+def csv_fieldnames(classes):
+    """
+    The union of the attributes of classes, in a stable order, for use as a csv header.  Children are excluded, as
+    they cannot be represented in a single column.
+    """
+    fieldnames = []
+    for clazz in classes:
+        plan = decode_plan(clazz)
+        fieldnames.extend(attribute for attribute in plan.arguments
+                          if attribute not in plan.children and attribute not in fieldnames)
+    return fieldnames
+
+
+def object_to_csv_row(obj):
+    """ The JSON of obj without its children - which would only be dropped from the row """
+    children = obj.children() if hasattr(obj, 'children') else {}
+    exclude = set(children) | set('_' + child for child in children)
+    return to_json(obj.to_dict(exclude=exclude))
+
+
+def objects_to_csv_stream(objects, stream, clazz=None, fieldnames=None):
+    """
+    Write objects to a csv stream one row at a time, so that objects can be any iterable - e.g. a generator of search
+    results - without them all being held in memory.
+
+    Unless fieldnames are given, the header is the union of the attributes of clazz and all its registered subclasses
+    (e.g. every asset type for Asset), followed by any attributes the first object sets beyond its constructor
+    arguments (e.g. asset_type) - so objects of different types can be written together without losing columns.
+    Attributes not in the header, including children, are left out.  Without clazz, the header is that of the
+    registered base class of the first object (e.g. Asset for a Fund), and an object which isn't an instance of it
+    raises a ValueError rather than losing its columns.
+
+    :param objects: An iterable of AMaaSModel objects.
+    :param stream: A text stream to write the csv to.
+    :param clazz: The class of the objects - defaulting to the registered base class of the first object.
+    :param fieldnames: Overrides the header.
+    :return: The number of objects written.
+    """
+    objects = iter(objects)
+    try:
+        first = next(objects)
+    except StopIteration:
+        return 0
+    inferred = None
+    if fieldnames is None:
+        if clazz is None:
+            clazz = inferred = registry.base_class(type(first))
+        fieldnames = csv_fieldnames(registry.subclasses(clazz))
+        fieldnames += sorted(set(object_to_csv_row(first)) - set(fieldnames) -
+                             set(first.children() if hasattr(first, 'children') else ()))
+    writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction='ignore')
     writer.writeheader()
-    writer.writerows(object_dicts)
+    count = 0
+    for obj in chain([first], objects):
+        if inferred is not None and not isinstance(obj, inferred):
+            raise ValueError('Cannot write a %s with the %s columns - pass clazz or fieldnames to choose the columns' %
+                             (type(obj).__name__, inferred.__name__))
+        writer.writerow(object_to_csv_row(obj))
+        count += 1
+    return count
@@ -1,8 +1,10 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from amaascore.core.registry import register
 from amaascore.transactions.transaction import Transaction
 
 
+@register('transaction')
 class CashTransaction(Transaction):
 
     def __init__(self, asset_manager_id, asset_book_id, counterparty_book_id, transaction_action,
@@ -2,16 +2,18 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 from decimal import Decimal
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
 
 
-class Charge(AMaaSModel):
+class ChargeBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, charge_value, currency, net_affecting=True, *args, **kwargs):
         self.charge_value = charge_value
         self.currency = currency
         self.net_affecting = net_affecting
-        super(Charge, self).__init__(*args, **kwargs)
+        super(ChargeBase, self).__init__(*args, **kwargs)
 
     @property
     def charge_value(self):
@@ -27,32 +29,80 @@ class Charge(AMaaSModel):
         self._charge_value = Decimal(value)
 
 
-class Code(AMaaSModel):
+class Charge(ChargeBase, AMaaSModel):
+    pass
+
+
+class CompactCharge(ChargeBase):
+    """ A Charge without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('_charge_value', 'currency', 'net_affecting') + MODEL_SLOTS
+
+
+class CodeBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, code_value, *args, **kwargs):
         self.code_value = code_value
-        super(Code, self).__init__(*args, **kwargs)
+        super(CodeBase, self).__init__(*args, **kwargs)
+
 
+class Code(CodeBase, AMaaSModel):
+    pass
 
-class Link(AMaaSModel):
+
+class CompactCode(CodeBase):
+    """ A Code without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('code_value',) + MODEL_SLOTS
+
+
+class LinkBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, linked_transaction_id, *args, **kwargs):
         self.linked_transaction_id = linked_transaction_id
-        super(Link, self).__init__(*args, **kwargs)
+        super(LinkBase, self).__init__(*args, **kwargs)
+
+
+class Link(LinkBase, AMaaSModel):
+    pass
+
 
+class CompactLink(LinkBase):
+    """ A Link without a per-instance __dict__, for when very large numbers are held in memory """
 
-class Party(AMaaSModel):
+    __slots__ = ('linked_transaction_id',) + MODEL_SLOTS
+
+
+class PartyBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, party_id, *args, **kwargs):
         self.party_id = party_id
-        super(Party, self).__init__(*args, **kwargs)
+        super(PartyBase, self).__init__(*args, **kwargs)
+
+
+class Party(PartyBase, AMaaSModel):
+    pass
+
+
+class CompactParty(PartyBase):
+    """ A Party without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('party_id',) + MODEL_SLOTS
 
 
-class Rate(AMaaSModel):
-    
+class RateBase(AMaaSModelBase):
+
+    __slots__ = ()
+
     def __init__(self, rate_value, *args, **kwargs):
         self.rate_value = rate_value
-        super(Rate, self).__init__(*args, **kwargs)
+        super(RateBase, self).__init__(*args, **kwargs)
 
     @property
     def rate_value(self):
@@ -66,3 +116,13 @@ class Rate(AMaaSModel):
         :return:
         """
         self._rate_value = Decimal(value)
+
+
+class Rate(RateBase, AMaaSModel):
+    pass
+
+
+class CompactRate(RateBase):
+    """ A Rate without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('_rate_value',) + MODEL_SLOTS
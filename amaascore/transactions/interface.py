@@ -5,17 +5,18 @@ import json
 
 from amaascore.config import ENVIRONMENT
 from amaascore.core.amaas_model import json_handler
-from amaascore.core.interface import Interface
+from amaascore.core.interface import Interface, iterate_pages, json_stream
+from amaascore.transactions.position_set import PositionSet
 from amaascore.transactions.utils import json_to_transaction, json_to_position, \
     json_to_mtm_result, json_to_transaction_pnl, json_to_position_pnl
 
 
 class TransactionsInterface(Interface):
 
-    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None):
+    def __init__(self, environment=ENVIRONMENT, logger=None, endpoint=None, username=None, password=None, **kwargs):
         self.logger = logger or logging.getLogger(__name__)
         super(TransactionsInterface, self).__init__(endpoint=endpoint, endpoint_type='transactions',
-                                                    environment=environment, username=None, password=None)
+                                                    environment=environment, username=None, password=None, **kwargs)
 
     def new(self, transaction):
         self.logger.info('New Transaction - Asset Manager: %s - Transaction ID: %s', transaction.asset_manager_id,
@@ -29,19 +30,27 @@ class TransactionsInterface(Interface):
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def create_many(self, transactions):
+    def create_many(self, transactions, stream=False):
+        """
+
+        :param transactions: A list of transactions, all belonging to the same asset manager.
+        :param stream: If True, each transaction is encoded as the request body is sent, rather than encoding the
+        whole list up front.
+        :return:
+        """
         if type(transactions) is not list:
             raise ValueError('Error - create_many takes in a list of transactions instead of single transaction')
-        transactions_json = []        
         # check to ensure all transactions have the same asset_manager_id
         asset_manager_id = transactions[0].asset_manager_id
         for transaction in transactions:
-            transactions_json.append(transaction.to_interface())
             if transaction.asset_manager_id != asset_manager_id:
                 raise AttributeError('Check failed - Not all transactions have the same asset manager ID.')
         self.logger.info('Multple new Transactions - Asset Manager: %s', asset_manager_id)
         url = '%s/transactions/%s' % (self.endpoint, asset_manager_id)
-        response = self.session.post(url, json=transactions_json)
+        if stream:
+            response = self.session.post(url, data=json_stream(transactions), headers=self.json_header)
+        else:
+            response = self.session.post(url, json=[transaction.to_interface() for transaction in transactions])
         if response.ok:
             transactions = []
             for transaction_json in response.json():
@@ -166,6 +175,26 @@ class TransactionsInterface(Interface):
             self.logger.error(response.text)
             response.raise_for_status()
 
+    def search_iter(self, asset_manager_id, page_size=1000, page_no=1, prefetch=False, **search_kwargs):
+        """
+        Lazily page through the results of a transaction search, yielding one Transaction at a time.  Only the
+        current page (plus the next one, when prefetching) is held in memory.
+
+        :param asset_manager_id: The asset_manager_id to search within.
+        :param page_size: The number of transactions to request per page.
+        :param page_no: The first page to request.
+        :param prefetch: If True, the next page is fetched on a background thread whilst the current page is consumed.
+        :param search_kwargs: Any of the other filters accepted by search (e.g. asset_book_ids, transaction_statuses).
+        :return: A generator of Transactions.
+        """
+        self.logger.info('Search Transactions (Paged) - Asset Manager: %s - Page Size: %s', asset_manager_id,
+                         page_size)
+
+        def fetch_page(page):
+            return self.search(asset_manager_id, page_no=page, page_size=page_size, **search_kwargs)
+
+        return iterate_pages(fetch_page=fetch_page, page_size=page_size, page_no=page_no, prefetch=prefetch)
+
     def new_mtm_results(self, asset_manager_id, mtm_results):
         self.logger.info('Marking to market Positions - Asset Manager: %s', asset_manager_id)
         if not isinstance(mtm_results, list):
@@ -340,10 +369,30 @@ class TransactionsInterface(Interface):
             self.logger.error(response.text)
             response.raise_for_status()        
 
+    @staticmethod
+    def decode_positions(json_positions, columnar=False):
+        if columnar:
+            return PositionSet.from_json(json_positions)
+        return [json_to_position(json_position) for json_position in json_positions]
+
     def position_search(self, asset_manager_id, book_ids=None, account_ids=None,
                         accounting_types=None, asset_ids=None,
                         position_date=None, include_cash=False, 
-                        page_no=None, page_size=None):
+                        page_no=None, page_size=None, columnar=False):
+        """
+
+        :param asset_manager_id:
+        :param book_ids:
+        :param account_ids:
+        :param accounting_types:
+        :param asset_ids:
+        :param position_date:
+        :param include_cash:
+        :param page_no:
+        :param page_size:
+        :param columnar: If True, the positions are returned as a PositionSet rather than a list of Positions.
+        :return:
+        """
         self.logger.info('Search Positions - Asset Manager: %s', asset_manager_id)
         search_params = {}
         # Potentially roll into a loop
@@ -366,7 +415,7 @@ class TransactionsInterface(Interface):
         url = '%s/positions/%s' % (self.endpoint, asset_manager_id)
         response = self.session.get(url, params=search_params)
         if response.ok:
-            positions = [json_to_position(json_position) for json_position in response.json()]
+            positions = self.decode_positions(response.json(), columnar=columnar)
             self.logger.info('Returned %s Positions.', len(positions))
             return positions
         else:
@@ -386,13 +435,20 @@ class TransactionsInterface(Interface):
             self.logger.error(response.text)
             response.raise_for_status()
 
-    def positions_by_asset_manager(self, asset_manager_id, book_ids=None):
+    def positions_by_asset_manager(self, asset_manager_id, book_ids=None, columnar=False):
+        """
+
+        :param asset_manager_id:
+        :param book_ids:
+        :param columnar: If True, the positions are returned as a PositionSet rather than a list of Positions.
+        :return:
+        """
         self.logger.info('Retrieve Positions by Asset Manager: %s', asset_manager_id)
         url = '%s/positions/%s' % (self.endpoint, asset_manager_id)
         params = {'book_ids': ','.join(book_ids)} if book_ids else {}
         response = self.session.get(url, params=params)
         if response.ok:
-            positions = [json_to_position(json_position) for json_position in response.json()]
+            positions = self.decode_positions(response.json(), columnar=columnar)
             self.logger.info('Returned %s Positions.', len(positions))
             return positions
         else:
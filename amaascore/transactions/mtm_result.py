@@ -1,10 +1,13 @@
 from decimal import Decimal
-from dateutil.parser import parse
 import pytz
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
+from amaascore.core.dates import parse_datetime
 
 
-class MTMResult(AMaaSModel):
+class MTMResultBase(AMaaSModelBase):
+
+    __slots__ = ()
+
     def __init__(self, asset_manager_id, book_id, business_date, asset_id,
                  mtm_timestamp, mtm_value=None, mtm_status='Active', message=None,
                  *args, **kwargs):
@@ -17,7 +20,7 @@ class MTMResult(AMaaSModel):
         self.message = message
         self.mtm_status = mtm_status
 
-        super(MTMResult, self).__init__(*args, **kwargs)
+        super(MTMResultBase, self).__init__(*args, **kwargs)
 
     @property
     def mtm_timestamp(self):
@@ -26,7 +29,7 @@ class MTMResult(AMaaSModel):
     @mtm_timestamp.setter
     def mtm_timestamp(self, value):
         if value:
-            mtm_timestamp = parse(value) if isinstance(value, str) else value
+            mtm_timestamp = parse_datetime(value) if isinstance(value, str) else value
             self._mtm_timestamp = mtm_timestamp.replace(tzinfo=pytz.UTC) \
                 if not mtm_timestamp.tzinfo else mtm_timestamp
 
@@ -39,4 +42,15 @@ class MTMResult(AMaaSModel):
         if not isinstance(val, Decimal) and val is not None:
             self._mtm_value = Decimal(val)
         else:
-            self._mtm_value = val
\ No newline at end of file
+            self._mtm_value = val
+
+
+class MTMResult(MTMResultBase, AMaaSModel):
+    pass
+
+
+class CompactMTMResult(MTMResultBase):
+    """ An MTMResult without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'asset_id', 'book_id', '_mtm_value', 'business_date',
+                 '_mtm_timestamp', 'message', 'mtm_status') + MODEL_SLOTS
@@ -3,10 +3,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import datetime
 from decimal import Decimal
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
+from amaascore.core.registry import register
 
 
-class Position(AMaaSModel):
+class PositionBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, asset_manager_id, book_id, account_id, accounting_type,
                  asset_id, quantity, client_id=None, *args, **kwargs):
@@ -17,7 +20,7 @@ class Position(AMaaSModel):
         self.accounting_type = accounting_type
         self.asset_id = asset_id
         self.quantity = quantity
-        super(Position, self).__init__(*args, **kwargs)
+        super(PositionBase, self).__init__(*args, **kwargs)
 
     @property
     def quantity(self):
@@ -30,4 +33,15 @@ class Position(AMaaSModel):
         :param value:
         :return:
         """
-        self._quantity = Decimal(value)
\ No newline at end of file
+        self._quantity = Decimal(value)
+
+
+@register('transaction')
+class Position(PositionBase, AMaaSModel):
+    pass
+
+
+class CompactPosition(PositionBase):
+    """ A Position without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'book_id', 'account_id', 'accounting_type', 'asset_id', '_quantity') + MODEL_SLOTS
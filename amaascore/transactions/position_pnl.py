@@ -1,8 +1,10 @@
 from decimal import Decimal
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
 
 
-class PositionPNL(AMaaSModel):
+class PositionPNLBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, asset_manager_id, book_id, asset_id, period, 
                  business_date, pnl_timestamp, pnl_status='Active',
@@ -24,7 +26,7 @@ class PositionPNL(AMaaSModel):
         self.message = message
         self.pnl_timestamp = pnl_timestamp
 
-        super(PositionPNL, self).__init__(*args, **kwargs)
+        super(PositionPNLBase, self).__init__(*args, **kwargs)
 
     @property
     def quantity(self):
@@ -80,3 +82,15 @@ class PositionPNL(AMaaSModel):
             self._asset_pnl = Decimal(val)
         else:
             self._asset_pnl = val
+
+
+class PositionPNL(PositionPNLBase, AMaaSModel):
+    pass
+
+
+class CompactPositionPNL(PositionPNLBase):
+    """ A PositionPNL without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'asset_id', 'book_id', '_period', 'business_date',
+                 'realised_pnl', 'unrealised_pnl', '_total_pnl', '_asset_pnl', '_fx_pnl',
+                 'pnl_status', '_quantity', 'message', 'pnl_timestamp') + MODEL_SLOTS
@@ -0,0 +1,177 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from array import array
+from decimal import Decimal
+import sys
+
+from amaascore.transactions.position import Position
+
+# array only supports the 'q' (signed 64 bit) typecode from Python 3.3 - 'l' is 64 bit on the platforms we support
+INT64 = 'q' if sys.version_info >= (3, 3, 0) else b'l'
+
+
+class PositionSet(object):
+    """
+    A columnar collection of positions.  Each identifier column is stored as an array of integer codes into a pool of
+    the distinct values seen, and quantities are stored as fixed-point int64s - i.e. as integer multiples of 10^-scale.
+    Aggregations therefore run over plain integers rather than Position objects and Decimals.  Position objects are
+    only created when an item is accessed, and only carry the columns below plus the quantity.
+    """
+
+    COLUMNS = ('asset_manager_id', 'book_id', 'account_id', 'accounting_type', 'asset_id')
+
+    def __init__(self, scale=6, pools=None):
+        """
+        :param scale: The number of decimal places of quantity to store.  Quantities with more are rejected.
+        :param pools: The value pools to share with another PositionSet - i.e. for a subset of it.
+        """
+        self.scale = scale
+        self.multiplier = 10 ** scale
+        self.pools = pools or {column: ([], {}) for column in self.COLUMNS}
+        self.codes = {column: array(INT64) for column in self.COLUMNS}
+        self.quantities = array(INT64)
+
+    @classmethod
+    def from_json(cls, json_positions, scale=6):
+        position_set = cls(scale=scale)
+        position_set.extend(json_positions)
+        return position_set
+
+    @classmethod
+    def from_positions(cls, positions, scale=6):
+        position_set = cls(scale=scale)
+        for position in positions:
+            position_set.append({column: getattr(position, column) for column in cls.COLUMNS},
+                                quantity=position.quantity)
+        return position_set
+
+    def intern(self, column, value):
+        """ The code for value in the pool for column, adding it to the pool if it is new. """
+        values, index = self.pools[column]
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(values)
+            values.append(value)
+        return code
+
+    def to_fixed_point(self, quantity):
+        # Whole quantities are by far the most common, and int() is much cheaper than going through Decimal
+        if not isinstance(quantity, (Decimal, float)):
+            try:
+                return int(quantity) * self.multiplier
+            except ValueError:
+                pass
+        if isinstance(quantity, float):
+            # Decimal(0.1) is the binary approximation 0.1000000000000000055511151231257827... - the shortest repr is
+            # the quantity that was meant
+            quantity = repr(quantity)
+        scaled = Decimal(quantity).scaleb(self.scale)
+        if scaled != scaled.to_integral_value():
+            raise ValueError('Quantity %s has more than %s decimal places' % (quantity, self.scale))
+        return int(scaled)
+
+    def from_fixed_point(self, value):
+        return Decimal(value).scaleb(-self.scale)
+
+    def append(self, json_position, quantity=None):
+        """
+        Add a single position.
+
+        :param json_position: A dict of the position's attributes, as returned by the transactions service.
+        :param quantity: Overrides the quantity in json_position.
+        :return:
+        """
+        for column in self.COLUMNS:
+            self.codes[column].append(self.intern(column, json_position.get(column)))
+        quantity = json_position.get('quantity') if quantity is None else quantity
+        self.quantities.append(self.to_fixed_point(quantity))
+
+    def extend(self, json_positions):
+        for json_position in json_positions:
+            self.append(json_position)
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def value(self, column, row):
+        return self.pools[column][0][self.codes[column][row]]
+
+    def __getitem__(self, row):
+        position = {column: self.value(column, row) for column in self.COLUMNS}
+        return Position(quantity=self.from_fixed_point(self.quantities[row]), **position)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    def column(self, column):
+        """ The values of column, one per position. """
+        values = self.pools[column][0]
+        return [values[code] for code in self.codes[column]]
+
+    def total_quantity(self):
+        return self.from_fixed_point(sum(self.quantities))
+
+    def sum_by(self, *columns):
+        """
+        Sum the quantities grouped by one or more columns - e.g. sum_by('book_id', 'asset_id').
+
+        :param columns: The columns to group by.
+        :return: A dict of total quantity keyed by column value - or by a tuple of values when grouping by several.
+        """
+        if not columns:
+            raise ValueError('At least one column is required')
+        totals = {}
+        if len(columns) == 1:
+            for code, quantity in zip(self.codes[columns[0]], self.quantities):
+                totals[code] = totals.get(code, 0) + quantity
+            values = self.pools[columns[0]][0]
+            return {values[code]: self.from_fixed_point(total) for code, total in totals.items()}
+        for key in zip(*([self.codes[column] for column in columns] + [self.quantities])):
+            totals[key[:-1]] = totals.get(key[:-1], 0) + key[-1]
+        pools = [self.pools[column][0] for column in columns]
+        return {tuple(pool[code] for pool, code in zip(pools, codes)): self.from_fixed_point(total)
+                for codes, total in totals.items()}
+
+    def take(self, rows):
+        """ A new PositionSet (sharing this one's pools) holding only the given rows. """
+        subset = PositionSet(scale=self.scale, pools=self.pools)
+        for column in self.COLUMNS:
+            codes = self.codes[column]
+            subset.codes[column] = array(INT64, [codes[row] for row in rows])
+        subset.quantities = array(INT64, [self.quantities[row] for row in rows])
+        return subset
+
+    def filter(self, **criteria):
+        """
+        The positions matching all of the criteria - e.g. filter(book_id='BOOK1', accounting_type=['Transaction Date']).
+
+        :param criteria: Keyed by column, each either a single value or a list/set/tuple of acceptable values.
+        :return: A new PositionSet.
+        """
+        accepted = {}
+        for column, values in criteria.items():
+            if column not in self.COLUMNS:
+                raise ValueError('Unknown column: %s' % column)
+            values = values if isinstance(values, (list, set, frozenset, tuple)) else [values]
+            index = self.pools[column][1]
+            accepted[column] = frozenset(index[value] for value in values if value in index)
+        rows = range(len(self))
+        for column, codes in accepted.items():
+            column_codes = self.codes[column]
+            rows = [row for row in rows if column_codes[row] in codes]
+        return self.take(rows)
+
+    def join(self, other, on='asset_id'):
+        """
+        Inner join against other - e.g. a dict of prices or assets keyed by asset_id.
+
+        :param other: A dict keyed by values of the on column.
+        :param on: The column to join on.
+        :return: A tuple of (a new PositionSet of the positions with a match, the matched values in the same order).
+        """
+        values = self.pools[on][0]
+        # Look up each distinct value once, rather than once per position
+        matches = {code: other[value] for code, value in enumerate(values) if value in other}
+        rows = [row for row, code in enumerate(self.codes[on]) if code in matches]
+        return self.take(rows), [matches[self.codes[on][row]] for row in rows]
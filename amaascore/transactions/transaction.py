@@ -2,23 +2,26 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import copy
 import datetime
-from dateutil.parser import parse
 from decimal import Decimal
 import sys
 import uuid
 
+from amaascore.core.dates import parse_date, parse_datetime
+from amaascore.core.registry import register
 from amaascore.error_messages import ERROR_LOOKUP
 from amaascore.exceptions import TransactionNeedsSaving
 from amaascore.core.amaas_model import AMaaSModel
 from amaascore.core.comment import Comment
-from amaascore.core.reference import Reference
-from amaascore.transactions.children import Charge, Code, Link, Party, Rate
+from amaascore.core.reference import Reference, CompactReference
+from amaascore.transactions.children import Charge, Code, Link, LinkBase, Party, Rate, CompactCharge, CompactCode, \
+    CompactLink, CompactParty, CompactRate
 from amaascore.transactions.enums import TRANSACTION_ACTIONS, TRANSACTION_STATUSES, TRANSACTION_TYPES
 
 # This extremely ugly hack is due to the whole Python 2 vs 3 debacle.
 type_check = str if sys.version_info >= (3, 0, 0) else (str, unicode)
 
 
+@register('transaction')
 class Transaction(AMaaSModel):
 
     @staticmethod
@@ -27,6 +30,12 @@ class Transaction(AMaaSModel):
         return {'charges': Charge, 'codes': Code, 'comments': Comment, 'links': Link, 'parties': Party,
                 'rates': Rate, 'references': Reference}
 
+    @staticmethod
+    def compact_children():
+        """ As children, but using the compact (__slots__ based) version of each child class where there is one """
+        return {'charges': CompactCharge, 'codes': CompactCode, 'comments': Comment, 'links': CompactLink,
+                'parties': CompactParty, 'rates': CompactRate, 'references': CompactReference}
+
     def __init__(self, asset_manager_id, asset_book_id, counterparty_book_id, transaction_action, asset_id, quantity,
                  transaction_date, settlement_date, price, transaction_currency, settlement_currency=None,
                  asset=None, execution_time=None, transaction_type='Trade', transaction_id=None,
@@ -158,7 +167,7 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._transaction_date = parse(value).date() if isinstance(value, type_check) else value
+            self._transaction_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def settlement_date(self):
@@ -172,7 +181,7 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._settlement_date = parse(value).date() if isinstance(value, type_check) else value
+            self._settlement_date = parse_date(value) if isinstance(value, type_check) else value
 
     @property
     def execution_time(self):
@@ -186,7 +195,7 @@ class Transaction(AMaaSModel):
         :return:
         """
         if value:
-            self._execution_time = parse(value) if isinstance(value, type_check) else value
+            self._execution_time = parse_datetime(value) if isinstance(value, type_check) else value
 
     @property
     def gross_settlement(self):
@@ -373,7 +382,7 @@ class Transaction(AMaaSModel):
         link_set = self.links.get(link_type)
         if not link_set:
             raise KeyError(ERROR_LOOKUP.get('transaction_link_not_found'))
-        if isinstance(link_set, Link):
+        if isinstance(link_set, LinkBase):
             if link_set.linked_transaction_id == linked_transaction_id:
                 link_set = None
             else:
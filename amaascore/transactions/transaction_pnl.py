@@ -1,8 +1,10 @@
 from decimal import Decimal
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, AMaaSModelBase, MODEL_SLOTS
 
 
-class TransactionPNL(AMaaSModel):
+class TransactionPNLBase(AMaaSModelBase):
+
+    __slots__ = ()
 
     def __init__(self, asset_manager_id, book_id, asset_id, period,
                  business_date, pnl_timestamp, transaction_id, pnl_status='Active',
@@ -25,7 +27,7 @@ class TransactionPNL(AMaaSModel):
         self.transaction_id = transaction_id
         self.pnl_timestamp = pnl_timestamp
 
-        super(TransactionPNL, self).__init__(*args, **kwargs)
+        super(TransactionPNLBase, self).__init__(*args, **kwargs)
 
     @property
     def quantity(self):
@@ -81,3 +83,15 @@ class TransactionPNL(AMaaSModel):
             self._asset_pnl = Decimal(val)
         else:
             self._asset_pnl = val
+
+
+class TransactionPNL(TransactionPNLBase, AMaaSModel):
+    pass
+
+
+class CompactTransactionPNL(TransactionPNLBase):
+    """ A TransactionPNL without a per-instance __dict__, for when very large numbers are held in memory """
+
+    __slots__ = ('asset_manager_id', 'asset_id', 'book_id', '_period', 'business_date',
+                 'realised_pnl', 'unrealised_pnl', '_total_pnl', '_asset_pnl', '_fx_pnl',
+                 'pnl_status', '_quantity', 'message', 'transaction_id', 'pnl_timestamp') + MODEL_SLOTS
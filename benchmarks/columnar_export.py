@@ -0,0 +1,63 @@
+"""
+File size and time to write and read back transactions as csv and as Parquet.
+
+    python benchmarks/columnar_export.py [number_of_transactions]
+
+Requires pyarrow (pip install amaascore[arrow]).  The csv is read back into plain rows only, since csv loses the types
+needed to decode it - the Parquet file is decoded all the way back into Transactions.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from amaascore.tools.arrow_tools import iter_parquet, write_parquet
+from amaascore.tools.csv_tools import objects_to_csv
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.transaction import Transaction
+
+POOL_SIZE = 200
+
+
+def timed(function, *args, **kwargs):
+    start = timeit.default_timer()
+    function(*args, **kwargs)
+    return timeit.default_timer() - start
+
+
+def read_csv(path):
+    with open(path) as csv_file:
+        for _ in csv.DictReader(csv_file):
+            pass
+
+
+def read_parquet(path):
+    for _ in iter_parquet(path, Transaction):
+        pass
+
+
+def main(number):
+    pool = [generate_transaction() for _ in range(POOL_SIZE)]
+    transactions = [pool[i % POOL_SIZE] for i in range(number)]
+    directory = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(directory, 'transactions.csv')
+        parquet_path = os.path.join(directory, 'transactions.parquet')
+        print('Transactions: %d' % number)
+        write = timed(objects_to_csv, transactions, csv_path, clazz=Transaction)
+        read = timed(read_csv, csv_path)
+        print('%-8s %8.1f KiB  write %6.2fs  read %6.2fs' % ('csv', os.path.getsize(csv_path) / 1024, write, read))
+        write = timed(write_parquet, transactions, parquet_path, Transaction)
+        read = timed(read_parquet, parquet_path)
+        print('%-8s %8.1f KiB  write %6.2fs  read %6.2fs (with children)' %
+              ('Parquet', os.path.getsize(parquet_path) / 1024, write, read))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
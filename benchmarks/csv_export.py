@@ -0,0 +1,72 @@
+"""
+Peak memory and time to export transactions to csv, comparing writing a materialised list of row dicts (the previous
+objects_to_csv_stream) with the streaming writer fed by a generator.
+
+    python benchmarks/csv_export.py [number_of_transactions]
+
+The transactions are decoded from JSON as they are written, as they would be when exporting search results.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import csv
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from amaascore.tools.csv_tools import objects_to_csv_stream
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.transaction import Transaction
+from amaascore.transactions.utils import json_to_transaction
+
+POOL_SIZE = 200
+
+
+class NullStream(object):
+    """ Discards the csv, so that only the cost of producing it is measured """
+
+    def write(self, data):
+        return len(data)
+
+
+def decoded(json_transactions, number):
+    for i in range(number):
+        yield json_to_transaction(dict(json_transactions[i % len(json_transactions)]))
+
+
+def materialised(transactions, stream):
+    object_dicts = []
+    for transaction in transactions:
+        obj_dict = transaction.to_json()
+        [obj_dict.pop(child, None) for child in Transaction.children().keys()]
+        object_dicts.append(obj_dict)
+    writer = csv.DictWriter(stream, fieldnames=object_dicts[0].keys())
+    writer.writeheader()
+    writer.writerows(object_dicts)
+
+
+def streaming(transactions, stream):
+    objects_to_csv_stream(objects=transactions, stream=stream, clazz=Transaction)
+
+
+def measure(export, json_transactions, number):
+    gc.collect()
+    tracemalloc.start()
+    start = timeit.default_timer()
+    export(decoded(json_transactions, number), NullStream())
+    elapsed = timeit.default_timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main(number):
+    json_transactions = [generate_transaction().to_json() for _ in range(POOL_SIZE)]
+    print('Transactions: %d' % number)
+    for name, export in (('Materialised', materialised), ('Streaming', streaming)):
+        peak, elapsed = measure(export, json_transactions, number)
+        print('%-14s %8.1f MiB peak %6.2fs' % (name, peak / 2 ** 20, elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,71 @@
+"""
+Upload a csv of books against a simulated service, comparing one request per row with the batched UploadPipeline.
+Each simulated request costs a fixed round trip plus a small amount per object.
+
+    python benchmarks/csv_upload.py [number_of_rows] [round_trip_ms]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import csv
+import io
+import sys
+import time
+import timeit
+
+from amaascore.books.book import Book
+from amaascore.csv_upload.pipeline import UploadPipeline
+
+PER_OBJECT_SECONDS = 0.0001
+
+
+def book_handler(row, params):
+    return Book(asset_manager_id=int(row['asset_manager_id']), book_id=row['book_id'])
+
+
+class SimulatedInterface(object):
+
+    def __init__(self, round_trip):
+        self.round_trip = round_trip
+
+    def new(self, book):
+        time.sleep(self.round_trip + PER_OBJECT_SECONDS)
+        return book
+
+    def create_many(self, books):
+        time.sleep(self.round_trip + PER_OBJECT_SECONDS * len(books))
+        return books
+
+
+def generate_csv(rows):
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+    writer.writerow(['asset_manager_id', 'book_id'])
+    for i in range(rows):
+        writer.writerow([1, 'BOOK%s' % i])
+    return stream.getvalue()
+
+
+def one_per_row(text, interface):
+    for row in csv.DictReader(io.StringIO(text)):
+        interface.new(book_handler(row, {}))
+
+
+def main(rows, round_trip):
+    text = generate_csv(rows)
+    interface = SimulatedInterface(round_trip)
+    print('%s rows, %.0f ms round trip' % (rows, round_trip * 1000))
+    start = timeit.default_timer()
+    one_per_row(text, interface)
+    print('%-40s %8.2f s' % ('One request per row', timeit.default_timer() - start))
+    for batch_size, max_in_flight in [(100, 1), (500, 4)]:
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=batch_size,
+                                  max_in_flight=max_in_flight)
+        start = timeit.default_timer()
+        pipeline.run(io.StringIO(text))
+        label = 'Batches of %s, %s in flight' % (batch_size, max_in_flight)
+        print('%-40s %8.2f s' % (label, timeit.default_timer() - start))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+         float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02)
@@ -0,0 +1,65 @@
+"""
+Transactions decoded per second with the model setters parsing their dates with dateutil (the previous
+implementation) and with amaascore.core.dates.  The transactions are drawn from a pool with a year of business dates,
+and each is decoded from a fresh json.loads, so only the decoding is compared.
+
+    python benchmarks/date_parsing.py [number_of_transactions] [pool_size]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import date, timedelta
+from dateutil.parser import parse
+import json
+import random
+import sys
+import timeit
+
+from amaascore.core import dates
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions import transaction
+from amaascore.transactions.utils import json_to_transaction
+
+
+def dateutil_date(value):
+    return parse(value).date()
+
+
+def run(payloads, number):
+    elapsed = timeit.default_timer()
+    for index in range(number):
+        json_to_transaction(json.loads(payloads[index % len(payloads)]))
+    return number / (timeit.default_timer() - elapsed)
+
+
+def parsers_per_second(parser, strings):
+    elapsed = timeit.default_timer()
+    for string in strings:
+        parser(string)
+    return len(strings) / (timeit.default_timer() - elapsed)
+
+
+def main(number, pool_size):
+    business_dates = [date(2017, 1, 2) + timedelta(days=day) for day in range(365)]
+    payloads = []
+    for _ in range(pool_size):
+        transaction_date = random.choice(business_dates)
+        payloads.append(generate_transaction(transaction_date=transaction_date,
+                                             settlement_date=transaction_date + timedelta(days=2)).to_json_string())
+    strings = [json.loads(payload)['execution_time'] for payload in payloads]
+    print('Transactions decoded: %d (from a pool of %d)' % (number, pool_size))
+    print('execution_time parses/s - dateutil: %10.0f  fast path: %10.0f' %
+          (parsers_per_second(parse, strings), parsers_per_second(dates.parse_datetime, strings)))
+    try:
+        transaction.parse_date, transaction.parse_datetime = dateutil_date, parse
+        before = run(payloads, number)
+    finally:
+        transaction.parse_date, transaction.parse_datetime = dates.parse_date, dates.parse_datetime
+    dates.clear_cache()
+    after = run(payloads, number)
+    print('dateutil:              %10.0f transactions/s' % before)
+    print('amaascore.core.dates:  %10.0f transactions/s' % after)
+    print('Speed-up:              %10.2fx' % (after / before))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000, int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
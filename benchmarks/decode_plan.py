@@ -0,0 +1,68 @@
+"""
+Objects-per-second for json_to_transaction, comparing per-object constructor introspection (the previous
+implementation) against the cached DecodePlan.
+
+    python benchmarks/decode_plan.py [number_of_transactions]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import sys
+import timeit
+
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:  # Python 2
+    from inspect import getargspec
+
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.cash_transaction import CashTransaction
+from amaascore.transactions.enums import CASH_TRANSACTION_TYPES
+from amaascore.transactions.transaction import Transaction
+from amaascore.transactions.utils import json_to_transaction
+
+
+def introspecting_json_to_transaction(json_transaction):
+    """ The previous implementation - the constructor signature is inspected for every object """
+    for (collection_name, clazz) in Transaction.children().items():
+        children = json_transaction.pop(collection_name, {})
+        collection = {}
+        for (child_type, child_json) in children.items():
+            if isinstance(child_json, list):
+                child = set()
+                for child_json_in_list in child_json:
+                    child.add(clazz(**child_json_in_list))
+            else:
+                child = clazz(**child_json)
+            collection[child_type] = child
+        json_transaction[collection_name] = collection
+    transaction_type = json_transaction.get('transaction_type')
+    clazz = CashTransaction if transaction_type in CASH_TRANSACTION_TYPES else Transaction
+    args = getargspec(clazz.__init__)
+    clazz_args = args.args + clazz.amaas_model_attributes()
+    constructor_dict = {arg: json_transaction.get(arg) for arg in clazz_args
+                        if json_transaction.get(arg) is not None and arg != 'self'}
+    return clazz(**constructor_dict)
+
+
+def run(converter, json_transactions):
+    # The converters consume their input, so each run decodes a fresh copy (copied outside the timed section)
+    payload = copy.deepcopy(json_transactions)
+    elapsed = timeit.default_timer()
+    for json_transaction in payload:
+        converter(json_transaction)
+    return len(payload) / (timeit.default_timer() - elapsed)
+
+
+def main(number):
+    json_transactions = [generate_transaction().to_json() for _ in range(number)]
+    before = max(run(introspecting_json_to_transaction, json_transactions) for _ in range(3))
+    after = max(run(json_to_transaction, json_transactions) for _ in range(3))
+    print('Transactions decoded: %d' % number)
+    print('Per-object introspection: %10.0f objects/s' % before)
+    print('Cached decode plan:       %10.0f objects/s' % after)
+    print('Speed-up:                 %10.2fx' % (after / before))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
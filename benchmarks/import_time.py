@@ -0,0 +1,59 @@
+"""
+Wall clock time to import the interfaces in a fresh interpreter - i.e. the start up cost paid by every short script or
+serverless function.
+
+    python benchmarks/import_time.py [repeats]
+
+Each import is timed in its own subprocess, and the median over all repeats is reported.  The heaviest modules loaded
+(as reported by python -X importtime, where available) are listed for the first import.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+
+MODULES = ['amaascore.transactions.interface', 'amaascore.assets.interface', 'amaascore.parties.interface',
+           'amaascore.market_data.interface']
+
+TIME_IMPORT = """
+import timeit
+start = timeit.default_timer()
+import %s
+print(timeit.default_timer() - start)
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(module):
+    output = subprocess.check_output([sys.executable, '-c', TIME_IMPORT % module], cwd=ROOT)
+    return float(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def heaviest_imports(module, number=10):
+    if sys.version_info < (3, 7, 0):
+        return []
+    process = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', 'import %s' % module], cwd=ROOT,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, stderr = process.communicate()
+    timings = []
+    for line in stderr.decode('utf-8').splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            timings.append((int(parts[1]), parts[2].strip()))
+    return sorted(timings, reverse=True)[:number]
+
+
+def main(repeats):
+    print('Median import time over %d runs' % repeats)
+    for module in MODULES:
+        timings = sorted(time_import(module) for _ in range(repeats))
+        print('%-40s %8.1f ms' % (module, timings[len(timings) // 2] * 1000))
+    print('\nHeaviest (cumulative) imports for %s' % MODULES[0])
+    for cumulative, name in heaviest_imports(MODULES[0]):
+        print('%-40s %8.1f ms' % (name, cumulative / 1000.0))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,65 @@
+"""
+Equality and serialisation throughput over transaction pairs, comparing the copy-free implementations with the
+previous approach, which mutated both objects and so forced callers to deepcopy them first.
+
+    python benchmarks/model_equality.py [number_of_pairs]
+
+The previous approach is measured on 1% of the pairs, since it is far slower; all figures are reported per second.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import json
+import sys
+import timeit
+
+from amaascore.core.amaas_model import json_handler
+from amaascore.tools.generate_transaction import generate_transaction
+
+POOL_SIZE = 1000
+
+
+def destructive_eq(first, second):
+    """ The previous __eq__ - strips the database fields out of both objects """
+    my_dict = first.__dict__
+    other_dict = second.__dict__
+    [my_dict.pop(attr, None) for attr in first.amaas_model_attributes()]
+    [other_dict.pop(attr, None) for attr in first.amaas_model_attributes()]
+    return my_dict == other_dict
+
+
+def destructive_to_interface(obj):
+    """ The previous to_interface - pops attributes and round trips through a JSON string """
+    dict_to_convert = obj.__dict__
+    [dict_to_convert.pop(attr) for attr in obj.non_interface_attributes()]
+    return json.loads(json.dumps(obj.to_dict(dict_to_convert), ensure_ascii=False, default=json_handler, indent=4,
+                                 separators=(',', ': ')))
+
+
+def rate(func, pairs, number):
+    start = timeit.default_timer()
+    for i in range(number):
+        func(*pairs[i % len(pairs)])
+    return number / (timeit.default_timer() - start)
+
+
+def main(number):
+    transactions = [generate_transaction() for _ in range(POOL_SIZE)]
+    pairs = [(transaction, copy.deepcopy(transaction)) for transaction in transactions]
+    singles = [(transaction,) for transaction in transactions]
+    legacy_number = max(number // 100, 1)
+    results = [
+        ('__eq__ (defensive deepcopy)',
+         rate(lambda a, b: destructive_eq(copy.deepcopy(a), copy.deepcopy(b)), pairs, legacy_number)),
+        ('__eq__ (copy-free)', rate(lambda a, b: a == b, pairs, number)),
+        ('to_interface (defensive deepcopy)',
+         rate(lambda a: destructive_to_interface(copy.deepcopy(a)), singles, legacy_number)),
+        ('to_interface (copy-free)', rate(lambda a: a.to_interface(), singles, number)),
+    ]
+    print('Transaction pairs: %d' % number)
+    for name, ops in results:
+        print('%-35s %12.0f ops/s' % (name, ops))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
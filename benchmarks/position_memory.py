@@ -0,0 +1,44 @@
+"""
+Memory used by a large number of positions, comparing the default (__dict__ based) Position with CompactPosition.
+
+    python benchmarks/position_memory.py [number_of_positions]
+
+Positions are decoded from JSON through json_to_position, as they would be from a position search.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from amaascore.tools.generate_transaction import generate_position
+from amaascore.transactions.utils import json_to_position
+
+POOL_SIZE = 1000
+
+
+def measure(json_positions, number, compact):
+    gc.collect()
+    tracemalloc.start()
+    start = timeit.default_timer()
+    positions = [json_to_position(dict(json_positions[i % len(json_positions)]), compact=compact)
+                 for i in range(number)]
+    elapsed = timeit.default_timer() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del positions
+    return current, peak, elapsed
+
+
+def main(number):
+    json_positions = [generate_position().to_json() for _ in range(POOL_SIZE)]
+    print('Positions: %d' % number)
+    for name, compact in (('Position', False), ('CompactPosition', True)):
+        current, peak, elapsed = measure(json_positions, number, compact)
+        print('%-16s %8.1f MiB held %8.1f MiB peak %6.0f bytes/position %6.2fs' %
+              (name, current / 2 ** 20, peak / 2 ** 20, current / number, elapsed))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,47 @@
+"""
+Decode and aggregate a position search response, comparing a list of Position objects with a PositionSet.
+
+    python benchmarks/position_set.py [number_of_positions]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import random
+import sys
+import timeit
+
+from amaascore.tools.generate_transaction import generate_position
+from amaascore.transactions.position_set import PositionSet
+from amaascore.transactions.utils import json_to_position
+
+BOOKS = ['BOOK%s' % i for i in range(50)]
+
+
+def sum_by_book(positions):
+    totals = {}
+    for position in positions:
+        totals[position.book_id] = totals.get(position.book_id, Decimal(0)) + position.quantity
+    return totals
+
+
+def timed(func, *args):
+    start = timeit.default_timer()
+    result = func(*args)
+    return result, timeit.default_timer() - start
+
+
+def main(number):
+    json_positions = [generate_position(book_id=random.choice(BOOKS)).to_json() for _ in range(number)]
+    positions, list_decode = timed(lambda: [json_to_position(dict(json_position)) for json_position in json_positions])
+    position_set, set_decode = timed(PositionSet.from_json, json_positions)
+    list_totals, list_sum = timed(sum_by_book, positions)
+    set_totals, set_sum = timed(position_set.sum_by, 'book_id')
+    assert list_totals == set_totals
+    print('Positions: %d' % number)
+    print('%-12s %10s %10s' % ('', 'decode', 'sum_by'))
+    print('%-12s %9.3fs %9.3fs' % ('Position', list_decode, list_sum))
+    print('%-12s %9.3fs %9.3fs' % ('PositionSet', set_decode, set_sum))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,76 @@
+"""
+Send requests from a pool of threads to a simulated service which throttles (429) any request beyond its capacity,
+with and without an adaptive concurrency limit.  Throttled requests are retried after a short backoff, as the
+transport's retries would.
+
+    python benchmarks/throttle.py [number_of_requests] [threads] [capacity]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+import timeit
+
+from amaascore.core.throttle import AdaptiveConcurrencyLimit, Throttle
+
+ROUND_TRIP = 0.01
+BACKOFF = 0.05
+
+
+class Response(object):
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class SimulatedService(object):
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def request(self):
+        with self.lock:
+            if self.in_flight >= self.capacity:
+                self.throttled += 1
+                return Response(429)
+            self.in_flight += 1
+        time.sleep(ROUND_TRIP)
+        with self.lock:
+            self.in_flight -= 1
+        return Response(200)
+
+
+def run(requests, threads, capacity, throttle):
+    service = SimulatedService(capacity)
+
+    def send():
+        while True:
+            response = throttle.send(service.request) if throttle else service.request()
+            if response.status_code != 429:
+                return
+            time.sleep(BACKOFF)
+
+    start = timeit.default_timer()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in range(requests):
+            executor.submit(send)
+    return timeit.default_timer() - start, service.throttled
+
+
+def main(requests, threads, capacity):
+    print('%s requests from %s threads, service capacity %s' % (requests, threads, capacity))
+    for label, throttle in [('Unthrottled', None),
+                            ('Adaptive concurrency limit', Throttle(concurrency=AdaptiveConcurrencyLimit()))]:
+        elapsed, throttled = run(requests, threads, capacity, throttle)
+        print('%-30s %8.2f s %8s throttled' % (label, elapsed, throttled))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 32,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 8)
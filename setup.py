@@ -3,6 +3,7 @@ from setuptools import setup, find_packages
 requires = [
     'amaasutils',
     'configparser',
+    'futures;python_version<"3.0"',
     'python-dateutil',
     'pytz',
     'requests',
@@ -28,4 +29,7 @@ setup(
     ],
     packages=find_packages(exclude=['tests']),  # Very annoying that this doesnt work - I have to include a MANIFEST
     install_requires=requires,
+    extras_require={
+        'arrow': ['pyarrow'],
+    },
 )
@@ -10,6 +10,7 @@ from amaascore.assets.asset import Asset
 from amaascore.assets.bond_option import BondOption
 from amaascore.assets.foreign_exchange import ForeignExchange
 from amaascore.assets.interface import AssetsInterface
+from amaascore.core.cache import LRUCache, ResponseStore
 from amaascore.tools.generate_asset import generate_asset, generate_foreignexchange, generate_assets
 from unit.config import ENVIRONMENT
 
@@ -108,6 +109,94 @@ class AssetsInterfaceTest(unittest.TestCase):
         asset_manager_assets = self.assets_interface.assets_by_asset_manager(asset_manager_id=self.asset_manager_id)
         self.assertEqual(assets, asset_manager_assets)
 
+    @requests_mock.Mocker()
+    def test_AssetsByAssetManagerNotModified(self, mocker):
+        endpoint = '%s/assets/%s' % (self.assets_interface.endpoint, self.asset_manager_id)
+        assets = generate_assets(asset_manager_ids=[self.asset_manager_id])
+        mocker.get(endpoint, json=[asset.to_json() for asset in assets], headers={'ETag': '"v1"'})
+        self.assets_interface.response_store = ResponseStore()
+        try:
+            first = self.assets_interface.assets_by_asset_manager(asset_manager_id=self.asset_manager_id)
+            self.assertNotIn('If-None-Match', mocker.last_request.headers)
+            mocker.get(endpoint, status_code=304)
+            second = self.assets_interface.assets_by_asset_manager(asset_manager_id=self.asset_manager_id)
+            self.assertEqual(mocker.last_request.headers.get('If-None-Match'), '"v1"')
+            self.assertEqual(assets, second)
+            self.assertIsNot(first, second)
+            self.assertEqual(self.assets_interface.response_store.stats.hits, 1)
+        finally:
+            self.assets_interface.response_store = None
+
+    @requests_mock.Mocker()
+    def test_RetrieveMany(self, mocker):
+        endpoint = '%s/assets/%s' % (self.assets_interface.endpoint, self.asset_manager_id)
+        assets = generate_assets(asset_manager_ids=[self.asset_manager_id], number=5)
+        assets_by_id = {asset.asset_id: asset.to_json() for asset in assets}
+
+        def search_callback(request, context):
+            asset_ids = request.qs['asset_ids'][0].split(',')
+            return [assets_by_id[asset_id] for asset_id in asset_ids if asset_id in assets_by_id]
+
+        mocker.get(endpoint, json=search_callback)
+        asset_ids = list(assets_by_id.keys()) + ['MISSING']
+        results, errors = self.assets_interface.retrieve_many(self.asset_manager_id, asset_ids, chunk_size=2)
+        self.assertEqual(set(results.keys()), set(assets_by_id.keys()))
+        self.assertEqual(list(errors.keys()), ['MISSING'])
+        self.assertEqual(mocker.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_CreateManyUpsert(self, mocker):
+        endpoint = '%s/assets/%s' % (self.assets_interface.endpoint, self.asset_manager_id)
+        assets = generate_assets(asset_manager_ids=[self.asset_manager_id], number=3)
+        mocker.post(endpoint, json=[asset.to_json() for asset in assets])
+        results = self.assets_interface.create_many(assets, upsert=True)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(mocker.last_request.qs, {'upsert': ['true']})
+        self.assets_interface.create_many(assets)
+        self.assertEqual(mocker.last_request.qs, {})
+
+    @requests_mock.Mocker()
+    def test_RetrieveCached(self, mocker):
+        endpoint = '%s/assets/%s/%s' % (self.assets_interface.endpoint, self.asset_manager_id, self.asset_id)
+        self.asset.version = 2
+        mocker.get(endpoint, json=self.asset.to_json())
+        mocker.put(endpoint, json=self.asset.to_json())
+        self.assets_interface.cache = LRUCache()
+        try:
+            asset = self.assets_interface.retrieve(self.asset_manager_id, self.asset_id)
+            asset.description = 'Modified after retrieval'
+            cached = self.assets_interface.retrieve(self.asset_manager_id, self.asset_id)
+            self.assertEqual(cached, self.asset)
+            # Also cached under its own version
+            self.assets_interface.retrieve(self.asset_manager_id, self.asset_id, version=2)
+            self.assertEqual(mocker.call_count, 1)
+            self.assets_interface.amend(self.asset)
+            self.assets_interface.retrieve(self.asset_manager_id, self.asset_id)
+            self.assertEqual(mocker.call_count, 3)
+            self.assertEqual(self.assets_interface.cache.stats.hits, 2)
+            self.assertEqual(self.assets_interface.cache.stats.misses, 2)
+        finally:
+            self.assets_interface.cache = None
+
+    @requests_mock.Mocker()
+    def test_RetrieveCachedUpsertMany(self, mocker):
+        endpoint = '%s/assets/%s' % (self.assets_interface.endpoint, self.asset_manager_id)
+        self.asset.version = 1
+        mocker.get('%s/%s' % (endpoint, self.asset_id), json=self.asset.to_json())
+        self.assets_interface.cache = LRUCache()
+        try:
+            self.assets_interface.retrieve(self.asset_manager_id, self.asset_id)
+            upserted = self.asset.to_json()
+            upserted.update(version=2, description='Upserted')
+            mocker.post(endpoint, json=[upserted])
+            mocker.get('%s/%s' % (endpoint, self.asset_id), json=upserted)
+            self.assets_interface.create_many([self.asset], upsert=True)
+            # The bulk upsert invalidated the cached asset, so the upserted version is retrieved
+            asset = self.assets_interface.retrieve(self.asset_manager_id, self.asset_id)
+            self.assertEqual((asset.version, asset.description), (2, 'Upserted'))
+        finally:
+            self.assets_interface.cache = None
+
     def test_ChildrenPopulated(self):
         asset = self.assets_interface.new(self.asset)
         retrieved_asset = self.assets_interface.retrieve(asset_manager_id=self.asset_manager_id,
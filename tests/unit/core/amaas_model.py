@@ -1,8 +1,14 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+import datetime
+from decimal import Decimal
+import json
 import unittest
 
-from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.amaas_model import AMaaSModel, to_json, to_json_string
+from amaascore.tools.generate_book import generate_book
+from amaascore.tools.generate_transaction import generate_transaction
 
 
 class AMaaSModelTest(unittest.TestCase):
@@ -12,6 +18,32 @@ class AMaaSModelTest(unittest.TestCase):
         self.assertEqual(type(model.version), int)
         self.assertEqual(model.version, 1)
 
+    def test_ToJsonMatchesRoundTrip(self):
+        # The single pass encoder must produce exactly what a dumps -> loads round trip would
+        transaction = generate_transaction()
+        self.assertEqual(transaction.to_json(), json.loads(transaction.to_json_string()))
+        values = {'decimal': Decimal('1.25'), 'dates': {datetime.date(2017, 1, 2)}, 1: (1, 2), None: True,
+                  'delta': datetime.timedelta(hours=1, minutes=30), 'model': AMaaSModel(version=2)}
+        self.assertEqual(to_json(values), json.loads(to_json_string(values)))
+
+    def test_EqualityIsNonDestructive(self):
+        transaction = generate_transaction()
+        transaction.created_by = 'TEST'
+        other = copy.deepcopy(transaction)
+        other.created_by = 'OTHER'  # Database generated fields are ignored
+        self.assertEqual(transaction, other)
+        self.assertEqual(transaction.created_by, 'TEST')
+        self.assertEqual(other.created_by, 'OTHER')
+        other.price = transaction.price + 1
+        self.assertNotEqual(transaction, other)
+
+    def test_ToInterfaceIsNonDestructive(self):
+        book = generate_book()
+        book.positions = []
+        json_book = book.to_interface()
+        self.assertNotIn('positions', json_book)
+        self.assertEqual(book.positions, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+import threading
+import time
+import unittest
+
+
+class DummySession(object):
+
+    def get(self, url, **kwargs):
+        return url
+
+
+class DummyInterface(object):
+    """ Stands in for an Interface so that the async wrapper can be tested without a login """
+
+    def __init__(self):
+        self.session = DummySession()
+        self.endpoint = 'DUMMY'
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def retrieve(self, asset_manager_id, asset_id):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        return asset_manager_id, asset_id
+
+    def fail(self):
+        raise ValueError('Failed')
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio interfaces require Python 3.5+')
+class AsyncInterfaceTest(unittest.TestCase):
+
+    def setUp(self):
+        import asyncio
+        from amaascore.core.async_interface import AsyncInterface
+        self.loop = asyncio.new_event_loop()
+        self.interface = DummyInterface()
+        self.async_interface = AsyncInterface(self.interface, max_concurrency=3)
+
+    def tearDown(self):
+        self.async_interface.close()
+        self.loop.close()
+
+    def test_MethodIsAwaitable(self):
+        result = self.loop.run_until_complete(self.async_interface.retrieve(asset_manager_id=1, asset_id='A'))
+        self.assertEqual(result, (1, 'A'))
+
+    def test_NonCallableAttributesPassThrough(self):
+        self.assertEqual(self.async_interface.endpoint, 'DUMMY')
+
+    def test_MapIsOrderedAndBounded(self):
+        calls = [{'asset_manager_id': 1, 'asset_id': str(i)} for i in range(12)]
+        results = self.loop.run_until_complete(self.async_interface.map('retrieve', calls))
+        self.assertEqual(results, [(1, str(i)) for i in range(12)])
+        self.assertLessEqual(self.interface.max_in_flight, 3)
+
+    def test_MapReturnExceptions(self):
+        results = self.loop.run_until_complete(self.async_interface.map('fail', [{}, {}], return_exceptions=True))
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_AsyncSession(self):
+        result = self.loop.run_until_complete(self.async_interface.session.get('http://example'))
+        self.assertEqual(result, 'http://example')
+
+
+if __name__ == '__main__':
+    unittest.main()
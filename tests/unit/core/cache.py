@@ -0,0 +1,132 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from amaascore.core.cache import Cache, LRUCache, ResponseStore, SqliteCache
+
+
+class CacheTests(object):
+    """ Tests common to every Cache - mixed in to a TestCase defining create_cache """
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.cache = self.create_cache(ttl=300)
+        self.key = Cache.generate_key('assets', 1, 'ASSET1')
+        self.asset_json = {'asset_id': 'ASSET1', 'version': 2, 'description': 'Test'}
+
+    def test_GetAndSet(self):
+        self.assertIsNone(self.cache.get(self.key))
+        self.cache.set(self.key, self.asset_json)
+        cached = self.cache.get(self.key)
+        self.assertEqual(cached, self.asset_json)
+        # Each hit is a new copy
+        cached['description'] = 'Modified'
+        self.assertEqual(self.cache.get(self.key), self.asset_json)
+        self.assertEqual(self.cache.stats.hits, 2)
+        self.assertEqual(self.cache.stats.misses, 1)
+
+    def test_Expiry(self):
+        cache = self.create_cache(ttl=0)
+        cache.set(self.key, self.asset_json)
+        self.assertIsNone(cache.get(self.key))
+
+    def test_Invalidate(self):
+        version_key = Cache.generate_key('assets', 1, 'ASSET1', version=2)
+        self.cache.set(self.key, self.asset_json)
+        self.cache.set(version_key, self.asset_json)
+        self.cache.invalidate('assets', 1, 'ASSET1')
+        self.assertIsNone(self.cache.get(self.key))
+        # Explicit versions never change, so are kept
+        self.assertEqual(self.cache.get(version_key), self.asset_json)
+        self.assertEqual(self.cache.stats.invalidations, 1)
+
+    def test_InvalidateAssetManager(self):
+        # Explicit versions are removed too, but not other asset managers or namespaces
+        for other_key in [Cache.generate_key('assets', 2, 'ASSET1'), Cache.generate_key('books', 1, 'ASSET1')]:
+            version_key = Cache.generate_key('assets', 1, 'ASSET1', version=2)
+            self.cache.set(version_key, self.asset_json)
+            self.cache.set(other_key, self.asset_json)
+            self.cache.invalidate_asset_manager('assets', '1')
+            self.assertIsNone(self.cache.get(version_key))
+            self.assertEqual(self.cache.get(other_key), self.asset_json)
+
+    def test_Clear(self):
+        self.cache.set(self.key, self.asset_json)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(self.key))
+
+
+class LRUCacheTest(CacheTests, unittest.TestCase):
+
+    def create_cache(self, ttl):
+        return LRUCache(max_size=2, ttl=ttl)
+
+    def test_Eviction(self):
+        keys = [Cache.generate_key('books', 1, 'BOOK%s' % i) for i in range(3)]
+        self.cache.set(keys[0], {})
+        self.cache.set(keys[1], {})
+        self.cache.get(keys[0])  # Now the most recently used
+        self.cache.set(keys[2], {})
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.stats.evictions, 1)
+
+
+class SqliteCacheTest(CacheTests, unittest.TestCase):
+
+    def create_cache(self, ttl):
+        if not hasattr(self, 'directory'):
+            self.directory = tempfile.mkdtemp()
+        return SqliteCache(filename=os.path.join(self.directory, 'cache.sqlite'), ttl=ttl)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_Shared(self):
+        self.cache.set(self.key, self.asset_json)
+        other = self.create_cache(ttl=300)
+        self.assertEqual(other.get(self.key), self.asset_json)
+        other.invalidate('assets', 1, 'ASSET1')
+        self.assertIsNone(self.cache.get(self.key))
+        other.close()
+
+class ResponseStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.store = ResponseStore(max_size=2)
+        self.key = ResponseStore.generate_key('https://example.com/holidays', {'years': '2017', 'country_codes': 'USA'})
+
+    def test_Key(self):
+        self.assertEqual(self.key, ResponseStore.generate_key('https://example.com/holidays',
+                                                              {'country_codes': 'USA', 'years': '2017'}))
+
+    def test_Validators(self):
+        self.assertEqual(self.store.validators(self.key), {})
+        self.store.set(self.key, '"abc"', 'Wed, 21 Oct 2015 07:28:00 GMT', ['Result'])
+        self.assertEqual(self.store.validators(self.key), {'If-None-Match': '"abc"',
+                                                           'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        result = self.store.get(self.key)
+        self.assertEqual(result, ['Result'])
+        result.append('Added')
+        self.assertEqual(self.store.get(self.key), ['Result'])
+
+    def test_NoValidators(self):
+        self.store.set(self.key, None, None, ['Result'])
+        self.assertIsNone(self.store.get(self.key))
+        self.assertEqual(self.store.stats.misses, 1)
+
+    def test_Eviction(self):
+        for i in range(3):
+            self.store.set(('url%s' % i, ()), '"%s"' % i, None, [i])
+        self.assertEqual(len(self.store), 2)
+        self.assertIsNone(self.store.get(('url0', ())))
+        self.assertEqual(self.store.stats.evictions, 1)
+
+if __name__ == '__main__':
+    unittest.main()
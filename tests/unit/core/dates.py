@@ -0,0 +1,62 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import date
+from dateutil.parser import parse
+import json
+import unittest
+
+from amaascore.core import dates
+from amaascore.core.dates import parse_date, parse_datetime
+from amaascore.market_data.fx_rate import FXRate
+from amaascore.tools.generate_transaction import generate_transaction
+from amaascore.transactions.utils import json_to_transaction
+
+STRINGS = ['2017-01-02', '2017-01-02T03:04:05', '2017-01-02 03:04:05.678', '2017-01-02T03:04:05.123456+00:00',
+           '2017-01-02T03:04:05+08:00', '2017-01-02T03:04:05-05:30', '2017-01-02T03:04:05Z', '02/01/2017',
+           'Jan 2 2017 3:04pm', '2017-01-02T03:04:05.1234567']
+
+
+class DatesTest(unittest.TestCase):
+
+    def setUp(self):
+        dates.clear_cache()
+
+    def test_SameAsDateutil(self):
+        for string in STRINGS:
+            expected = parse(string)
+            result = parse_datetime(string)
+            self.assertEqual(result, expected, string)
+            self.assertEqual(result.utcoffset(), expected.utcoffset(), string)
+            self.assertEqual(parse_date(string), expected.date(), string)
+
+    def test_Timezones(self):
+        # The fast path gives dateutil's timezones, not datetime.timezone
+        self.assertEqual(repr(parse_datetime('2017-01-02T03:04:05+08:00').tzinfo), 'tzoffset(None, 28800)')
+        self.assertEqual(repr(parse_datetime('2017-01-02T03:04:05+00:00').tzinfo), 'tzutc()')
+        self.assertIsNone(parse_datetime('2017-01-02T03:04:05').tzinfo)
+
+    def test_Invalid(self):
+        for string in ['2017-13-01', '2017-02-30T00:00:00', 'not a date']:
+            with self.assertRaises(ValueError):
+                parse_date(string)
+            with self.assertRaises(ValueError):
+                parse_datetime(string)
+
+    def test_Memoized(self):
+        self.assertIs(parse_date('2017-01-02'), parse_date('2017-01-02'))
+        self.assertIs(parse_date('02/01/2017'), parse_date('02/01/2017'))
+        dates.clear_cache()
+        self.assertEqual(dates._dates, {})
+
+    def test_Models(self):
+        transaction = generate_transaction(transaction_date=date(2017, 1, 2))
+        decoded = json_to_transaction(json.loads(transaction.to_json_string()))
+        self.assertEqual(decoded.transaction_date, date(2017, 1, 2))
+        self.assertEqual(decoded.execution_time, transaction.execution_time)
+        fx_rate = FXRate(asset_manager_id=1, asset_id='USDJPY', business_date='2017-01-02',
+                         rate_timestamp='2017-01-02T03:04:05', rate=110, rate_type='close')
+        self.assertEqual(fx_rate.business_date, date(2017, 1, 2))
+        self.assertEqual(fx_rate.rate_timestamp.utcoffset().total_seconds(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
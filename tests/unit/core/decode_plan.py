@@ -0,0 +1,40 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+
+from amaascore.core.decode_plan import decode_plan
+from amaascore.transactions.mtm_result import MTMResult
+from amaascore.transactions.transaction import Transaction
+from amaascore.tools.generate_transaction import generate_transaction
+
+
+class DecodePlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+
+    def test_PlanIsCached(self):
+        self.assertIs(decode_plan(Transaction), decode_plan(Transaction))
+
+    def test_Arguments(self):
+        plan = decode_plan(Transaction)
+        self.assertNotIn('self', plan.arguments)
+        self.assertIn('transaction_date', plan.arguments)
+        self.assertIn('created_by', plan.arguments)  # Always added from the AMaaSModel attributes
+        self.assertIn('asset_manager_id', plan.mandatory)
+        self.assertNotIn('transaction_status', plan.mandatory)
+
+    def test_Decode(self):
+        transaction = generate_transaction()
+        json_transaction = transaction.to_json()
+        json_transaction['not_a_constructor_argument'] = 'ignored'
+        decoded = decode_plan(Transaction).decode(json_transaction)
+        self.assertEqual(decoded, transaction)
+
+    def test_CheckMandatory(self):
+        with self.assertRaisesRegexp(ValueError, 'asset_manager_id'):
+            decode_plan(MTMResult).check_mandatory({'book_id': 'BOOK'})
+
+
+if __name__ == '__main__':
+    unittest.main()
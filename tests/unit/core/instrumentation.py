@@ -0,0 +1,110 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import json
+import socket
+import unittest
+
+from amaascore.books.utils import json_to_book
+from amaascore.core import instrumentation
+from amaascore.core.instrumentation import DecodeEvent, HistogramCollector, RequestEvent, StatsdHook
+from amaascore.tools.generate_book import generate_book
+
+
+def request_event(endpoint_type='assets', method='GET', status=200, total_time=0.02):
+    return RequestEvent(endpoint_type=endpoint_type, method=method, url='https://amaas.test/', status=status,
+                        bytes_sent=None, bytes_received=2000, server_time=0.015, total_time=total_time,
+                        encode_time=None)
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.events = []
+        instrumentation.add_hook(self.events.append)
+        self.addCleanup(instrumentation.remove_hook, self.events.append)
+
+    def test_DecodeEvent(self):
+        book = generate_book()
+        self.assertEqual(json_to_book(book.to_json()), book)
+        self.assertEqual(len(self.events), 1)
+        self.assertEqual(self.events[0].decoder, 'json_to_book')
+        instrumentation.remove_hook(self.events.append)
+        json_to_book(book.to_json())
+        self.assertEqual(len(self.events), 1)
+
+    def test_FailingHook(self):
+        def failing_hook(event):
+            raise ValueError('Broken hook')
+        instrumentation.add_hook(failing_hook)
+        self.addCleanup(instrumentation.remove_hook, failing_hook)
+        book = generate_book()
+        self.assertEqual(json_to_book(book.to_json()), book)
+        self.assertEqual(len(self.events), 1)
+
+    def test_PrepareRequest(self):
+        kwargs, encode_time, counter = instrumentation.prepare_request({'json': {'book_id': 'BOOK1'}})
+        self.assertEqual(json.loads(kwargs['data'].decode('utf-8')), {'book_id': 'BOOK1'})
+        self.assertEqual(kwargs['headers'], {'Content-Type': 'application/json'})
+        self.assertIsNotNone(encode_time)
+        kwargs, encode_time, counter = instrumentation.prepare_request({'data': (chunk for chunk in [b'[', b']'])})
+        self.assertEqual(b''.join(kwargs['data']), b'[]')
+        self.assertEqual(counter, [2])
+
+
+class HistogramCollectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.collector = HistogramCollector()
+
+    def test_Histograms(self):
+        for total_time in [0.02, 0.02, 3.0]:
+            self.collector(request_event(total_time=total_time))
+        self.collector(request_event(endpoint_type='books', total_time=0.001))
+        self.collector(DecodeEvent('json_to_asset', 0.0002))
+        histogram = self.collector.histogram('amaas_request_seconds', endpoint_type='assets', method='GET',
+                                             status=200)
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.sum, 3.04)
+        self.assertEqual(histogram.quantile(0.5), 0.025)
+        self.assertEqual(histogram.quantile(0.99), 5.0)
+        summary = self.collector.summary()
+        self.assertEqual([row['labels']['endpoint_type'] for row in summary], ['assets', 'books'])
+        self.assertEqual(self.collector.summary('amaas_decode_seconds')[0]['labels'], {'decoder': 'json_to_asset'})
+
+    def test_Prometheus(self):
+        self.collector(request_event())
+        self.collector(DecodeEvent('json_to_asset', 0.0002))
+        text = self.collector.to_prometheus()
+        self.assertIn('# TYPE amaas_request_seconds histogram', text)
+        self.assertIn('amaas_request_seconds_bucket{endpoint_type="assets",method="GET",status="200",le="0.025"} 1',
+                      text)
+        self.assertIn('amaas_request_seconds_bucket{endpoint_type="assets",method="GET",status="200",le="+Inf"} 1',
+                      text)
+        self.assertIn('amaas_request_received_bytes_sum{endpoint_type="assets",method="GET",status="200"} 2000',
+                      text)
+        self.assertIn('amaas_decode_seconds_count{decoder="json_to_asset"} 1', text)
+        # Requests without a body (or encoding) are not recorded as zero sized
+        self.assertNotIn('amaas_request_sent_bytes', text)
+
+
+class StatsdHookTest(unittest.TestCase):
+
+    def test_Send(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(5)
+        self.addCleanup(server.close)
+        hook = StatsdHook(host='127.0.0.1', port=server.getsockname()[1], prefix='test')
+        self.addCleanup(hook.close)
+        hook(request_event(status=404))
+        metrics = server.recv(4096).decode('utf-8').split('\n')
+        self.assertIn('test.request.assets.get.status.404:1|c', metrics)
+        self.assertIn('test.request.assets.get.time:20.000|ms', metrics)
+        self.assertIn('test.request.assets.get.bytes_received:2000|h', metrics)
+        hook(DecodeEvent('json_to_asset', 0.0002))
+        self.assertEqual(server.recv(4096).decode('utf-8'), 'test.decode.json_to_asset:0.200|ms')
+
+if __name__ == '__main__':
+    unittest.main()
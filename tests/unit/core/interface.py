@@ -1,11 +1,25 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from amaasutils.logging_utils import DEFAULT_LOGGING
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import gzip
+import io
+import json
 import logging.config
+import requests_mock
+import shutil
+import tempfile
+import threading
+import time
 import unittest
 
-from amaascore.core.interface import Interface
+from amaascore.core import instrumentation
+from amaascore.core.interface import Interface, iter_retrieve_many, json_stream
+from amaascore.core.throttle import AdaptiveConcurrencyLimit, Throttle
+from amaascore.core.token_cache import TokenCache
+from amaascore.core.transport import TransportConfig
+from amaascore.tools.generate_transaction import generate_transactions
 
 logging.config.dictConfig(DEFAULT_LOGGING)
 
@@ -30,6 +44,168 @@ class InterfaceTest(unittest.TestCase):
         # Fake the last_authenticated timing
         interface1.session.last_authenticated = datetime.utcnow() - timedelta(hours=1)
         self.assertEqual(interface1.session.needs_refresh(), True)
+        # Sessions which are more than a day old should also be refreshed
+        interface1.session.last_authenticated = datetime.utcnow() - timedelta(days=1, minutes=1)
+        self.assertEqual(interface1.session.needs_refresh(), True)
+
+    def fake_refresh(self, session):
+        """ Replace the Cognito refresh on the (shared) session with one which reissues the current tokens """
+        refreshes = []
+
+        def refresh_tokens():
+            refreshes.append(datetime.utcnow())
+            session.update_tokens(session.tokens)
+            return True
+        session.refresh_tokens = refresh_tokens
+        self.addCleanup(delattr, session, 'refresh_tokens')
+        return refreshes
+
+    @requests_mock.Mocker()
+    def test_RefreshInBackground(self, mocker):
+        session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger).session
+        refreshes = self.fake_refresh(session)
+        mocker.get('https://amaas.test/dummy', json={})
+        # Due a refresh, but the tokens are still valid, so the request should go ahead on the current tokens
+        session.last_authenticated = datetime.utcnow() - timedelta(minutes=50)
+        self.assertEqual(session.get('https://amaas.test/dummy').status_code, 200)
+        session.refresher.join()
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(session.needs_refresh(), False)
+
+    @requests_mock.Mocker()
+    def test_RefreshWhenExpired(self, mocker):
+        session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger).session
+        refreshes = self.fake_refresh(session)
+        mocker.get('https://amaas.test/dummy', json={})
+        session.last_authenticated = datetime.utcnow() - timedelta(days=2)
+        self.assertEqual(session.get('https://amaas.test/dummy').status_code, 200)
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(session.tokens_expired(), False)
+
+    @requests_mock.Mocker()
+    def test_RetryWhenUnauthorised(self, mocker):
+        session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger).session
+        refreshes = self.fake_refresh(session)
+        mocker.get('https://amaas.test/dummy', [{'status_code': 401}, {'status_code': 200, 'json': {}}])
+        self.assertEqual(session.get('https://amaas.test/dummy').status_code, 200)
+        self.assertEqual(len(refreshes), 1)
+
+    @requests_mock.Mocker()
+    def test_Transport(self, mocker):
+        transport = TransportConfig(pool_maxsize=32, compress_requests=True, compress_threshold=0)
+        session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger, transport=transport).session
+        mocker.post('https://amaas.test/dummy', json={})
+        self.assertEqual(session.post('https://amaas.test/dummy', json={'asset_id': 'A'}).status_code, 200)
+        request = mocker.last_request
+        self.assertEqual(request.headers.get('Content-Encoding'), 'gzip')
+        self.assertEqual(request.headers.get('Authorization'), session.tokens.get('IdToken'))
+        self.assertEqual(json.loads(gzip.GzipFile(fileobj=io.BytesIO(request.body)).read().decode('utf-8')),
+                         {'asset_id': 'A'})
+        # The login is shared with interfaces using the default transport
+        default_session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger).session
+        self.assertIs(session.amaas_session.__dict__, default_session.__dict__)
+        self.assertEqual(session.http_session(transport).get_adapter('https://amaas.test')._pool_maxsize, 32)
+
+    @requests_mock.Mocker()
+    def test_Throttle(self, mocker):
+        throttle = Throttle(concurrency=AdaptiveConcurrencyLimit(initial_limit=8))
+        interface = Interface(endpoint_type='DUMMY', endpoint='https://amaas.test/dummy', logger=logger,
+                              throttle=throttle)
+        self.addCleanup(interface.session.throttles.pop, 'DUMMY')
+        mocker.get('https://amaas.test/dummy/1', status_code=429)
+        mocker.get('https://amaas.test/other', json={})
+        self.assertEqual(interface.session.get('https://amaas.test/dummy/1').status_code, 429)
+        self.assertEqual(throttle.concurrency.limit, 4)
+        # Only the requests to the interface's own service are throttled
+        self.assertIsNone(interface.session.throttle('https://amaas.test/other'))
+        self.assertIs(Interface(endpoint_type='DUMMY', endpoint='https://amaas.test/dummy',
+                                logger=logger).session.throttle('https://amaas.test/dummy/2'), throttle)
+
+    @requests_mock.Mocker()
+    def test_Instrumentation(self, mocker):
+        session = Interface(endpoint_type='DUMMY', endpoint='https://amaas.test/dummy', logger=logger).session
+        events = []
+        instrumentation.add_hook(events.append)
+        self.addCleanup(instrumentation.remove_hook, events.append)
+        mocker.post('https://amaas.test/dummy/1', json={'book_id': 'BOOK1'}, status_code=201)
+        response = session.post('https://amaas.test/dummy/1', json={'book_id': 'BOOK1'})
+        self.assertEqual(response.json(), {'book_id': 'BOOK1'})
+        self.assertEqual(mocker.last_request.json(), {'book_id': 'BOOK1'})
+        event = events[0]
+        self.assertEqual((event.endpoint_type, event.method, event.status), ('DUMMY', 'POST', 201))
+        self.assertEqual(event.bytes_sent, len(b'{"book_id": "BOOK1"}'))
+        self.assertEqual(event.bytes_received, len(response.content))
+        self.assertIsNotNone(event.encode_time)
+        # Parsing the response is reported separately from the request
+        self.assertEqual([(event.kind, event.endpoint_type, event.size) for event in events[1:]],
+                         [('parse', 'DUMMY', len(response.content))])
+
+    def test_TokenCache(self):
+        session = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger).session
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        token_cache = TokenCache(directory=directory)
+        session.token_cache = token_cache
+        self.addCleanup(setattr, session, 'token_cache', None)
+        # Tokens which another process obtained after ours should be picked up rather than logging in again
+        tokens = dict(session.tokens, IdToken='FROM_CACHE')
+        token_cache.store(session.cache_key, tokens, datetime.utcnow())
+        session.refresh(force=True)
+        self.assertEqual(session.tokens.get('IdToken'), 'FROM_CACHE')
+        self.assertEqual(session.session.headers.get('Authorization'), 'FROM_CACHE')
+
+    def test_JsonStream(self):
+        transactions = generate_transactions(asset_manager_ids=[1], number=3)
+        body = b''.join(json_stream(transactions)).decode('utf-8')
+        self.assertEqual(json.loads(body), [transaction.to_interface() for transaction in transactions])
+        self.assertEqual(b''.join(json_stream([])), b'[]')
+
+    def test_IterRetrieveMany(self):
+        searched = []
+
+        def search(chunk):
+            searched.append(chunk)
+            if 'BAD' in chunk:
+                raise ValueError('Search failed')
+            return [object_id.lower() for object_id in chunk]
+
+        # IDs are consumed lazily, so a generator is fine - and duplicates are only searched for once
+        ids = (object_id for object_id in ['A', 'B', 'C', 'A', 'D', 'BAD'])
+        results = list(iter_retrieve_many(search=search, ids=ids, chunk_size=2, max_workers=1))
+        self.assertEqual(sorted(searched), [['A', 'B'], ['BAD'], ['C', 'D']])
+        found = sorted(obj for _, objects, _ in results for obj in objects)
+        self.assertEqual(found, ['a', 'b', 'c', 'd'])
+        errors = [(chunk, str(error)) for chunk, _, error in results if error is not None]
+        self.assertEqual(errors, [(['BAD'], 'Search failed')])
+
+    def test_IterRetrieveManySharedExecutor(self):
+        running = [0, 0]  # Searches running now, and the most at once
+        lock = threading.Lock()
+
+        def search(chunk):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return chunk
+
+        executor = ThreadPoolExecutor(max_workers=8)
+        self.addCleanup(executor.shutdown)
+        results = list(iter_retrieve_many(search=search, ids=range(20), chunk_size=2, max_workers=2,
+                                          executor=executor))
+        self.assertEqual(sorted(sum([found for _, found, _ in results], [])), list(range(20)))
+        # max_workers still bounds the searches of each caller - and the shared executor is left running
+        self.assertLessEqual(running[1], 2)
+        self.assertEqual(executor.submit(len, 'abc').result(), 3)
+
+    def test_SharedExecutor(self):
+        interface1 = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger)
+        interface2 = Interface(endpoint_type='DUMMY', endpoint='DUMMY', logger=logger,
+                               transport=TransportConfig(pool_maxsize=32))
+        self.assertIs(interface1.session.executor, interface2.session.executor)
+        self.assertEqual(interface1.session.executor._max_workers, interface1.session.max_workers)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import timedelta
+import json
+import requests
+import unittest
+
+from amaascore.core import instrumentation
+from amaascore.core.instrumentation import RequestEvent
+from amaascore.core.profiling import profile
+from amaascore.tools.generate_transaction import generate_transactions
+from amaascore.transactions.utils import json_to_transaction
+
+
+def simulated_search(transactions):
+    """ Simulate the instrumented session returning a search response, then decode it as the interface would """
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps([json.loads(transaction.to_json_string())
+                                    for transaction in transactions]).encode('utf-8')
+    response.elapsed = timedelta(seconds=0.01)
+    instrumentation.emit(RequestEvent(endpoint_type='transactions', method='GET', url='https://amaas.test/',
+                                      status=200, bytes_sent=None, bytes_received=len(response.content),
+                                      server_time=0.01, total_time=0.02, encode_time=None))
+    instrumentation.instrument_response(response, 'transactions')
+    return [json_to_transaction(json_transaction) for json_transaction in response.json()]
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.transactions = generate_transactions(asset_manager_ids=[1], number=20)
+
+    def test_Phases(self):
+        with profile(cprofile=False, trace_memory=True) as profiler:
+            decoded = simulated_search(self.transactions)
+        self.assertEqual(decoded, self.transactions)
+        self.assertEqual(len(profiler.calls), 1)
+        call = profiler.calls[0]
+        self.assertEqual(call.endpoint_type, 'transactions')
+        self.assertEqual(call.decoded, 20)
+        self.assertEqual(call.seconds['network'], 0.02)
+        self.assertGreater(call.seconds['parse'], 0)
+        self.assertGreater(call.seconds['decode'], 0)
+        self.assertGreater(call.allocated['decode'], 0)
+        phases = profiler.phases()
+        self.assertEqual(set(phases), {'network', 'parse', 'decode', 'other'})
+        self.assertEqual(profiler.functions(), [])
+        # The hook is removed on exit
+        self.assertFalse(instrumentation.enabled())
+
+    def test_ClassBreakdown(self):
+        with profile() as profiler:
+            simulated_search(self.transactions)
+        owners = [total['owner'] for total in profiler.classes()]
+        self.assertIn('Transaction', owners)
+        self.assertIn('amaascore.core.dates', owners)
+        functions = [row['function'] for row in profiler.functions()]
+        self.assertIn('Transaction.quantity.setter', functions)
+        report = profiler.report()
+        self.assertIn('decode', report)
+        self.assertIn('Transaction', report)
+
+    def test_Unattributed(self):
+        with profile(cprofile=False) as profiler:
+            json_to_transaction(json.loads(self.transactions[0].to_json_string()))
+        self.assertEqual(profiler.calls, [])
+        self.assertEqual(profiler.unattributed.decoded, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+import unittest
+
+import amaascore
+from amaascore.core.amaas_model import AMaaSModel
+from amaascore.core.registry import Registry, registry
+
+CHECK_IMPORTS = """
+import sys
+import amaascore.assets.interface, amaascore.parties.interface, amaascore.transactions.interface
+loaded = [module for module in ('boto3', 'warrant', 'amaascore.assets.equity', 'amaascore.parties.individual')
+          if module in sys.modules]
+print(','.join(loaded))
+"""
+
+
+class Widget(AMaaSModel):
+
+    def __init__(self, widget_id, *args, **kwargs):
+        self.widget_id = widget_id
+        super(Widget, self).__init__(*args, **kwargs)
+
+
+class RegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+
+    def tearDown(self):
+        pass
+
+    def test_Lookup(self):
+        from amaascore.assets.equity import Equity
+        registration = registry.lookup('asset', 'Equity')
+        self.assertEqual(registration.clazz, Equity)
+        self.assertEqual(registration.family, 'asset')
+        self.assertEqual(registration.id_attribute, 'asset_id')
+        self.assertIsNone(registry.lookup('asset', 'Unknown'))
+        self.assertIsNone(registry.lookup('party', 'Equity'))
+        self.assertIn('Equity', registry.names('asset'))
+
+    def test_IdAttributes(self):
+        self.assertTrue(registry.lookup('asset', 'Equity').client_ids)
+        self.assertTrue(registry.lookup('transaction', 'Transaction').client_ids)
+        # The service assigns asset_manager_id, and a type's ID can differ from the rest of its family's
+        asset_manager = registry.lookup('asset_manager', 'AssetManager')
+        self.assertEqual(asset_manager.id_attribute, 'asset_manager_id')
+        self.assertFalse(asset_manager.client_ids)
+        self.assertEqual(registry.lookup('asset_manager', 'Relationship').id_attribute, 'relationship_id')
+        position = registry.lookup('transaction', 'Position')
+        self.assertIsNone(position.id_attribute)
+        self.assertFalse(position.client_ids)
+
+    def test_BaseClass(self):
+        from amaascore.assets.asset import Asset
+        from amaascore.assets.fund import Fund
+        from amaascore.transactions.cash_transaction import CashTransaction
+        from amaascore.transactions.transaction import Transaction
+        self.assertEqual(registry.base_class(Fund), Asset)
+        self.assertEqual(registry.base_class(Asset), Asset)
+        self.assertEqual(registry.base_class(CashTransaction), Transaction)
+        self.assertEqual(registry.base_class(Widget), Widget)
+
+    def test_LookupName(self):
+        from amaascore.parties.fund import Fund
+        from amaascore.transactions.transaction import Transaction
+        # Fund is both a party and an asset - the party family is declared first
+        self.assertEqual(registry.lookup_name('Fund').clazz, Fund)
+        self.assertEqual(registry.lookup_name('Transaction').clazz, Transaction)
+        self.assertIsNone(registry.lookup_name('Unknown'))
+
+    def test_Interface(self):
+        from amaascore.transactions.interface import TransactionsInterface
+        registration = registry.lookup('transaction', 'Transaction')
+        self.assertEqual(registration.interface(), TransactionsInterface)
+        self.assertEqual(set(registration.children), {'charges', 'codes', 'comments', 'links', 'parties', 'rates',
+                                                      'references'})
+
+    def test_Register(self):
+        widgets = Registry()
+        widgets.declare('widget', 'amaascore.transactions.interface.TransactionsInterface', {})
+        widgets.register('widget')(Widget)
+        registration = widgets.lookup('widget', 'Widget')
+        self.assertEqual(registration.clazz, Widget)
+        self.assertEqual(widgets.names('widget'), ['Widget'])
+        widget = registration.decode({'widget_id': 'ABC', 'version': 2})
+        self.assertEqual(type(widget), Widget)
+        self.assertEqual(widget.widget_id, 'ABC')
+        self.assertEqual(widget.version, 2)
+
+    def test_ImportsAreDeferred(self):
+        # Run in a fresh interpreter, since this one has already imported everything
+        root = os.path.dirname(os.path.dirname(os.path.abspath(amaascore.__file__)))
+        output = subprocess.check_output([sys.executable, '-c', CHECK_IMPORTS], cwd=root)
+        self.assertEqual(output.decode('utf-8').strip(), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import datetime, timedelta
+import os
+import requests
+import shutil
+import tempfile
+import unittest
+
+from amaascore.books.book import Book
+from amaascore.core.sync import DeltaSync, Replica
+from amaascore.tools.generate_book import generate_book
+
+
+class BooksInterfaceStub(object):
+    """ Serves a fixed universe of books, filtering searches by updated_since unless filtering is unsupported """
+
+    endpoint_type = 'books'
+
+    def __init__(self, books, filtering=True):
+        self.books = books
+        self.filtering = filtering
+        self.calls = []
+
+    def books_by_asset_manager(self, asset_manager_id):
+        self.calls.append('books_by_asset_manager')
+        return list(self.books)
+
+    def search(self, asset_manager_id, updated_since=None):
+        self.calls.append('search')
+        if self.filtering is None:
+            response = requests.Response()
+            response.status_code = 400
+            raise requests.HTTPError(response=response)
+        if not self.filtering:
+            return list(self.books)
+        return [book for book in self.books if book.updated_time >= updated_since] or None
+
+
+class DeltaSyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.replica = Replica(filename=os.path.join(self.directory, 'replica.sqlite'))
+        self.asset_manager_id = 1
+        self.start = datetime(2017, 6, 1, 12)
+        self.books = [self.generate_book(i, self.start - timedelta(hours=i)) for i in range(5)]
+
+    def tearDown(self):
+        self.replica.close()
+        shutil.rmtree(self.directory)
+
+    def generate_book(self, i, updated_time, version=1):
+        book = generate_book(asset_manager_id=self.asset_manager_id, book_id='BOOK%s' % i)
+        book.version = version
+        book.updated_time = updated_time
+        return book
+
+    def test_DeltaSync(self):
+        interface = BooksInterfaceStub(self.books)
+        sync = DeltaSync(interface, self.replica)
+        result = sync.sync(self.asset_manager_id)
+        self.assertTrue(result.full)
+        self.assertEqual(result.merged, 5)
+        self.assertEqual(result.watermark, self.start)
+        # Only the amended book is merged - BOOK0 is fetched again as it was updated within the overlap
+        later = self.start + timedelta(hours=1)
+        amended = self.generate_book(2, later, version=2)
+        interface.books[2] = amended
+        result = sync.sync(self.asset_manager_id)
+        self.assertFalse(result.full)
+        self.assertEqual(result.received, 2)
+        self.assertEqual(result.merged, 1)
+        self.assertEqual(result.watermark, later)
+        self.assertEqual(interface.calls, ['books_by_asset_manager', 'search'])
+        self.assertEqual(sync.get(self.asset_manager_id, 'BOOK2'), amended)
+        self.assertEqual(len(sync.objects(self.asset_manager_id)), 5)
+        self.assertEqual(type(sync.objects(self.asset_manager_id)[0]), Book)
+
+    def test_MergeByVersion(self):
+        sync = DeltaSync(BooksInterfaceStub(self.books), self.replica)
+        sync.sync(self.asset_manager_id)
+        newer = self.generate_book(0, self.start, version=3)
+        older = self.generate_book(0, self.start, version=2)
+        self.assertEqual(self.replica.merge('books', self.asset_manager_id, sync.records([newer])), 1)
+        self.assertEqual(self.replica.merge('books', self.asset_manager_id, sync.records([older])), 0)
+        self.assertEqual(sync.get(self.asset_manager_id, 'BOOK0').version, 3)
+
+    def test_FilterIgnored(self):
+        interface = BooksInterfaceStub(self.books, filtering=False)
+        sync = DeltaSync(interface, self.replica)
+        sync.sync(self.asset_manager_id)
+        del interface.books[0]
+        result = sync.sync(self.asset_manager_id)
+        self.assertTrue(result.full)
+        self.assertEqual(self.replica.count('books', self.asset_manager_id), 4)
+
+    def test_FilterRejected(self):
+        interface = BooksInterfaceStub(self.books, filtering=None)
+        sync = DeltaSync(interface, self.replica)
+        sync.sync(self.asset_manager_id)
+        result = sync.sync(self.asset_manager_id)
+        self.assertTrue(result.full)
+        self.assertEqual(interface.calls, ['books_by_asset_manager', 'search', 'books_by_asset_manager'])
+
+    def test_Unsupported(self):
+        interface = BooksInterfaceStub(self.books)
+        interface.endpoint_type = 'transactions'
+        with self.assertRaisesRegexp(ValueError, 'Cannot sync'):
+            DeltaSync(interface, self.replica)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+import time
+import unittest
+
+from amaascore.core.throttle import AdaptiveConcurrencyLimit, Throttle, TokenBucket
+
+
+class Response(object):
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_Reserve(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        # The burst is free, after which each request waits a further tenth of a second
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+
+    def test_Refill(self):
+        bucket = TokenBucket(rate=1000, capacity=1)
+        bucket.acquire()
+        time.sleep(0.01)
+        self.assertEqual(bucket.reserve(), 0)
+
+
+class AdaptiveConcurrencyLimitTest(unittest.TestCase):
+
+    def test_AdditiveIncrease(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=4, max_limit=5)
+        for _ in range(4):
+            limit.acquire()
+            limit.release(latency=0.1)
+        self.assertAlmostEqual(limit.limit, 5, places=0)
+        for _ in range(10):
+            limit.acquire()
+            limit.release(latency=0.1)
+        self.assertEqual(limit.limit, 5)
+
+    def test_MultiplicativeDecrease(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=16, min_limit=2)
+        limit.acquire()
+        limit.release(latency=0.1)
+        limit.acquire()
+        limit.release(latency=0.1, throttled=True)
+        self.assertAlmostEqual(limit.limit, 8, places=0)
+        # A second throttled request from the same round trip doesn't back off again
+        limit.acquire()
+        limit.release(latency=0.1, throttled=True)
+        self.assertAlmostEqual(limit.limit, 8, places=0)
+
+    def test_LatencyDecrease(self):
+        limit = AdaptiveConcurrencyLimit(initial_limit=16, latency_tolerance=2.0)
+        limit.acquire()
+        limit.release(latency=0.0)
+        limit.acquire()
+        limit.release(latency=0.5)
+        self.assertLess(limit.limit, 16)
+
+
+class ThrottleTest(unittest.TestCase):
+
+    def test_Concurrency(self):
+        throttle = Throttle(concurrency=AdaptiveConcurrencyLimit(initial_limit=2, max_limit=2))
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return Response(200)
+
+        threads = [threading.Thread(target=throttle.send, args=(request,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(throttle.concurrency.in_flight, 0)
+
+    def test_Throttled(self):
+        throttle = Throttle(rate=1000, concurrency=True)
+        self.assertEqual(throttle.send(lambda: Response(429)).status_code, 429)
+        self.assertEqual(throttle.concurrency.limit, 2)
+
+    def test_Error(self):
+        throttle = Throttle(concurrency=True)
+
+        def request():
+            raise IOError('Connection reset')
+
+        with self.assertRaisesRegexp(IOError, 'Connection reset'):
+            throttle.send(request)
+        self.assertEqual(throttle.concurrency.in_flight, 0)
+        self.assertEqual(throttle.concurrency.limit, 2)
+
+if __name__ == '__main__':
+    unittest.main()
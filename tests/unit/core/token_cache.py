@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from datetime import datetime, timedelta
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from amaascore.core.token_cache import TokenCache
+
+
+class TokenCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.token_cache = TokenCache(directory=os.path.join(self.directory, '.amaas'))
+        self.key = TokenCache.generate_key('POOL', 'username')
+        self.tokens = {'IdToken': 'ID', 'RefreshToken': 'REFRESH', 'ExpiresIn': 3600}
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_StoreAndLoad(self):
+        issued = datetime.utcnow()
+        self.token_cache.store(self.key, self.tokens, issued)
+        self.assertEqual(self.token_cache.load(self.key, max_age=60), (self.tokens, issued))
+        self.assertEqual(self.token_cache.load(TokenCache.generate_key('POOL', 'other'), max_age=60), (None, None))
+
+    def test_Expiry(self):
+        self.token_cache.store(self.key, self.tokens, datetime.utcnow() - timedelta(minutes=2))
+        self.assertEqual(self.token_cache.load(self.key, max_age=60), (None, None))
+
+    def test_Clear(self):
+        self.token_cache.store(self.key, self.tokens, datetime.utcnow())
+        self.token_cache.clear(self.key)
+        self.assertEqual(self.token_cache.load(self.key, max_age=60), (None, None))
+
+    def test_CorruptCache(self):
+        self.token_cache.ensure_directory()
+        with open(self.token_cache.filename, 'w') as token_file:
+            token_file.write('{"Not JSON')
+        self.assertEqual(self.token_cache.load(self.key, max_age=60), (None, None))
+        self.token_cache.store(self.key, self.tokens, datetime.utcnow())
+        self.assertEqual(self.token_cache.load(self.key, max_age=60)[0], self.tokens)
+
+    @unittest.skipIf(os.name == 'nt', 'File permissions are not enforced on Windows')
+    def test_Permissions(self):
+        self.token_cache.store(self.key, self.tokens, datetime.utcnow())
+        self.assertEqual(stat.S_IMODE(os.stat(self.token_cache.filename).st_mode), 0o600)
+
+if __name__ == '__main__':
+    unittest.main()
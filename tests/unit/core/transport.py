@@ -0,0 +1,65 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gzip
+import io
+import json
+import requests
+import unittest
+
+from amaascore.core.transport import JitteredRetry, TransportConfig
+
+
+def gunzip(data):
+    return gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+
+
+class TransportConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+
+    def test_Mount(self):
+        transport = TransportConfig(pool_maxsize=32, max_retries=2, backoff_factor=0.1)
+        session = transport.mount(requests.Session())
+        adapter = session.get_adapter('https://amaas.test')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        retry = adapter.max_retries
+        self.assertEqual(type(retry), JitteredRetry)
+        self.assertEqual(retry.total, 2)
+        self.assertTrue(retry.is_retry('GET', 503))
+        self.assertTrue(retry.is_retry('PUT', 429))
+        # A retried POST could create the same objects twice
+        self.assertFalse(retry.is_retry('POST', 503))
+        self.assertFalse(retry.is_retry('GET', 404))
+
+    def test_Backoff(self):
+        retry = TransportConfig(max_retries=5, backoff_factor=1).retry()
+        for _ in range(3):
+            retry = retry.increment(method='GET', url='/')
+        for _ in range(20):
+            backoff = retry.get_backoff_time()
+            self.assertTrue(0 <= backoff <= 4, backoff)
+
+    def test_CompressJson(self):
+        transport = TransportConfig(compress_requests=True, compress_threshold=100)
+        small = transport.prepare({'json': {'asset_id': 'A'}})
+        self.assertEqual(small['headers'], {'Content-Type': 'application/json'})
+        self.assertEqual(json.loads(small['data'].decode('utf-8')), {'asset_id': 'A'})
+        body = [{'asset_id': 'ASSET%s' % i} for i in range(20)]
+        large = transport.prepare({'json': body, 'headers': {'X-Test': '1'}})
+        self.assertEqual(large['headers'], {'Content-Type': 'application/json', 'Content-Encoding': 'gzip',
+                                            'X-Test': '1'})
+        self.assertEqual(json.loads(gunzip(large['data']).decode('utf-8')), body)
+
+    def test_CompressStream(self):
+        transport = TransportConfig(compress_requests=True, timeout=5)
+        kwargs = transport.prepare({'data': (chunk for chunk in [b'[', b'{}', b']'])})
+        self.assertEqual(kwargs['timeout'], 5)
+        self.assertEqual(gunzip(b''.join(kwargs['data'])), b'[{}]')
+
+    def test_NoCompression(self):
+        kwargs = {'json': {'asset_id': 'A'}}
+        self.assertEqual(TransportConfig().prepare(kwargs), kwargs)
+
+if __name__ == '__main__':
+    unittest.main()
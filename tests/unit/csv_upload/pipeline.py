@@ -0,0 +1,177 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from amaascore.books.book import Book
+from amaascore.csv_upload.journal import UploadJournal
+from amaascore.csv_upload.pipeline import UploadPipeline
+
+
+def book_handler(row, params):
+    row = dict(row, **params)
+    if not row.get('book_id'):
+        raise ValueError('Missing book_id')
+    return Book(asset_manager_id=int(row['asset_manager_id']), book_id=row['book_id'])
+
+
+class BooksInterfaceStub(object):
+    """ Records the batches it is sent, failing any batch containing one of the failing book IDs """
+
+    def __init__(self, failing=(), interrupt_after=None, held=None):
+        """ :param held: A book ID - the batch containing it is held until another batch has been sent """
+        self.failing = set(failing)
+        self.interrupt_after = interrupt_after
+        self.held = held
+        self.released = threading.Event()
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def create_many(self, books, upsert=False):
+        if self.held in [book.book_id for book in books]:
+            self.released.wait(5)
+        else:
+            self.released.set()
+        if self.failing.intersection(book.book_id for book in books):
+            raise ValueError('Rejected by service')
+        with self.lock:
+            if self.interrupt_after is not None and len(self.batches) == self.interrupt_after:
+                raise KeyboardInterrupt()
+            self.batches.append(([book.book_id for book in books], upsert))
+        return books
+
+    def book_ids(self):
+        return sorted(sum([book_ids for book_ids, _ in self.batches], []))
+
+
+class UpsertingBooksInterfaceStub(BooksInterfaceStub):
+
+    def upsert(self, book):
+        return book
+
+
+class UploadPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.reject_path = os.path.join(self.directory, 'rejects.csv')
+        self.journal_path = os.path.join(self.directory, 'upload.journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def csv_stream(self, book_ids, asset_manager_id=1):
+        return io.StringIO('asset_manager_id,book_id\n' +
+                           ''.join('%s,%s\n' % (asset_manager_id, book_id) for book_id in book_ids))
+
+    def read_rejects(self):
+        with open(self.reject_path) as reject_file:
+            return list(csv.DictReader(reject_file))
+
+    def test_Batches(self):
+        interface = BooksInterfaceStub()
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=3, max_in_flight=2)
+        book_ids = ['BOOK%s' % i for i in range(10)]
+        progress = pipeline.run(self.csv_stream(book_ids))
+        self.assertEqual(progress.created, 10)
+        self.assertEqual(progress.rejected, 0)
+        self.assertEqual(sorted(len(batch) for batch, _ in interface.batches), [1, 3, 3, 3])
+        self.assertEqual(interface.book_ids(), sorted(book_ids))
+
+    def test_Rejects(self):
+        # The first batch finishes last, but the rejects are still written in row order
+        interface = BooksInterfaceStub(failing=['BAD'], held='BOOK1')
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=3,
+                                  reject_path=self.reject_path, journal_path=self.journal_path)
+        progress = pipeline.run(self.csv_stream(['BOOK1', 'BAD', '', 'BOOK2', 'BAD']))
+        self.assertEqual(progress.created, 2)
+        self.assertEqual(progress.rejected, 3)
+        rejects = self.read_rejects()
+        self.assertEqual([reject['row'] for reject in rejects], ['2', '3', '5'])
+        self.assertEqual(rejects[0]['book_id'], 'BAD')
+        self.assertIn('Rejected by service', rejects[0]['error'])
+        self.assertIn('Invalid row', rejects[1]['error'])
+        self.assertEqual(list(UploadJournal(self.journal_path).load()), [1, 4])
+
+    def test_Resume(self):
+        book_ids = ['BOOK1', '', 'BOOK3', '', 'BOOK5', 'BOOK6', '']
+        interface = BooksInterfaceStub(interrupt_after=2)
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=2, max_in_flight=1,
+                                  journal_path=self.journal_path, id_attribute='book_id', generate_ids=True,
+                                  source='books.csv')
+        with self.assertRaises(KeyboardInterrupt):
+            pipeline.run(self.csv_stream(book_ids))
+        first_run = interface.book_ids()
+        self.assertEqual(len(first_run), 4)
+        # The journal records the batch size, which takes precedence over the one given when resuming
+        interface = BooksInterfaceStub()
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=5,
+                                  journal_path=self.journal_path, id_attribute='book_id', generate_ids=True,
+                                  source='books.csv')
+        progress = pipeline.run(self.csv_stream(book_ids))
+        self.assertEqual(progress.skipped, 4)
+        self.assertEqual(progress.created, 3)
+        self.assertEqual(len(interface.batches), 2)
+        self.assertIn('BOOK5', interface.book_ids())
+        self.assertFalse(set(first_run).intersection(interface.book_ids()))
+        # Everything is now in the journal
+        progress = pipeline.run(self.csv_stream(book_ids))
+        self.assertEqual((progress.created, progress.skipped), (0, 7))
+
+    def test_ChangedSource(self):
+        # Fixing the rejected rows changes the fingerprint, so the whole csv is uploaded again
+        pipeline = UploadPipeline(interface=BooksInterfaceStub(), json_handler=book_handler, batch_size=2,
+                                  journal_path=self.journal_path, source='books.csv', fingerprint=[14, 1.0])
+        self.assertEqual(pipeline.run(self.csv_stream(['BOOK1', ''])).rejected, 1)
+        interface = BooksInterfaceStub()
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, batch_size=2,
+                                  journal_path=self.journal_path, source='books.csv', fingerprint=[19, 2.0])
+        progress = pipeline.run(self.csv_stream(['BOOK1', 'BOOK2']))
+        self.assertEqual((progress.created, progress.skipped), (2, 0))
+        self.assertEqual(interface.book_ids(), ['BOOK1', 'BOOK2'])
+
+    def test_DeterministicIds(self):
+        ids = []
+        for _ in range(2):
+            interface = BooksInterfaceStub()
+            pipeline = UploadPipeline(interface=interface, json_handler=book_handler, id_attribute='book_id',
+                                      generate_ids=True, source='books.csv')
+            pipeline.run(self.csv_stream(['BOOK1', '', '']))
+            ids.append(interface.book_ids())
+        self.assertEqual(ids[0], ids[1])
+        self.assertEqual(len(set(ids[0])), 3)
+        self.assertIn('BOOK1', ids[0])
+
+    def test_NoGeneratedIds(self):
+        # Without generate_ids the IDs are only recorded - a row without one is left for the json_handler to reject
+        interface = BooksInterfaceStub()
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, id_attribute='book_id',
+                                  journal_path=self.journal_path, source='books.csv')
+        progress = pipeline.run(self.csv_stream(['BOOK1', '']))
+        self.assertEqual((progress.created, progress.rejected), (1, 1))
+        self.assertEqual(UploadJournal(self.journal_path).load()[1]['ids'], ['BOOK1'])
+
+    def test_Upsert(self):
+        interface = BooksInterfaceStub()
+        UploadPipeline(interface=interface, json_handler=book_handler).run(self.csv_stream(['BOOK1']))
+        self.assertEqual(interface.batches, [(['BOOK1'], False)])
+        interface = UpsertingBooksInterfaceStub()
+        UploadPipeline(interface=interface, json_handler=book_handler).run(self.csv_stream(['BOOK1']))
+        self.assertEqual(interface.batches, [(['BOOK1'], True)])
+
+    def test_ParseWorkers(self):
+        interface = BooksInterfaceStub()
+        pipeline = UploadPipeline(interface=interface, json_handler=book_handler, params={'asset_manager_id': 2},
+                                  batch_size=4, parse_workers=2)
+        progress = pipeline.run(io.StringIO('book_id\n' + ''.join('BOOK%s\n' % i for i in range(9))))
+        self.assertEqual(progress.created, 9)
+        self.assertEqual(len(interface.batches), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import json
 import unittest
 
-from amaascore.market_data.eod_price import EODPrice
+from amaascore.market_data.eod_price import EODPrice, CompactEODPrice
+from amaascore.market_data.utils import json_to_eod_price
 from amaascore.tools.generate_market_data import generate_eod_price
 
 
@@ -32,5 +33,12 @@ class EODPriceTest(unittest.TestCase):
         json_asset_id = json.loads(json.dumps(eod_price_json, ensure_ascii=False)).get('asset_id')
         self.assertEqual(json_asset_id, self.asset_id)
 
+    def test_CompactEODPrice(self):
+        compact = json_to_eod_price(self.eod_price.to_json(), compact=True)
+        self.assertEqual(type(compact), CompactEODPrice)
+        self.assertEqual(compact.business_date, self.eod_price.business_date)
+        self.assertEqual(compact.to_json(), self.eod_price.to_json())
+        self.assertEqual(compact, CompactEODPrice(**self.eod_price.to_json()))
+
 if __name__ == '__main__':
     unittest.main()
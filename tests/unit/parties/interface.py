@@ -90,6 +90,18 @@ class PartiesInterfaceTest(unittest.TestCase):
         asset_manager_parties = self.parties_interface.parties_by_asset_manager(asset_manager_id=self.asset_manager_id)
         self.assertEqual(parties, asset_manager_parties)
 
+    @requests_mock.Mocker()
+    def test_RetrieveMany(self, mocker):
+        endpoint = '%s/parties/%s' % (self.parties_interface.endpoint, self.asset_manager_id)
+        parties = generate_parties(asset_manager_ids=[self.asset_manager_id], number=3)
+        mocker.get(endpoint, [{'json': [party.to_json() for party in parties[:2]]},
+                              {'status_code': 500}])
+        party_ids = [party.party_id for party in parties]
+        results, errors = self.parties_interface.retrieve_many(self.asset_manager_id, party_ids, chunk_size=2,
+                                                               max_workers=1)
+        self.assertEqual(set(results.keys()), set(party_ids[:2]))
+        self.assertEqual(list(errors.keys()), party_ids[2:])
+
     def test_ChildrenPopulated(self):
         party = self.parties_interface.new(self.party)
         retrieved_party = self.parties_interface.retrieve(asset_manager_id=self.asset_manager_id,
@@ -0,0 +1,82 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import os
+import shutil
+import tempfile
+import unittest
+
+from amaascore.market_data.eod_price import EODPrice
+from amaascore.market_data.fx_rate import FXRate
+from amaascore.tools import arrow_tools
+from amaascore.tools.generate_market_data import generate_eod_price, generate_fx_rate
+from amaascore.tools.generate_transaction import generate_position, generate_position_pnl, generate_transaction, \
+    generate_transaction_pnl
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_pnl import PositionPNL
+from amaascore.transactions.transaction import Transaction
+from amaascore.transactions.transaction_pnl import TransactionPNL
+
+
+@unittest.skipIf(arrow_tools.pa is None, 'pyarrow is not installed')
+class ArrowToolsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'test.parquet')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_TransactionRoundTrip(self):
+        transactions = [generate_transaction() for _ in range(5)]
+        table = arrow_tools.to_table(transactions, Transaction)
+        self.assertEqual(str(table.schema.field('quantity').type), 'decimal128(38, 12)')
+        self.assertEqual(str(table.schema.field('transaction_date').type), 'date32[day]')
+        links_type = table.schema.field('links').type
+        self.assertTrue(arrow_tools.pa.types.is_map(links_type))
+        self.assertTrue(arrow_tools.pa.types.is_list(links_type.item_type))
+        decoded = arrow_tools.from_table(table, Transaction)
+        self.assertEqual(decoded, transactions)
+        self.assertEqual(type(decoded[0].quantity), Decimal)
+        self.assertEqual(len(decoded[0].links['Multiple']), 3)
+        self.assertEqual(decoded[0].charges, transactions[0].charges)
+
+    def test_ParquetRowGroups(self):
+        positions = [generate_position() for _ in range(25)]
+        count = arrow_tools.write_parquet((position for position in positions), self.path, Position,
+                                          row_group_size=10)
+        self.assertEqual(count, 25)
+        self.assertEqual(arrow_tools.pq.ParquetFile(self.path).num_row_groups, 3)
+        # Read lazily, one row group at a time
+        iterator = arrow_tools.iter_parquet(self.path, Position)
+        self.assertEqual(next(iterator), positions[0])
+        self.assertEqual(list(iterator), positions[1:])
+
+    def test_MarketDataRoundTrip(self):
+        eod_prices = [generate_eod_price(asset_manager_id=1) for _ in range(3)]
+        fx_rates = [generate_fx_rate(asset_manager_id=1) for _ in range(3)]
+        self.assertEqual(arrow_tools.from_table(arrow_tools.to_table(eod_prices, EODPrice), EODPrice), eod_prices)
+        decoded = arrow_tools.from_table(arrow_tools.to_table(fx_rates, FXRate), FXRate)
+        self.assertEqual(decoded, fx_rates)
+        self.assertIsNotNone(decoded[0].rate_timestamp.tzinfo)
+
+    def test_PNLRoundTrip(self):
+        for clazz, pnls in [(TransactionPNL, [generate_transaction_pnl() for _ in range(3)]),
+                            (PositionPNL, [generate_position_pnl() for _ in range(3)])]:
+            arrow_tools.write_parquet(pnls, self.path, clazz)
+            self.assertEqual(arrow_tools.read_parquet(self.path, clazz), pnls, clazz.__name__)
+
+    def test_PrecisionLoss(self):
+        position = generate_position(quantity=Decimal('1.1234567890123'))
+        with self.assertRaises(arrow_tools.pa.ArrowInvalid):
+            arrow_tools.to_table([position], Position)
+
+    def test_Unsupported(self):
+        from amaascore.books.book import Book
+        with self.assertRaisesRegexp(ValueError, 'not supported'):
+            arrow_tools.arrow_schema(Book)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import csv
+import io
 import os
 import os.path
 import tempfile
@@ -11,8 +13,9 @@ from amaascore.assets.utils import json_to_asset
 from amaascore.books.book import Book
 from amaascore.tools.csv_tools import objects_to_csv, objects_to_csv_stream, \
     csv_filename_to_objects, csv_stream_to_objects
-from amaascore.tools.generate_asset import generate_asset
+from amaascore.tools.generate_asset import generate_asset, generate_bond, generate_fund
 from amaascore.tools.generate_book import generate_book
+from amaascore.tools.generate_transaction import generate_transaction
 
 
 class CSVTest(unittest.TestCase):
@@ -59,6 +62,53 @@ class CSVTest(unittest.TestCase):
         os.close(file_desc)
         os.remove(temp_filepath)
 
+    def test_GeneratorToCSVStream(self):
+        file_desc, temp_filepath = tempfile.mkstemp()
+        with open(temp_filepath, 'w') as temp_file:
+            count = objects_to_csv_stream(objects=(generate_book() for i in range(5)), stream=temp_file, clazz=Book)
+            self.assertEqual(objects_to_csv_stream(objects=iter([]), stream=temp_file), 0)
+        with open(temp_filepath, 'r') as temp_file:
+            data = temp_file.readlines()
+        self.assertEqual(count, 5)
+        self.assertEqual(len(data), 6)  # 5 books + header
+        os.close(file_desc)
+        os.remove(temp_filepath)
+
+    def test_MixedAssetsToCSVStream(self):
+        # The header is the union of every asset type's attributes, so no columns are lost when types are mixed
+        assets = [generate_fund(), generate_bond(), generate_asset()]
+        stream = io.StringIO()
+        objects_to_csv_stream(objects=iter(assets), stream=stream, clazz=Asset)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1]['coupon'], str(assets[1].coupon))
+        self.assertEqual(rows[1]['asset_class'], 'Bond')
+        self.assertEqual(rows[0]['coupon'], '')
+        self.assertNotIn('references', rows[0])
+
+    def test_MixedAssetsToCSVStreamWithoutClass(self):
+        # The header comes from the registered base class of the first object - Asset rather than Fund
+        assets = [generate_fund(), generate_bond(), generate_asset()]
+        stream = io.StringIO()
+        objects_to_csv_stream(objects=assets, stream=stream)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual(rows[1]['coupon'], str(assets[1].coupon))
+        self.assertEqual(rows[0]['coupon'], '')
+        # Objects of another family would lose their columns
+        with self.assertRaisesRegexp(ValueError, 'Cannot write a Book with the Asset columns'):
+            objects_to_csv_stream(objects=[generate_fund(), generate_book()], stream=io.StringIO())
+
+    def test_TransactionsToCSVStream(self):
+        transactions = [generate_transaction() for i in range(3)]
+        stream = io.StringIO()
+        objects_to_csv_stream(objects=transactions, stream=stream)
+        rows = list(csv.DictReader(io.StringIO(stream.getvalue())))
+        self.assertEqual([row['transaction_id'] for row in rows],
+                         [transaction.transaction_id for transaction in transactions])
+        self.assertEqual(rows[0]['quantity'], str(transactions[0].quantity))
+        for child in ['charges', 'codes', 'comments', 'links', 'parties', 'rates', 'references']:
+            self.assertNotIn(child, rows[0])
+
     def test_FilenameToAssets(self):
         # Generate file
         filename = os.path.join(tempfile.gettempdir(), 'test.csv')
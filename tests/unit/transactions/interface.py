@@ -5,6 +5,7 @@ from amaasutils.logging_utils import DEFAULT_LOGGING
 from amaasutils.random_utils import random_string
 import datetime
 from decimal import Decimal
+import json
 import logging.config
 import random
 import requests_mock
@@ -16,6 +17,7 @@ from amaascore.core.comment import Comment
 from amaascore.transactions.cash_transaction import CashTransaction
 from amaascore.transactions.transaction import Transaction
 from amaascore.transactions.interface import TransactionsInterface
+from amaascore.transactions.position_set import PositionSet
 from amaascore.transactions.mtm_result import MTMResult
 from amaascore.tools.generate_asset import generate_asset
 from amaascore.tools.generate_book import generate_book
@@ -96,6 +98,14 @@ class TransactionsInterfaceTest(unittest.TestCase):
         #self.assertIsNotNone(transaction.created_time)
         self.assertEqual(transaction.transaction_id, self.transaction_id)
 
+    @requests_mock.Mocker()
+    def test_CreateManyStream(self, mocker):
+        endpoint = '%s/transactions/%s' % (self.transactions_interface.endpoint, self.asset_manager_id)
+        transactions = generate_transactions(asset_manager_ids=[self.asset_manager_id], number=3)
+        mocker.post(endpoint, json=lambda request, context: json.loads(b''.join(request.body).decode('utf-8')))
+        results = self.transactions_interface.create_many(transactions, stream=True)
+        self.assertEqual(results, transactions)
+
     def test_Amend(self):
         transaction = self.transactions_interface.new(self.transaction)
         self.assertEqual(transaction.version, 1)
@@ -139,6 +149,27 @@ class TransactionsInterfaceTest(unittest.TestCase):
         all_transactions = self.transactions_interface.search(self.asset_manager_id)
         self.assertEqual(all_transactions, transactions)
 
+    @requests_mock.Mocker()
+    def test_SearchIter(self, mocker):
+        endpoint = '%s/transactions/%s' % (self.transactions_interface.endpoint, self.asset_manager_id)
+        transactions = generate_transactions(asset_manager_ids=[self.asset_manager_id], number=5)
+        pages = [transactions[0:2], transactions[2:4], transactions[4:]]
+        mocker.get(endpoint, [{'json': [transaction.to_json() for transaction in page]} for page in pages])
+        results = self.transactions_interface.search_iter(self.asset_manager_id, page_size=2)
+        self.assertEqual(list(results), transactions)
+        self.assertEqual(mocker.call_count, 3)
+        self.assertEqual(mocker.request_history[-1].qs.get('page_no'), ['3'])
+
+    @requests_mock.Mocker()
+    def test_SearchIterPrefetch(self, mocker):
+        endpoint = '%s/transactions/%s' % (self.transactions_interface.endpoint, self.asset_manager_id)
+        transactions = generate_transactions(asset_manager_ids=[self.asset_manager_id], number=4)
+        pages = [transactions[0:2], transactions[2:4], []]
+        mocker.get(endpoint, [{'json': [transaction.to_json() for transaction in page]} for page in pages])
+        results = self.transactions_interface.search_iter(self.asset_manager_id, page_size=2, prefetch=True)
+        self.assertEqual(list(results), transactions)
+        self.assertEqual(mocker.call_count, 3)
+
     @requests_mock.Mocker()
     def test_TransactionsByAssetManager(self, mocker):
         # This test is somewhat fake - but the integration tests are for the bigger picture
@@ -188,6 +219,16 @@ class TransactionsInterfaceTest(unittest.TestCase):
                                                                          book_ids=['TEST'])
         self.assertEqual(positions, results)
 
+    @requests_mock.Mocker()
+    def test_PositionsByAssetManagerColumnar(self, mocker):
+        endpoint = '%s/positions/%s' % (self.transactions_interface.endpoint, self.asset_manager_id)
+        positions = generate_positions(asset_manager_ids=[self.asset_manager_id])
+        mocker.get(endpoint, json=[position.to_json() for position in positions])
+        results = self.transactions_interface.positions_by_asset_manager(asset_manager_id=self.asset_manager_id,
+                                                                         columnar=True)
+        self.assertEqual(type(results), PositionSet)
+        self.assertEqual(list(results), positions)
+
     def test_MultipleLink(self):
         transaction = self.transactions_interface.new(self.transaction)
         links = transaction.links.get('Multiple')
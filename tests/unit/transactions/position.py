@@ -1,8 +1,9 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from decimal import Decimal
 import unittest
 
-from amaascore.transactions.position import Position
+from amaascore.transactions.position import Position, CompactPosition
 from amaascore.tools.generate_transaction import generate_position
 
 
@@ -18,5 +19,14 @@ class PositionTest(unittest.TestCase):
     def test_Transaction(self):
         self.assertEqual(type(self.position), Position)
 
+    def test_CompactPosition(self):
+        compact = CompactPosition(**self.position.to_json())
+        self.assertFalse(hasattr(compact, '__dict__'))
+        self.assertEqual(compact.to_json(), self.position.to_json())
+        self.assertEqual(hash(compact), hash(self.position))
+        self.assertEqual(type(compact.quantity), Decimal)
+        with self.assertRaises(AttributeError):
+            compact.unknown_attribute = 'Unknown'
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from decimal import Decimal
+import unittest
+
+from amaascore.transactions.position import Position
+from amaascore.transactions.position_set import PositionSet
+from amaascore.tools.generate_transaction import generate_position
+
+
+class PositionSetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.longMessage = True  # Print complete error message on failure
+        self.positions = [generate_position(asset_manager_id=1, book_id=book_id, asset_id=asset_id,
+                                            quantity=Decimal(quantity))
+                          for book_id, asset_id, quantity in [('BOOK1', 'A', '100'), ('BOOK1', 'B', '2.5'),
+                                                              ('BOOK2', 'A', '-40'), ('BOOK2', 'C', '0.000001')]]
+        self.position_set = PositionSet.from_json([position.to_json() for position in self.positions])
+
+    def tearDown(self):
+        pass
+
+    def test_PositionSet(self):
+        self.assertEqual(len(self.position_set), 4)
+        self.assertEqual(type(self.position_set[0]), Position)
+        self.assertEqual(list(self.position_set), self.positions)
+        self.assertEqual(self.position_set.column('book_id'), ['BOOK1', 'BOOK1', 'BOOK2', 'BOOK2'])
+        # Each distinct value is only stored once
+        self.assertEqual(self.position_set.pools['asset_id'][0], ['A', 'B', 'C'])
+
+    def test_FromPositions(self):
+        position_set = PositionSet.from_positions(self.positions)
+        self.assertEqual(list(position_set), self.positions)
+
+    def test_SumBy(self):
+        self.assertEqual(self.position_set.sum_by('book_id'),
+                         {'BOOK1': Decimal('102.5'), 'BOOK2': Decimal('-39.999999')})
+        self.assertEqual(self.position_set.sum_by('book_id', 'asset_id'),
+                         {('BOOK1', 'A'): Decimal('100'), ('BOOK1', 'B'): Decimal('2.5'),
+                          ('BOOK2', 'A'): Decimal('-40'), ('BOOK2', 'C'): Decimal('0.000001')})
+        self.assertEqual(self.position_set.total_quantity(), Decimal('62.500001'))
+
+    def test_Filter(self):
+        filtered = self.position_set.filter(book_id='BOOK2', asset_id=['A', 'B', 'Unknown'])
+        self.assertEqual(list(filtered), [self.positions[2]])
+        self.assertEqual(len(self.position_set.filter(book_id='Unknown')), 0)
+        with self.assertRaisesRegexp(ValueError, 'Unknown column'):
+            self.position_set.filter(unknown='BOOK1')
+
+    def test_Join(self):
+        prices = {'A': Decimal('10'), 'C': Decimal('5')}
+        joined, matched = self.position_set.join(prices)
+        self.assertEqual(list(joined), [self.positions[0], self.positions[2], self.positions[3]])
+        self.assertEqual(matched, [Decimal('10'), Decimal('10'), Decimal('5')])
+
+    def test_QuantityPrecision(self):
+        position_set = PositionSet(scale=2)
+        with self.assertRaisesRegexp(ValueError, 'more than 2 decimal places'):
+            position_set.append(self.positions[3].to_json())
+
+    def test_FloatQuantity(self):
+        # e.g. positions from JSON parsed without parse_float=Decimal
+        position_set = PositionSet()
+        self.assertEqual(position_set.to_fixed_point(0.1), 100000)
+        self.assertEqual(position_set.to_fixed_point(-1234.567891), -1234567891)
+        self.assertEqual(position_set.to_fixed_point(5.0), 5000000)
+        with self.assertRaisesRegexp(ValueError, 'more than 6 decimal places'):
+            position_set.to_fixed_point(0.1234567)
+        position_set.append(dict(self.positions[0].to_json(), quantity=0.1))
+        self.assertEqual(position_set[0].quantity, Decimal('0.1'))
+
+if __name__ == '__main__':
+    unittest.main()
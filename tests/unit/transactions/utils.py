@@ -26,5 +26,22 @@ class TransactionUtilsTest(unittest.TestCase):
         gen_position = json_to_position(json_position)
         self.assertEqual(gen_position, position)
 
+    def test_JsonToTransactionCompactChildren(self):
+        transaction = generate_transaction()
+        gen_transaction = json_to_transaction(transaction.to_json(), compact_children=True)
+        gen_json, json_transaction = gen_transaction.to_json(), transaction.to_json()
+        # Multiple links are held in a set, so their order in the JSON is not fixed
+        gen_links, links = gen_json.pop('links'), json_transaction.pop('links')
+        self.assertEqual(gen_json, json_transaction)
+        self.assertEqual(set(gen_links), set(links))
+        for link_type, link_json in links.items():
+            if isinstance(link_json, list):
+                sort_key = lambda link: link.get('linked_transaction_id')
+                self.assertEqual(sorted(gen_links[link_type], key=sort_key), sorted(link_json, key=sort_key))
+            else:
+                self.assertEqual(gen_links[link_type], link_json)
+        for charge in gen_transaction.charges.values():
+            self.assertFalse(hasattr(charge, '__dict__'))
+
 if __name__ == '__main__':
     unittest.main()